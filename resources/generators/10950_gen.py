@@ -0,0 +1,10 @@
+# 10950 A+B - 3 숨은 테스트 생성기: python 10950_gen.py <seed> [T]
+import sys
+import random
+
+seed = int(sys.argv[1])
+count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+rng = random.Random(seed)
+lines = [str(count)]
+lines.extend(f"{rng.randint(1, 9)} {rng.randint(1, 9)}" for _ in range(count))
+sys.stdout.write("\n".join(lines) + "\n")
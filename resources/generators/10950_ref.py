@@ -0,0 +1,7 @@
+# 10950 A+B - 3 정답 코드 (숨은 테스트의 기대 출력 생성용)
+import sys
+
+data = sys.stdin.buffer.read().split()
+count = int(data[0])
+values = list(map(int, data[1:1 + 2 * count]))
+sys.stdout.write("\n".join(str(values[i] + values[i + 1]) for i in range(0, 2 * count, 2)) + "\n")
@@ -0,0 +1,3 @@
+# 1000 A+B 정답 코드 (문제 검증용)
+a, b = map(int, input().split())
+print(a + b)
@@ -0,0 +1,4 @@
+# 2739 구구단 정답 코드 (문제 검증용)
+n = int(input())
+for i in range(1, 10):
+    print(f"{n} * {i} = {n * i}")
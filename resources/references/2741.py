@@ -0,0 +1,5 @@
+# 2741 N 찍기 정답 코드 (문제 검증용)
+import sys
+
+n = int(input())
+sys.stdout.write("\n".join(map(str, range(1, n + 1))) + "\n")
@@ -0,0 +1,11 @@
+# 5000 연도 진행바 정답 코드 (문제 검증용)
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+month, day, year, clock = input().replace(",", "").split()
+year, day = int(year), int(day)
+hour, minute = map(int, clock.split(":"))
+leap = year % 400 == 0 or (year % 4 == 0 and year % 100 != 0)
+days = [31, 29 if leap else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+elapsed = (sum(days[:MONTHS.index(month)]) + day - 1) * 24 * 60 + hour * 60 + minute
+print(elapsed / (sum(days) * 24 * 60) * 100)
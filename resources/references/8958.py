@@ -0,0 +1,10 @@
+# 8958 OX퀴즈 정답 코드 (문제 검증용)
+import sys
+
+lines = sys.stdin.read().split()
+for quiz in lines[1:1 + int(lines[0])]:
+    score = streak = 0
+    for mark in quiz:
+        streak = streak + 1 if mark == "O" else 0
+        score += streak
+    print(score)
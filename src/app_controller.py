@@ -7,7 +7,7 @@ import time
 import psutil
 import os
 from datetime import date
-from utils import load_config, save_config, resource_path
+from utils import load_config, save_config, flush_config, config_write_stats, resource_path, cache_stats, logger
 from ui_settings import SettingsWindow
 from ui_lock_screen import LockScreenApp
 
@@ -87,6 +87,9 @@ class AppController:
         self.root.mainloop()
 
     def exit_app(self, icon, item):
+        flush_config()
+        logger.debug("파일 캐시 적중/실패: %s", cache_stats())
+        logger.debug("설정 저장: %s", config_write_stats())
         self.stop_monitoring.set()
         icon.stop()
         if self.root:
@@ -0,0 +1,226 @@
+# batch_judge.py (제출 디렉터리 일괄 채점 CLI)
+#
+# 사용 예: python batch_judge.py solutions/ --output report.json --csv report.csv
+# 제출 파일은 "<문제 id>.py", "<문제 id>_설명.cpp" 처럼 이름이 문제 id로 시작하거나
+# "<문제 id>/아무이름.c" 처럼 문제 id 이름의 폴더 안에 두면 됩니다. 언어는 확장자로 정합니다.
+# 진행 상황은 --progress 파일(JSONL)에 한 줄씩 남기므로, 중간에 멈춰도 다시 실행하면 이어서 채점합니다.
+import os
+import re
+import sys
+import csv
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import judge_pool
+import languages
+import verdict_cache
+
+_PROBLEM_ID = re.compile(r"^(\d+)")
+_problems = {}
+# 보고서에 남길 케이스별 측정값
+CASE_FIELDS = ("time_ms", "wall_ms", "memory_kb", "spawn_ms", "input_bytes", "output_bytes")
+
+
+def _problem_id_for(rel_path):
+    """제출 경로에서 문제 id를 찾습니다. 폴더 이름이 먼저, 그다음 파일 이름 앞의 숫자를 봅니다."""
+    for part in rel_path.replace(os.sep, "/").split("/"):
+        match = _PROBLEM_ID.match(part)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def discover_submissions(root):
+    """root 아래의 제출 파일을 (상대 경로, 문제 id, 언어) 목록으로 모읍니다."""
+    submissions = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            language = languages.language_for_path(path)
+            rel_path = os.path.relpath(path, root)
+            problem_id = _problem_id_for(rel_path)
+            if language is None or problem_id is None:
+                continue
+            submissions.append({"path": path, "rel_path": rel_path, "problem_id": problem_id, "language": language})
+    return submissions
+
+
+def _source_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _init_worker(problems_path, pool_size):
+    """일괄 채점 프로세스마다 문제 목록을 한 번만 읽습니다."""
+    # 프로세스마다 워커 풀을 띄우므로, 코어를 나눠 쓰도록 풀 크기를 줄입니다.
+    os.environ[judge_pool.POOL_SIZE_ENV] = str(pool_size)
+    from utils import load_problems
+    _problems.update((p["id"], p) for p in load_problems(problems_path))
+
+
+def summarize_verdict(result):
+    """check_solution의 반환값을 (verdict, message)로 바꿉니다. 채점기 자체의 오류는 judge_error입니다."""
+    from utils import is_judge_failure
+    if isinstance(result, str):
+        return ("accepted" if result.startswith("정답") else "wrong_answer"), result
+    message = result.get("stderr") or ""
+    if is_judge_failure(result):
+        return "judge_error", message
+    return result["status"], message
+
+
+def judge_submission(submission, use_cache=False):
+    """제출 하나를 채점합니다. 케이스별 결과는 check_solution의 진행 이벤트로 모읍니다."""
+    from utils import check_solution
+    problem = _problems.get(submission["problem_id"])
+    record = {key: submission[key] for key in ("rel_path", "problem_id", "language", "source_hash")}
+    if problem is None:
+        return {**record, "verdict": "unknown_problem", "message": f"문제 {submission['problem_id']}을(를) 찾을 수 없습니다.",
+                "cases": [], "elapsed_ms": 0}
+    record["problem_fingerprint"] = verdict_cache.problem_fingerprint(problem)
+    with open(submission["path"], "r", encoding="utf-8") as f:
+        user_code = f.read()
+    cases, compile_info = [], {}
+
+    def on_event(event):
+        if event["type"] == "compiled":
+            compile_info.update(compile_ms=event["compile_ms"], compile_cached=event["cached"])
+        elif event["type"] == "summary":
+            compile_info["summary"] = {k: v for k, v in event.items() if k != "type"}
+        elif event["type"] in ("passed", "failed"):
+            cases.append({
+                "case_num": event["case_num"],
+                "status": "passed" if event["type"] == "passed" else event["status"],
+                **{key: event[key] for key in CASE_FIELDS if key in event},
+            })
+
+    start = time.perf_counter()
+    try:
+        result = check_solution(problem, user_code, on_event=on_event, use_cache=use_cache, language=submission["language"])
+        verdict, message = summarize_verdict(result)
+    except Exception as e:
+        verdict, message = "judge_error", str(e)
+    return {**record, "verdict": verdict, "message": message, **compile_info,
+            "cases": sorted(cases, key=lambda case: case["case_num"]),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000)}
+
+
+def load_progress(path):
+    """이전 실행에서 끝난 제출을 {상대 경로: 기록}으로 읽습니다. 중간에 잘린 마지막 줄은 버립니다."""
+    done = {}
+    if not path or not os.path.exists(path):
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done[record["rel_path"]] = record
+    return done
+
+
+def write_csv(path, records):
+    """케이스마다 한 줄씩 씁니다. 케이스를 실행하지 못한 제출(컴파일 에러 등)은 case_num 없이 한 줄을 씁니다."""
+    fields = ["rel_path", "problem_id", "language", "verdict", "case_num", "status", *CASE_FIELDS]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for record in records:
+            for case in record["cases"] or [{}]:
+                writer.writerow({**record, **case})
+
+
+def _can_resume(record, submission, fingerprints):
+    """소스와 문제(테스트 케이스, 제한, 채점 방식)가 모두 그대로이고 채점기 오류가 아니었던 기록만 재사용합니다."""
+    return (submission is not None
+            and record.get("verdict") != "judge_error"
+            and record.get("source_hash") == submission["source_hash"]
+            and record.get("problem_fingerprint") == fingerprints.get(submission["problem_id"]))
+
+
+def run_batch(root, problems_path="problems.json", jobs=None, progress_path=None, use_cache=False):
+    """root의 제출을 프로세스 풀로 채점하고 보고서(dict)를 반환합니다."""
+    submissions = discover_submissions(root)
+    for submission in submissions:
+        submission["source_hash"] = _source_hash(submission["path"])
+    done = load_progress(progress_path)
+    records = {}
+    if done:
+        from utils import load_problems
+        fingerprints = {p["id"]: verdict_cache.problem_fingerprint(p) for p in load_problems(problems_path)}
+        by_path = {s["rel_path"]: s for s in submissions}
+        records = {rel: rec for rel, rec in done.items() if _can_resume(rec, by_path.get(rel), fingerprints)}
+    pending = [s for s in submissions if s["rel_path"] not in records]
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    print(f"[일괄 채점] 제출 {len(submissions)}개 (이어서 채점: {len(records)}개 건너뜀), 프로세스 {jobs}개", file=sys.stderr)
+
+    start = time.perf_counter()
+    progress_f = open(progress_path, "a", encoding="utf-8") if progress_path else None
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(problems_path, 1)) as executor:
+            futures = [executor.submit(judge_submission, submission, use_cache) for submission in pending]
+            for count, future in enumerate(as_completed(futures), 1):
+                record = future.result()
+                records[record["rel_path"]] = record
+                print(f"[{count}/{len(pending)}] {record['rel_path']}: {record['verdict']}", file=sys.stderr)
+                # 채점기 오류는 진행 파일에 남기지 않아 다음 실행에서 다시 채점합니다.
+                if progress_f and record["verdict"] != "judge_error":
+                    progress_f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    progress_f.flush()
+    finally:
+        if progress_f: progress_f.close()
+    elapsed = time.perf_counter() - start
+
+    ordered = [records[s["rel_path"]] for s in submissions]
+    verdicts = {}
+    for record in ordered:
+        verdicts[record["verdict"]] = verdicts.get(record["verdict"], 0) + 1
+    return {
+        "root": os.path.abspath(root),
+        "jobs": jobs,
+        "summary": {
+            "submissions": len(ordered),
+            "judged": len(pending),
+            "resumed": len(ordered) - len(pending),
+            "verdicts": verdicts,
+            "elapsed_s": round(elapsed, 3),
+            "submissions_per_sec": round(len(pending) / elapsed, 2) if pending and elapsed else None,
+        },
+        "submissions": ordered,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NSDP 일괄 채점기 (제출 디렉터리 -> JSON/CSV 보고서)")
+    parser.add_argument("root", help="제출 파일이 있는 디렉터리")
+    parser.add_argument("--problems", default="problems.json", help="문제 파일 (기본: resources/problems.json)")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="동시에 채점할 프로세스 수 (기본: 코어 수)")
+    parser.add_argument("--output", "-o", help="JSON 보고서 경로 (기본: 표준 출력)")
+    parser.add_argument("--csv", help="케이스별 CSV 보고서 경로")
+    parser.add_argument("--progress", help="이어서 채점하기 위한 진행 파일 (기본: <output>.progress.jsonl)")
+    parser.add_argument("--use-cache", action="store_true", help="채점 결과 캐시를 사용 (기본: 항상 새로 실행)")
+    parser.add_argument("--fail-on-reject", action="store_true", help="정답이 아닌 제출이 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    progress_path = args.progress or (args.output + ".progress.jsonl" if args.output else None)
+    report = run_batch(args.root, args.problems, args.jobs, progress_path, args.use_cache)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.csv:
+        write_csv(args.csv, report["submissions"])
+    summary = report["summary"]
+    print(f"[일괄 채점] 완료: {summary['verdicts']} ({summary['elapsed_s']}초)", file=sys.stderr)
+    if args.fail_on_reject and any(r["verdict"] != "accepted" for r in report["submissions"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# checkers.py (문제별 출력 비교기)
+import os
+import re
+import math
+import itertools
+import contextlib
+from collections import Counter
+import judge_io
+from judge_workspace import JudgeWorkspace
+
+# problems.json에 checker가 없을 때 쓰는 비교 방식 (공백 단위 토큰 비교)
+DEFAULT_CHECKER = "token"
+DEFAULT_EPS = 1e-9
+SPECIAL_TIME_LIMIT = 10
+SPECIAL_MEMORY_LIMIT = 512
+
+_TOKEN = re.compile(rb"\S+")
+
+
+class CheckerError(Exception):
+    """special checker가 컴파일되지 않거나 비정상 종료해서 판정할 수 없을 때 발생합니다. (제출 코드의 오답이 아닙니다)"""
+
+
+def _short(token, limit=40):
+    text = bytes(token).decode("utf-8", errors="replace")
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def compare_exact(actual, expected, options):
+    """앞뒤 공백만 무시하고 바이트 단위로 같은지 비교합니다. (예전 채점 방식)"""
+    a_start, a_end = judge_io.trimmed_span(actual)
+    e_start, e_end = judge_io.trimmed_span(expected)
+    if a_end - a_start != e_end - e_start:
+        return False, "출력 길이가 다릅니다."
+    for offset in range(0, a_end - a_start, judge_io.CHUNK_SIZE):
+        size = min(judge_io.CHUNK_SIZE, a_end - a_start - offset)
+        if actual[a_start + offset:a_start + offset + size] != expected[e_start + offset:e_start + offset + size]:
+            return False, "출력 내용이 다릅니다."
+    return True, None
+
+
+def _compare_tokens(actual, expected, same):
+    """두 버퍼를 공백 기준 토큰으로 나눠 앞에서부터 비교합니다.
+
+    finditer는 필요한 만큼만 토큰을 만들기 때문에 mmap된 큰 출력에서도 선형 시간이며,
+    첫 불일치에서 바로 멈춥니다.
+    """
+    pairs = itertools.zip_longest(_TOKEN.finditer(actual), _TOKEN.finditer(expected))
+    for index, (a, e) in enumerate(pairs, 1):
+        if a is None:
+            return False, f"출력이 너무 짧습니다. ({index}번째 토큰 {_short(e.group())} 이(가) 없음)"
+        if e is None:
+            return False, f"출력이 너무 깁니다. ({index}번째 토큰 {_short(a.group())} 이(가) 더 있음)"
+        if not same(a.group(), e.group()):
+            return False, f"{index}번째 토큰이 다릅니다. (기대 {_short(e.group())}, 실제 {_short(a.group())})"
+    return True, None
+
+
+def compare_tokens(actual, expected, options):
+    """공백/줄바꿈 차이는 무시하고 토큰이 모두 같은지 비교합니다."""
+    return _compare_tokens(actual, expected, lambda a, e: a == e)
+
+
+def compare_float(actual, expected, options):
+    """실수 토큰은 절대/상대 오차 안이면 같다고 봅니다. 나머지 토큰은 그대로 비교합니다."""
+    abs_eps = options.get("abs_eps", options.get("eps", DEFAULT_EPS))
+    rel_eps = options.get("rel_eps", options.get("eps", DEFAULT_EPS))
+
+    def same(a, e):
+        if a == e:
+            return True
+        try:
+            a_value, e_value = float(a), float(e)
+        except ValueError:
+            return False
+        if math.isnan(a_value) or math.isnan(e_value) or math.isinf(a_value) or math.isinf(e_value):
+            return False
+        diff = abs(a_value - e_value)
+        return diff <= abs_eps or diff <= rel_eps * abs(e_value)
+
+    return _compare_tokens(actual, expected, same)
+
+
+def _lines(buf):
+    lines = [line.rstrip() for line in bytes(buf).split(b"\n")]
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def compare_unordered_lines(actual, expected, options):
+    """줄 순서와 줄 끝 공백은 무시하고 같은 줄들이 같은 개수만큼 있는지 비교합니다."""
+    actual_lines, expected_lines = Counter(_lines(actual)), Counter(_lines(expected))
+    if actual_lines == expected_lines:
+        return True, None
+    missing = expected_lines - actual_lines
+    if missing:
+        return False, f"기대한 줄 {_short(next(iter(missing)))} 이(가) 없습니다."
+    return False, f"기대하지 않은 줄 {_short(next(iter(actual_lines - expected_lines)))} 이(가) 있습니다."
+
+
+COMPARATORS = {
+    "exact": compare_exact,
+    "token": compare_tokens,
+    "float": compare_float,
+    "unordered_lines": compare_unordered_lines,
+}
+
+
+def parse_checker_spec(problem):
+    """problem["checker"]를 (종류, 옵션)으로 바꿉니다. 문자열 하나만 써도 됩니다."""
+    spec = problem.get("checker", DEFAULT_CHECKER)
+    if isinstance(spec, str):
+        spec = {"type": spec}
+    kind = spec.get("type", DEFAULT_CHECKER)
+    if kind not in COMPARATORS and kind != "special":
+        raise ValueError(f"알 수 없는 checker 종류입니다: {kind}")
+    return kind, spec
+
+
+class OutputChecker:
+    """문제 하나의 출력 비교기입니다. check_solution이 제출마다 하나 만들어 씁니다.
+
+    special checker는 문제에 지정된 스크립트를 제출 코드와 같은 샌드박스(run)에서
+    `checker.py <입력 파일> <제출 출력 파일> <기대 출력 파일>` 형태로 실행하며,
+    종료 코드 0이면 정답, 1이면 오답(stdout이 이유), 그 밖에는 채점기 오류(CheckerError)로 봅니다.
+    """
+
+    def __init__(self, problem, run=None):
+        self.kind, self.options = parse_checker_spec(problem)
+        self._run = run
+        self._workspace = None
+        if self.kind == "special":
+            with open(judge_io.testcase_path(self.options["script"]), "r", encoding="utf-8") as f:
+                self._workspace = JudgeWorkspace(f.read())
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _buffer(text, path):
+        if path is not None:
+            with judge_io.open_mapped(path) as mm:
+                yield mm
+        else:
+            yield text.encode("utf-8")
+
+    def check(self, case, result, workspace, case_num):
+        """성공적으로 끝난 실행 결과를 기대 출력과 비교해 (정답 여부, 이유)를 반환합니다."""
+        expected_path = judge_io.testcase_path(case["output_file"]) if "output_file" in case else None
+        if self.kind == "special":
+            return self._check_special(case, result, workspace, case_num, expected_path)
+        compare = COMPARATORS[self.kind]
+        with self._buffer(result.get("output"), result.get("output_path")) as actual, \
+                self._buffer(case.get("output"), expected_path) as expected:
+            return compare(actual, expected, self.options)
+
+    def _materialize(self, workspace, name, text, path):
+        """special checker에 넘길 수 있도록 인라인 데이터를 작업 공간의 파일로 씁니다."""
+        if path is not None:
+            return path
+        path = os.path.join(workspace.path, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def _check_special(self, case, result, workspace, case_num, expected_path):
+        _, input_path = judge_io.case_input(case)
+        argv = [
+            self._materialize(workspace, f"case_{case_num}.in", case.get("input", ""), input_path),
+            self._materialize(workspace, f"case_{case_num}.actual", result.get("output", ""), result.get("output_path")),
+            self._materialize(workspace, f"case_{case_num}.expected", case.get("output", ""), expected_path),
+        ]
+        if self._workspace.compile_error:
+            raise CheckerError(f"채점기 컴파일 오류: {self._workspace.compile_error}")
+        verdict = self._run(self._workspace, "", SPECIAL_TIME_LIMIT, SPECIAL_MEMORY_LIMIT, argv=argv)
+        if verdict["status"] == "success" and verdict.get("exit_code") == 0:
+            return True, None
+        if verdict["status"] == "success" and verdict.get("exit_code") == 1:
+            return False, verdict.get("output") or None
+        detail = verdict.get("stderr") or (f"종료 코드 {verdict.get('exit_code')}" if verdict["status"] == "success" else verdict["status"])
+        raise CheckerError(f"채점기 오류: {detail}")
+
+    def close(self):
+        if self._workspace is not None:
+            self._workspace.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
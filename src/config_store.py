@@ -0,0 +1,177 @@
+# config_store.py (config.json 지연 저장)
+#
+# 잠금 화면은 제출/새로고침/포기/정답마다 설정을 저장합니다. 매번 UI 스레드에서 파일 전체를 다시 쓰는 대신,
+# 저장 요청은 사본만 맡겨 두고 백그라운드 스레드가 잠깐(WRITE_DELAY초) 모았다가 마지막 내용만 씁니다.
+# 쓰기는 임시 파일에 쓰고 fsync한 뒤 os.replace로 바꾸므로, 도중에 꺼져도 config.json이 깨지지 않습니다.
+# 프로그램을 끝낼 때는 flush()로 남은 내용을 바로 씁니다. (atexit에도 등록되어 있습니다)
+import os
+import copy
+import json
+import time
+import atexit
+import threading
+
+WRITE_DELAY = 0.5
+
+
+def write_json_atomic(path, data):
+    """임시 파일에 쓰고 디스크에 내린 뒤 교체합니다. 읽는 쪽은 이전 파일이나 새 파일 중 하나만 봅니다."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    # 이름 바꾸기도 디스크에 남도록 디렉터리를 fsync합니다. (Windows에서는 디렉터리를 열 수 없어 건너뜁니다)
+    try:
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class ConfigStore:
+    """파일 하나의 저장을 모아서 쓰는 저장소입니다.
+
+    save(data)는 사본을 맡기고 바로 돌아옵니다. 쓰기 전에 다시 save하면 앞의 내용은 버리고 마지막 것만 씁니다.
+    on_written(path, data)는 파일을 쓴 직후 백그라운드 스레드에서 불립니다.
+    맡긴 내용은 파일 쓰기와 on_written이 끝날 때까지 pending()에 남아 있어, 그 사이에 읽어도 옛 파일을 보지 않습니다.
+    """
+
+    def __init__(self, path, delay=WRITE_DELAY, on_written=None):
+        self.path = path
+        self.delay = delay
+        self.on_written = on_written
+        self._pending = None   # 아직 파일에 반영되지 않은 마지막 내용 (쓰는 중인 것 포함)
+        self._due = None       # 아직 쓰기 시작하지 않은 내용을 쓸 시각. 쓰기 시작하면 None
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()   # 백그라운드 쓰기와 flush가 겹치지 않게 합니다.
+        self._thread = None
+        self._stats = {"saves": 0, "writes": 0, "coalesced": 0, "errors": 0,
+                       "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+
+    def save(self, data):
+        snapshot = copy.deepcopy(data)
+        with self._cond:
+            self._stats["saves"] += 1
+            if self._due is not None:
+                self._stats["coalesced"] += 1
+            else:
+                self._due = time.monotonic() + self.delay
+            self._pending = snapshot
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="config-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self):
+        """아직 쓰지 않은 내용입니다. (없으면 None) 읽는 쪽이 방금 저장한 내용을 보도록 load에서 씁니다."""
+        with self._cond:
+            return self._pending
+
+    def _take(self):
+        """쓸 내용을 가져옵니다. pending()에는 그대로 남겨 두고, 쓰기 시작하지 않은 내용이 없으면 None."""
+        with self._cond:
+            if self._due is None:
+                return None
+            self._due = None
+            return self._pending
+
+    def _done(self, data):
+        """data를 다 썼습니다. 그 사이에 새로 맡긴 내용이 없을 때만 pending을 비웁니다."""
+        with self._cond:
+            if self._pending is data:
+                self._pending = None
+
+    def _write(self, data):
+        start = time.perf_counter()
+        write_json_atomic(self.path, data)
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._cond:
+            stats = self._stats
+            stats["writes"] += 1
+            stats["total_ms"] += elapsed
+            stats["last_ms"] = elapsed
+            stats["max_ms"] = max(stats["max_ms"], elapsed)
+        if self.on_written:
+            self.on_written(self.path, data)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._due is None:
+                    self._cond.wait()
+                wait = self._due - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+            with self._write_lock:
+                data = self._take()
+                if data is None:   # flush가 먼저 썼습니다.
+                    continue
+                try:
+                    self._write(data)
+                except Exception as e:
+                    # 설정은 항상 파일 전체를 쓰므로, 다음 저장이 성공하면 그대로 복구됩니다.
+                    with self._cond:
+                        self._stats["errors"] += 1
+                    print(f"설정 저장 중 오류 발생: {e}")
+                finally:
+                    self._done(data)
+
+    def flush(self):
+        """남은 내용을 호출한 스레드에서 바로 씁니다. 쓰기 오류는 그대로 올려 보냅니다."""
+        with self._write_lock:
+            data = self._take()
+            if data is not None:
+                try:
+                    self._write(data)
+                except Exception:
+                    with self._cond:
+                        self._stats["errors"] += 1
+                    raise
+                finally:
+                    self._done(data)
+
+    def stats(self):
+        """저장 요청/실제 쓰기/합쳐진 요청 수와 쓰기 시간(ms)입니다."""
+        with self._cond:
+            stats = dict(self._stats)
+        stats["avg_ms"] = stats["total_ms"] / stats["writes"] if stats["writes"] else 0.0
+        return {key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()}
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path, **options):
+    """경로별 저장소를 하나만 만들어 씁니다."""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = ConfigStore(path, **options)
+        return store
+
+
+def flush_all():
+    for store in list(_stores.values()):
+        try:
+            store.flush()
+        except Exception as e:
+            print(f"설정 저장 중 오류 발생: {e}")
+
+
+atexit.register(flush_all)
@@ -0,0 +1,68 @@
+# file_cache.py (파일 내용 캐시)
+#
+# config.json이나 problems.json처럼 자주 다시 읽는 파일을, 파싱한 결과를 기억해 두었다가
+# 파일의 수정 시각/크기가 바뀌었을 때만 다시 읽습니다. 확인에는 os.stat 한 번이면 됩니다.
+import os
+import threading
+
+
+def signature(path):
+    """파일이 바뀌었는지 판단하는 (수정 시각 ns, 크기)입니다. 파일이 없으면 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class FileCache:
+    """경로별로 (서명, 값)을 기억하는 캐시입니다. 여러 스레드에서 써도 됩니다."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def _count(self, path, kind):
+        stats = self._stats.setdefault(os.path.basename(path), {"hits": 0, "misses": 0})
+        stats[kind] += 1
+
+    def get(self, path, loader):
+        """path의 값을 반환합니다. 처음이거나 파일이 바뀌었으면 loader(path)로 다시 읽습니다.
+
+        loader가 예외를 내면 캐시하지 않고 그대로 올려 보냅니다.
+        """
+        sig = signature(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and sig is not None and entry[0] == sig:
+                self._count(path, "hits")
+                return entry[1]
+            self._count(path, "misses")
+        value = loader(path)
+        # 읽는 도중 파일이 바뀌었을 수 있으므로, 읽기 전에 본 서명으로 저장해 다음 호출에서 다시 확인하게 합니다.
+        if sig is not None:
+            with self._lock:
+                self._entries[path] = (sig, value)
+        return value
+
+    def put(self, path, value):
+        """방금 path에 value를 저장했을 때 호출합니다. 다음 get이 파일을 다시 읽지 않습니다."""
+        sig = signature(path)
+        with self._lock:
+            if sig is None:
+                self._entries.pop(path, None)
+            else:
+                self._entries[path] = (sig, value)
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def stats(self):
+        """파일 이름별 {"hits", "misses"}입니다. hits만큼 파일을 다시 열고 파싱하는 일을 줄였습니다."""
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._stats.items()}
@@ -0,0 +1,245 @@
+# history_log.py (풀이 기록 이벤트 로그)
+#
+# 풀이 기록(solve_history, incorrect_history)을 config.json 대신 추가 전용 로그에 남깁니다.
+#   resources/history.log            한 줄에 이벤트 하나 (JSON Lines, 뒤에 붙이기만 함)
+#   resources/history.snapshot.json  압축(compact)한 시점까지의 집계
+# 이벤트는 solve / wrong / give_up / refresh 이고, 이벤트마다 푼 문제 집합, 최근 N개 창, 별점별 개수 같은
+# 집계를 O(1)로 갱신하므로 기록이 길어져도 다시 훑을 일이 없습니다.
+# 로그가 COMPACT_EVERY개를 넘으면 스냅샷을 쓰고 로그를 비웁니다.
+#
+# 사용 예:
+#   python history_log.py stats      집계 출력
+#   python history_log.py compact    지금 바로 압축
+import os
+import sys
+import json
+import time
+from collections import Counter, deque
+from config_store import write_json_atomic
+
+EVENTS = ("solve", "wrong", "give_up", "refresh")
+COMPACT_EVERY = 500
+RECENT_WINDOW = 10   # calculate_user_level의 max_history와 같습니다.
+SNAPSHOT_VERSION = 1
+
+
+class HistoryAggregates:
+    """이벤트를 하나씩 반영하는 집계입니다. apply는 모두 O(1)입니다.
+
+    solve_history는 예전 config의 solve_history와 같은 모양([{"id", "stars"}], 처음 푼 순서)이라
+    추천기(sync_history)에 그대로 넘길 수 있고, 레벨은 level()로 바로 얻습니다. (RecommendationIndex의 level)
+
+    같은 문제를 다시 풀면 처음 한 번만 기록합니다. 잠금 화면이 예전에도 solve_history에 중복을 넣지 않았으므로
+    같은 값이지만, 예전 config의 solve_history에 중복이 있었다면 옮길 때 합쳐져 레벨 계산에 한 번만 들어갑니다.
+    """
+
+    def __init__(self, recent_window=RECENT_WINDOW):
+        self.solve_history = []
+        self.solved_ids = set()
+        self.incorrect_ids = set()
+        self.star_counts = Counter()     # 푼 문제의 별점별 개수
+        self.event_counts = Counter()
+        self.recent = deque(maxlen=recent_window)   # 최근에 새로 푼 문제들의 별점
+        self._recent_sum = 0
+        self.last_event_at = None
+
+    def apply(self, event, problem_id, stars=1, t=None):
+        self.event_counts[event] += 1
+        if t is not None:
+            self.last_event_at = t
+        if event == "solve":
+            self.incorrect_ids.discard(problem_id)
+            if problem_id not in self.solved_ids:
+                self.solved_ids.add(problem_id)
+                self.solve_history.append({"id": problem_id, "stars": stars})
+                self.star_counts[stars] += 1
+                if len(self.recent) == self.recent.maxlen:
+                    self._recent_sum -= self.recent[0]
+                self.recent.append(stars)
+                self._recent_sum += stars
+        elif event == "wrong":
+            self.incorrect_ids.add(problem_id)
+
+    def level(self):
+        """calculate_user_level과 같은 값(최근에 푼 문제들의 평균 별점)을 O(1)로 계산합니다."""
+        if not self.recent:
+            return 1
+        return round(self._recent_sum / len(self.recent))
+
+    def to_dict(self):
+        return {"solved": [[item["id"], item["stars"]] for item in self.solve_history],
+                "incorrect": sorted(self.incorrect_ids),
+                "event_counts": dict(self.event_counts),
+                "last_event_at": self.last_event_at}
+
+    @classmethod
+    def from_dict(cls, data, recent_window=RECENT_WINDOW):
+        aggregates = cls(recent_window)
+        for problem_id, stars in data.get("solved", []):
+            aggregates.apply("solve", problem_id, stars)
+        aggregates.incorrect_ids = set(data.get("incorrect", []))
+        aggregates.event_counts = Counter(data.get("event_counts", {}))
+        aggregates.last_event_at = data.get("last_event_at")
+        return aggregates
+
+
+class HistoryLog:
+    """이벤트 로그와 스냅샷을 관리합니다.
+
+    이벤트마다 순번(seq)을 붙입니다. 압축은 스냅샷(마지막 seq 포함)을 먼저 쓰고 로그를 비우므로,
+    그 사이에 꺼지더라도 다음에 열 때 스냅샷에 이미 들어간 이벤트는 건너뜁니다.
+    """
+
+    def __init__(self, log_path, snapshot_path=None, compact_every=COMPACT_EVERY):
+        self.log_path = log_path
+        self.snapshot_path = snapshot_path or os.path.join(os.path.dirname(log_path), "history.snapshot.json")
+        self.compact_every = compact_every
+        self.aggregates = HistoryAggregates()
+        self.seq = 0
+        self.log_events = 0   # 마지막 압축 이후 로그에 쌓인 이벤트 수
+        self._load()
+
+    # 예전 코드와 같은 이름으로 집계를 바로 쓸 수 있게 합니다.
+    @property
+    def solve_history(self):
+        return self.aggregates.solve_history
+
+    @property
+    def solved_ids(self):
+        return self.aggregates.solved_ids
+
+    @property
+    def incorrect_ids(self):
+        return self.aggregates.incorrect_ids
+
+    def exists(self):
+        return os.path.exists(self.snapshot_path) or os.path.exists(self.log_path)
+
+    def _load(self):
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self.aggregates = HistoryAggregates.from_dict(snapshot)
+            self.seq = snapshot.get("seq", 0)
+        if not os.path.exists(self.log_path):
+            return
+        self._end_partial_line()
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 쓰는 도중 꺼져 마지막 줄이 잘렸을 수 있습니다. 그 줄만 버립니다.
+                    print(f"[기록] {self.log_path}:{line_no} 줄을 읽을 수 없어 건너뜁니다.")
+                    continue
+                self.log_events += 1
+                if entry["seq"] <= self.seq:
+                    continue
+                self.seq = entry["seq"]
+                self.aggregates.apply(entry["e"], entry["id"], entry.get("stars", 1), entry.get("t"))
+
+    def _end_partial_line(self):
+        """마지막 줄이 잘려 있으면 줄을 끝내 둡니다. 그러지 않으면 다음 이벤트가 잘린 줄 뒤에 붙어 함께 버려집니다."""
+        with open(self.log_path, "rb+") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    def record(self, event, problem_id, stars=1, t=None):
+        """이벤트를 로그 끝에 붙이고 집계에 반영합니다."""
+        if event not in EVENTS:
+            raise ValueError(f"알 수 없는 기록 이벤트입니다: {event}")
+        t = round(time.time()) if t is None else t
+        self.seq += 1
+        entry = {"seq": self.seq, "t": t, "e": event, "id": problem_id, "stars": stars}
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.aggregates.apply(event, problem_id, stars, t)
+        self.log_events += 1
+        if self.log_events >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """지금까지의 집계를 스냅샷으로 쓰고 로그를 비웁니다."""
+        snapshot = {"version": SNAPSHOT_VERSION, "seq": self.seq, **self.aggregates.to_dict()}
+        write_json_atomic(self.snapshot_path, snapshot)
+        with open(self.log_path, "w", encoding="utf-8"):
+            pass
+        self.log_events = 0
+
+    def stats(self):
+        aggregates = self.aggregates
+        return {"solved": len(aggregates.solved_ids), "incorrect": len(aggregates.incorrect_ids),
+                "level": aggregates.level(), "star_counts": dict(sorted(aggregates.star_counts.items())),
+                "event_counts": dict(aggregates.event_counts), "log_events": self.log_events, "seq": self.seq}
+
+    # --- 예전 config 형식에서 옮기기 ---
+    def migrate(self, solve_history, incorrect_history):
+        """config의 solve_history / incorrect_history 중 기록에 아직 없는 것을 합쳐 스냅샷으로 저장합니다.
+
+        예전 기록에는 시각이 없으므로 t 없이, 아직 못 푼 문제의 오답을 먼저 넣고 풀이를 순서대로 넣습니다.
+        (rating.replay와 같은 순서) 이미 로그가 있어도 빠진 기록만 더하므로 여러 번 불러도 됩니다.
+        스냅샷을 쓰지 못하면 예외를 그대로 올려 보냅니다. 합친 이벤트 수를 반환합니다.
+        """
+        legacy_solved = {item["id"] for item in solve_history}
+        merged = 0
+        for problem_id in incorrect_history:
+            if problem_id not in legacy_solved and problem_id not in self.solved_ids and problem_id not in self.incorrect_ids:
+                self.seq += 1
+                self.aggregates.apply("wrong", problem_id)
+                merged += 1
+        for item in solve_history:
+            if item["id"] not in self.solved_ids:
+                self.seq += 1
+                self.aggregates.apply("solve", item["id"], item.get("stars", 1))
+                merged += 1
+        if merged or not self.exists():
+            self.compact()
+        return merged
+
+    @classmethod
+    def from_config(cls, config, log_path=None):
+        """기록을 엽니다. config에 예전 기록이 남아 있으면 먼저 기록에 합칩니다.
+
+        합친 내용을 스냅샷으로 쓴 뒤에만 config에서 solve_history / incorrect_history를 지웁니다. (저장은 호출한 쪽에서)
+        스냅샷을 쓰지 못하면 config는 그대로 두고, 다음에 열 때 다시 합칩니다.
+        """
+        if log_path is None:
+            from utils import resource_path
+            log_path = resource_path("history.log")
+        history = cls(log_path)
+        if "solve_history" in config or "incorrect_history" in config or not history.exists():
+            try:
+                history.migrate(config.get("solve_history", []), config.get("incorrect_history", []))
+            except OSError as e:
+                print(f"[기록] 예전 풀이 기록을 옮기지 못했습니다. 다음에 다시 시도합니다: {e}")
+                return history
+        config.pop("solve_history", None)
+        config.pop("incorrect_history", None)
+        return history
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ("stats", "compact"):
+        print("사용법: python history_log.py stats|compact")
+        sys.exit(2)
+    from utils import load_config, save_config, flush_config
+    config = load_config()
+    had_legacy = "solve_history" in config or "incorrect_history" in config
+    history = HistoryLog.from_config(config)
+    if had_legacy:
+        save_config(config)
+        flush_config()
+        print("config.json의 풀이 기록을 history.log로 옮겼습니다.")
+    if argv[0] == "compact":
+        history.compact()
+    print(json.dumps(history.stats(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# judge_async.py (UI를 막지 않는 비동기 채점 API)
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from utils import check_solution
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nsdp-judge")
+atexit.register(_executor.shutdown, wait=False, cancel_futures=True)
+
+
+class JudgeJob:
+    """진행 중인 채점 하나를 나타냅니다.
+
+    future는 concurrent.futures.Future이며 결과는 check_solution의 반환값과 같습니다.
+    asyncio 코드에서는 asyncio.wrap_future(job.future)로 await 할 수 있습니다.
+    """
+
+    def __init__(self, future, cancel_event):
+        self.future = future
+        self._cancel_event = cancel_event
+
+    def cancel(self):
+        """아직 시작 전이면 취소하고, 실행 중이면 돌고 있는 케이스를 멈춥니다."""
+        self._cancel_event.set()
+        self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+    def add_done_callback(self, callback):
+        """채점이 끝나면 callback(job)을 호출합니다. (채점 스레드에서 호출되므로 UI 갱신은 root.after로 넘기세요)"""
+        self.future.add_done_callback(lambda _: callback(self))
+
+
+def submit_solution(problem, user_code, on_event=None, parallel=1, language="python"):
+    """채점을 백그라운드에서 시작하고 곧바로 JudgeJob을 반환합니다.
+
+    on_event(event)는 채점 스레드에서 호출됩니다. 컴파일이 끝나면
+    {"type": "compiled", "compile_ms": ms, "cached": bool, "ok": bool, ...}가 한 번 오고,
+    이어서 케이스마다 {"type": "started" | "passed" | "failed", "case_num": n, ...}가 옵니다.
+    passed/failed에는 time_ms, memory_kb 등 측정값이, failed에는 status가 함께 들어 있습니다.
+    """
+    cancel_event = threading.Event()
+    future = _executor.submit(check_solution, problem, user_code, parallel, on_event, cancel_event, language=language)
+    return JudgeJob(future, cancel_event)
@@ -0,0 +1,191 @@
+# judge_benchmark.py (채점기 성능/정확도 벤치마크)
+#
+# 사용 예: python judge_benchmark.py --backend pool subprocess --repeat 10 --output bench.json
+# 화면 없이(헤드리스) 실행되며, 결과는 채점 백엔드끼리 비교할 수 있도록 JSON으로 출력합니다.
+import sys
+import json
+import time
+import math
+import argparse
+import platform
+import multiprocessing
+import judge_pool
+from judge_workspace import JudgeWorkspace
+from utils import judge_single_case
+
+TIME_LIMIT = 1
+MEMORY_LIMIT_MB = 64
+LIMIT_STATUSES = {"tle": "timeout", "mle": "memory_limit_exceeded"}
+# 메모리 제한 판정은 경계 근처에서 확인합니다. (제한보다 이만큼 적게/많게 쓰는 프로그램)
+MEMORY_PROBE_MARGIN_MB = 4
+
+_BUSY = """import time
+end = time.process_time() + {seconds}
+while time.process_time() < end:
+    pass
+"""
+# 인터프리터가 이미 쓰고 있는 메모리(백엔드마다 8~12MB)를 빼고 채워서, 프로세스 전체 사용량이 target_mb가 되게 합니다.
+_MEMORY = """import time, psutil
+used = psutil.Process().memory_info().rss
+data = b"x" * max(0, {target_mb} * 1024 * 1024 - used)
+time.sleep(0.1)
+"""
+
+# 벤치마크용 합성 제출 목록입니다.
+# expected는 올바른 채점기가 내려야 할 판정이고, probe는 제한 판정 정확도(tle/mle) 집계에 쓰입니다.
+CATALOG = [
+    {"name": "noop", "code": "pass", "expected": "success"},
+    {"name": "echo", "code": "print(input())", "input": "hello", "expected": "success"},
+    {"name": "busy_below_tl", "code": _BUSY.format(seconds=TIME_LIMIT * 0.7), "expected": "success", "probe": "tle"},
+    {"name": "busy_above_tl", "code": _BUSY.format(seconds=TIME_LIMIT * 1.5), "expected": "timeout", "probe": "tle"},
+    {"name": "memory_below_ml", "code": _MEMORY.format(target_mb=MEMORY_LIMIT_MB - MEMORY_PROBE_MARGIN_MB),
+     "expected": "success", "probe": "mle"},
+    {"name": "memory_above_ml", "code": _MEMORY.format(target_mb=MEMORY_LIMIT_MB + MEMORY_PROBE_MARGIN_MB),
+     "expected": "memory_limit_exceeded", "probe": "mle"},
+    {"name": "heavy_stdout", "code": "import sys\nsys.stdout.write('0123456789\\n' * 500000)", "expected": "success"},
+    {"name": "crash", "code": "raise ValueError('boom')", "expected": "error"},
+]
+
+
+def _make_runner(backend):
+    """(workspace, input_data) -> 실행 결과 함수를 만듭니다."""
+    if backend == "subprocess":
+        return lambda workspace, input_data: judge_single_case(None, input_data, TIME_LIMIT, MEMORY_LIMIT_MB,
+                                                               workspace=workspace)
+    pool = judge_pool.get_default_pool()
+    if pool is None:
+        raise RuntimeError("이 환경에서는 워커 풀을 사용할 수 없습니다. (fork 미지원 또는 NSDP_JUDGE_POOL=0)")
+    return lambda workspace, input_data: pool.run(workspace, input_data, TIME_LIMIT, MEMORY_LIMIT_MB)
+
+
+def percentile(values, p):
+    """nearest-rank 방식의 백분위수입니다."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def _latency_summary(latencies):
+    return {
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2),
+        "max_ms": round(max(latencies), 2),
+    }
+
+
+def run_program(run, program, repeat):
+    """카탈로그 항목 하나를 repeat번 실행하고 지연 시간과 판정 분포를 모읍니다."""
+    latencies, overheads, statuses = [], [], {}
+    with JudgeWorkspace(program["code"]) as workspace:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = run(workspace, program.get("input", ""))
+            latency_ms = (time.perf_counter() - start) * 1000
+            latencies.append(latency_ms)
+            # 프로그램 자신의 벽시계 시간을 뺀 나머지가 채점기가 케이스마다 더하는 비용입니다.
+            if "wall_ms" in result:
+                overheads.append(max(0.0, latency_ms - result["wall_ms"]))
+            statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+    return {
+        "name": program["name"],
+        "expected": program["expected"],
+        "runs": repeat,
+        "statuses": statuses,
+        "correct": statuses.get(program["expected"], 0),
+        "latency": _latency_summary(latencies),
+        "overhead_ms": round(percentile(overheads, 50), 2) if overheads else None,
+        "_latencies": latencies,
+    }
+
+
+def limit_accuracy(programs, probe):
+    """제한 판정 정확도입니다.
+
+    false_accept는 제한을 넘는 프로그램이 통과한 비율, false_reject는 제한 안의 프로그램이
+    해당 제한 초과로 판정된 비율입니다.
+    """
+    status = LIMIT_STATUSES[probe]
+    accept_runs = accept_errors = reject_runs = reject_errors = 0
+    for program in programs:
+        if program.get("probe") != probe:
+            continue
+        if program["expected"] == status:
+            accept_runs += program["runs"]
+            accept_errors += program["runs"] - program["statuses"].get(status, 0)
+        else:
+            reject_runs += program["runs"]
+            reject_errors += program["statuses"].get(status, 0)
+    return {
+        "false_accept_rate": round(accept_errors / accept_runs, 3) if accept_runs else None,
+        "false_reject_rate": round(reject_errors / reject_runs, 3) if reject_runs else None,
+    }
+
+
+def run_benchmark(backend, repeat=5, only=None):
+    """백엔드 하나로 카탈로그 전체를 실행하고 JSON으로 저장할 수 있는 결과를 반환합니다."""
+    run = _make_runner(backend)
+    catalog = [p for p in CATALOG if not only or p["name"] in only]
+    started = time.perf_counter()
+    programs = [dict(run_program(run, program, repeat), probe=program.get("probe")) for program in catalog]
+    elapsed = time.perf_counter() - started
+    all_latencies = [ms for program in programs for ms in program.pop("_latencies")]
+    noop = next((p for p in programs if p["name"] == "noop"), None)
+    total_runs = sum(p["runs"] for p in programs)
+    return {
+        "backend": backend,
+        "repeat": repeat,
+        "time_limit": TIME_LIMIT,
+        "memory_limit_mb": MEMORY_LIMIT_MB,
+        "total_runs": total_runs,
+        "elapsed_s": round(elapsed, 3),
+        "cases_per_sec": round(total_runs / elapsed, 2) if elapsed else None,
+        # 빈 프로그램 한 케이스의 전체 지연 시간이 채점기의 순수 오버헤드입니다.
+        "per_case_overhead_ms": noop["latency"]["p50_ms"] if noop else None,
+        "latency": _latency_summary(all_latencies) if all_latencies else None,
+        "accuracy": {
+            "verdict_accuracy": round(sum(p["correct"] for p in programs) / total_runs, 3) if total_runs else None,
+            "tle": limit_accuracy(programs, "tle"),
+            "mle": limit_accuracy(programs, "mle"),
+        },
+        "programs": programs,
+    }
+
+
+def default_backends():
+    return ["pool", "subprocess"] if judge_pool.is_supported() else ["subprocess"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NSDP 채점기 벤치마크 (케이스당 오버헤드, 처리량, 제한 판정 정확도)")
+    parser.add_argument("--backend", nargs="+", choices=["pool", "subprocess"], default=None,
+                        help="측정할 채점 백엔드 (기본: 사용 가능한 전부)")
+    parser.add_argument("--repeat", type=int, default=5, help="프로그램마다 반복 실행 횟수")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="이 이름의 프로그램만 실행")
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": multiprocessing.cpu_count(),
+        "results": [],
+    }
+    for backend in args.backend or default_backends():
+        print(f"[벤치마크] {backend} 백엔드 측정 중...", file=sys.stderr)
+        result = run_benchmark(backend, args.repeat, args.only)
+        print(f"[벤치마크] {backend}: 오버헤드 {result['per_case_overhead_ms']}ms, "
+              f"{result['cases_per_sec']} cases/s, 판정 정확도 {result['accuracy']['verdict_accuracy']}", file=sys.stderr)
+        report["results"].append(result)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# judge_io.py (파일 기반 테스트 케이스 입출력)
+import os
+import mmap
+import contextlib
+
+CHUNK_SIZE = 1 << 16
+PREVIEW_CHARS = 200
+_WHITESPACE = b" \t\r\n\x0b\x0c"
+
+
+def testcase_path(relative_path):
+    """problems.json의 input_file/output_file 경로를 실제 경로로 바꿉니다. (resources 폴더 기준)"""
+    if os.path.isabs(relative_path):
+        return relative_path
+    from utils import resource_path  # utils가 이 모듈을 import 하므로 순환을 피해 여기서 가져옵니다.
+    return resource_path(relative_path)
+
+
+def is_file_case(case):
+    return "input_file" in case or "output_file" in case
+
+
+def case_input(case):
+    """(input_data, input_path)를 반환합니다. 파일 케이스면 input_data 대신 input_path가 채워집니다."""
+    if "input_file" in case:
+        return None, testcase_path(case["input_file"])
+    return case.get("input", ""), None
+
+
+def sample_text(case, kind):
+    """잠금 화면 예제 상자에 보여줄 입력/출력입니다. kind는 "input" 또는 "output"입니다."""
+    if f"{kind}_file" in case:
+        return preview(testcase_path(case[f"{kind}_file"]))
+    return case.get(kind, "")
+
+
+@contextlib.contextmanager
+def open_mapped(path):
+    """파일을 읽기 전용으로 메모리 매핑합니다. 빈 파일은 mmap할 수 없으므로 b""를 돌려줍니다."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def trimmed_span(buf):
+    """앞뒤 공백을 제외한 [start, end) 구간입니다. 양 끝만 훑으므로 전체를 복사하지 않습니다."""
+    start, end = 0, len(buf)
+    while start < end and buf[start] in _WHITESPACE:
+        start += 1
+    while end > start and buf[end - 1] in _WHITESPACE:
+        end -= 1
+    return start, end
+
+
+def preview(path, limit=PREVIEW_CHARS):
+    """오답 메시지에 보여줄 출력 파일 앞부분입니다."""
+    with open(path, "rb") as f:
+        head = f.read(limit * 4 + 1)
+    text = head.decode("utf-8", errors="replace").strip()
+    if len(text) > limit or len(head) > limit * 4:
+        return text[:limit] + " ..."
+    return text
@@ -0,0 +1,173 @@
+# judge_limits.py (커널 자원 제한과 종료 시점 사용량 측정)
+import os
+import sys
+import math
+import signal
+try:
+    import resource
+except ImportError:  # Windows에는 rlimit이 없습니다.
+    resource = None
+
+CGROUP_ENV = "NSDP_JUDGE_CGROUP"
+# CPU 시간은 커널이 time_limit에서 끊고, 벽시계 시간은 입력 대기/sleep 등을 위해 여유를 둡니다.
+WALL_TIME_FACTOR = 2
+# 문제에 output_limit(MB)이 없을 때 쓰는 출력 크기 제한
+OUTPUT_LIMIT_MB = 64
+
+
+def wall_time_limit(time_limit):
+    return time_limit * WALL_TIME_FACTOR
+
+
+def _set_limit(kind, soft, hard):
+    _, current_hard = resource.getrlimit(kind)
+    if current_hard != resource.RLIM_INFINITY:
+        soft, hard = min(soft, current_hard), min(hard, current_hard)
+    resource.setrlimit(kind, (soft, hard))
+
+
+def apply_rlimits(time_limit, memory_limit_mb=None, base_address_space=0, output_limit_mb=OUTPUT_LIMIT_MB):
+    """fork된 자식에서 제출 코드를 실행하기 직전에 호출합니다.
+
+    CPU 시간을 넘기면 SIGXCPU로, 주소 공간을 넘기면 할당 실패(MemoryError)로,
+    출력 파일이 output_limit_mb를 넘기면 SIGXFSZ로 커널이 막습니다.
+    base_address_space는 fork 시점에 이미 물려받은 주소 공간 크기입니다.
+    """
+    cpu_seconds = max(1, math.ceil(time_limit))
+    _set_limit(resource.RLIMIT_CPU, cpu_seconds, cpu_seconds + 1)
+    _set_limit(resource.RLIMIT_CORE, 0, 0)
+    output_limit = output_limit_mb * 1024 * 1024
+    _set_limit(resource.RLIMIT_FSIZE, output_limit, output_limit)
+    # 파이썬은 SIGXFSZ를 무시하도록 시작하므로, 출력 초과 시 바로 죽도록 기본 동작으로 되돌립니다.
+    signal.signal(signal.SIGXFSZ, signal.SIG_DFL)
+    if memory_limit_mb:
+        limit = base_address_space + memory_limit_mb * 1024 * 1024
+        _set_limit(resource.RLIMIT_AS, limit, limit)
+
+
+def usage_from_rusage(rusage):
+    """wait4가 돌려준 rusage에서 (CPU 시간 ms, 최대 RSS KB)를 꺼냅니다."""
+    cpu_ms = (rusage.ru_utime + rusage.ru_stime) * 1000
+    max_rss = rusage.ru_maxrss
+    if sys.platform == "darwin":  # macOS는 바이트 단위
+        max_rss //= 1024
+    return cpu_ms, max_rss
+
+
+# 할당 실패로 끝난 프로그램이 stderr에 남기는 표시 (C++, Java)
+MEMORY_ERROR_MARKERS = ("std::bad_alloc", "java.lang.OutOfMemoryError")
+
+
+def is_memory_error(stderr):
+    """stderr로 보아 메모리 할당 실패로 끝났는지 확인합니다."""
+    if not stderr:
+        return False
+    last_line = stderr.strip().rsplit("\n", 1)[-1]
+    return last_line.startswith("MemoryError") or any(marker in stderr for marker in MEMORY_ERROR_MARKERS)
+
+
+def classify(exit_status, cpu_ms, memory_kb, wall_timed_out, time_limit, memory_limit_mb, stderr, oom_killed=False):
+    """종료 정보로 제한 초과를 판정합니다. (status, limit) 또는 제한 안에서 끝났으면 None을 반환합니다.
+
+    limit은 시간 초과일 때 "cpu"(CPU 시간 초과) 또는 "wall"(벽시계 시간 초과)입니다.
+    출력 제한 초과는 ("output_limit_exceeded", None)입니다.
+    """
+    term_signal = os.WTERMSIG(exit_status) if os.WIFSIGNALED(exit_status) else None
+    if term_signal == getattr(signal, "SIGXFSZ", None):
+        return "output_limit_exceeded", None
+    if oom_killed or memory_kb > memory_limit_mb * 1024 or is_memory_error(stderr):
+        return "memory_limit_exceeded", None
+    if cpu_ms > time_limit * 1000 or term_signal == getattr(signal, "SIGXCPU", None):
+        return "timeout", "cpu"
+    if wall_timed_out:
+        return "timeout", "wall"
+    return None
+
+
+class CgroupBackend:
+    """cgroup v2로 메모리를 제한하고 사용량을 읽는 선택적 백엔드입니다. (Linux 전용)
+
+    NSDP_JUDGE_CGROUP 환경 변수에 현재 사용자에게 위임된 cgroup 디렉터리를 지정하면 사용됩니다.
+    제출마다 하위 cgroup을 만들고, 자식은 exec 전에 그 안으로 들어갑니다.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        try:
+            # 하위 cgroup에서 memory/cpu 컨트롤러를 쓸 수 있게 합니다. (이미 켜져 있으면 실패해도 무방)
+            self._write(os.path.join(root, "cgroup.subtree_control"), "+memory +cpu")
+        except OSError:
+            pass
+
+    @staticmethod
+    def _write(path, value):
+        with open(path, "w") as f:
+            f.write(value)
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path) as f:
+                return f.read()
+        except OSError:
+            return ""
+
+    def create(self, name, memory_limit_mb):
+        path = os.path.join(self.root, name)
+        os.mkdir(path)
+        self._write(os.path.join(path, "memory.max"), str(memory_limit_mb * 1024 * 1024))
+        try: self._write(os.path.join(path, "memory.swap.max"), "0")
+        except OSError: pass
+        return path
+
+    @classmethod
+    def enter(cls, path):
+        """자식 프로세스에서 호출해 자기 자신을 cgroup으로 옮깁니다."""
+        cls._write(os.path.join(path, "cgroup.procs"), "0")
+
+    def usage(self, path):
+        """(CPU 시간 ms, 최대 메모리 KB, OOM kill 여부)를 읽습니다. 값을 읽을 수 없으면 None."""
+        cpu_ms = memory_kb = None
+        for line in self._read(os.path.join(path, "cpu.stat")).splitlines():
+            key, _, value = line.partition(" ")
+            if key == "usage_usec":
+                cpu_ms = int(value) / 1000
+        peak = self._read(os.path.join(path, "memory.peak")).strip()
+        if peak.isdigit():
+            memory_kb = int(peak) // 1024
+        oom_killed = False
+        for line in self._read(os.path.join(path, "memory.events")).splitlines():
+            key, _, value = line.partition(" ")
+            if key == "oom_kill" and int(value) > 0:
+                oom_killed = True
+        return cpu_ms, memory_kb, oom_killed
+
+    def remove(self, path):
+        try: os.rmdir(path)
+        except OSError: pass
+
+
+_cgroup_backend = None
+
+def get_cgroup_backend():
+    """설정된 cgroup v2 백엔드를 반환합니다. 설정이 없거나 쓸 수 없으면 None."""
+    global _cgroup_backend
+    root = os.environ.get(CGROUP_ENV)
+    if not root or not sys.platform.startswith("linux"):
+        return None
+    if _cgroup_backend is None or _cgroup_backend.root != root:
+        if not os.path.exists(os.path.join(root, "cgroup.controllers")) or not os.access(root, os.W_OK):
+            return None
+        _cgroup_backend = CgroupBackend(root)
+    return _cgroup_backend
+
+
+def enter_child_limits(time_limit, memory_limit_mb, base_address_space, cgroup_path=None, output_limit_mb=OUTPUT_LIMIT_MB):
+    """자식 프로세스에 제한을 겁니다. cgroup에 들어가면 메모리는 cgroup이, 아니면 RLIMIT_AS가 맡습니다."""
+    if cgroup_path is not None:
+        try:
+            CgroupBackend.enter(cgroup_path)
+            memory_limit_mb = None
+        except OSError:
+            pass
+    apply_rlimits(time_limit, memory_limit_mb, base_address_space, output_limit_mb)
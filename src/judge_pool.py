@@ -0,0 +1,393 @@
+# judge_pool.py (미리 띄워 둔 채점 워커 풀)
+import os
+import sys
+import time
+import queue
+import atexit
+import select
+import signal
+import socket
+import tempfile
+import subprocess
+import contextlib
+import itertools
+import collections
+import threading
+import traceback
+import multiprocessing
+from multiprocessing.connection import Connection
+import psutil
+import judge_limits
+from judge_workspace import JudgeWorkspace, SOURCE_NAME, load_bytecode
+
+# 채점 코드가 자주 쓰는 모듈은 워커가 미리 import 해 둡니다.
+# 워커에서 fork된 자식은 이 상태를 그대로 물려받으므로 인터프리터 기동/import 비용이 없습니다.
+PRELOAD_MODULES = ("math", "itertools", "collections", "heapq", "bisect", "re", "functools", "string")
+POLL_INTERVAL = 0.05
+# 워커 수를 직접 정할 때 쓰는 환경 변수 (batch_judge처럼 프로세스마다 풀을 띄우는 경우)
+POOL_SIZE_ENV = "NSDP_JUDGE_POOL_SIZE"
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def is_supported():
+    """fork 기반 워커 풀을 쓸 수 있는 환경인지 확인합니다. (Windows, PyInstaller로 묶인 경우에는 False)"""
+    if os.environ.get("NSDP_JUDGE_POOL", "1") == "0":
+        return False
+    if getattr(sys, "frozen", False):
+        # 워커는 새 파이썬 인터프리터로 띄우는데, 묶인 실행 파일의 sys.executable은 파이썬이 아닙니다.
+        return False
+    return hasattr(os, "fork") and "fork" in multiprocessing.get_all_start_methods()
+
+
+def _exec_child(code_obj, argv=()):
+    """fork된 자식 프로세스 안에서 제출 코드를 실행하고 종료합니다."""
+    sys.argv = [SOURCE_NAME, *argv]
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", closefd=False)
+    exit_code = 0
+    try:
+        exec(code_obj, {"__name__": "__main__", "__builtins__": __builtins__})
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException as e:
+        # 워커 내부 프레임은 빼고 제출 코드의 트레이스백만 출력
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        exit_code = 1
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(exit_code)
+
+
+def _exec_program(argv):
+    """fork된 자식 프로세스를 컴파일된 실행 파일(또는 java 같은 런타임)로 바꿉니다."""
+    try:
+        os.execvp(argv[0], argv)
+    except OSError as e:
+        os.write(2, f"실행 실패: {e}\n".encode("utf-8"))
+        os._exit(127)
+
+
+def _cancel_requested(conn, job_id):
+    """실행 중에 들어온 메시지가 현재 작업의 취소 요청인지 확인합니다."""
+    message = conn.recv()
+    return message == ("cancel", job_id)
+
+
+_code_cache = collections.OrderedDict()
+CODE_CACHE_SIZE = 8
+
+def _load_code(bytecode_path):
+    """작업 공간의 바이트코드를 읽습니다. 같은 제출의 다음 케이스부터는 캐시된 코드 객체를 씁니다."""
+    st = os.stat(bytecode_path)
+    key = (bytecode_path, st.st_ino, st.st_mtime_ns)
+    code_obj = _code_cache.get(key)
+    if code_obj is None:
+        code_obj = load_bytecode(bytecode_path)
+        _code_cache[key] = code_obj
+        if len(_code_cache) > CODE_CACHE_SIZE:
+            _code_cache.popitem(last=False)
+    else:
+        _code_cache.move_to_end(key)
+    return code_obj
+
+
+def _run_job(job, conn):
+    """워커 프로세스에서 한 테스트 케이스를 실행합니다. 결과 형식은 judge_single_case와 같습니다.
+
+    job에 output_path가 있으면 출력을 그 파일에 그대로 두고 결과에는 output 대신 output_path를 담습니다.
+
+    시간/메모리 제한은 자식에 건 rlimit(또는 cgroup)으로 커널이 강제하고, 사용량은 wait4의
+    종료 통계로 측정해 time_ms(CPU 시간), wall_ms, memory_kb(최대 RSS)로 돌려줍니다.
+    exec한 컴파일 언어 프로그램의 최대 RSS는 exec 전의 값(워커 인터프리터 크기, 약 12MB)보다 작게 나오지 않습니다.
+    spawn_ms는 작업을 받은 뒤 자식을 fork 하기까지의 준비 시간, input_bytes/output_bytes는 입출력 크기입니다.
+    실행 중 conn으로 ("cancel", job_id)가 들어오면 자식을 죽이고 {"status": "cancelled"}를 반환합니다.
+    """
+    received = time.monotonic()
+    exec_argv = job.get("exec_argv")
+    code_obj = None if exec_argv else _load_code(job["bytecode_path"])
+
+    time_limit, memory_limit_mb = job["time_limit"], job["memory_limit_mb"]
+    # exec 하면 워커에게서 물려받은 주소 공간이 사라지므로 기준 크기도 0입니다.
+    base_address_space = 0 if exec_argv else psutil.Process().memory_info().vms
+    child_memory_limit_mb = memory_limit_mb if job.get("address_space_limit", True) else None
+    cgroup = judge_limits.get_cgroup_backend()
+    cgroup_path = cgroup.create(f"job-{os.getpid()}-{job['job_id']}", memory_limit_mb) if cgroup else None
+    output_limit_mb = job.get("output_limit_mb", judge_limits.OUTPUT_LIMIT_MB)
+    with contextlib.ExitStack() as stack:
+        # 파일 케이스는 입력 파일을 그대로 자식의 stdin으로 연결하고, 출력은 output_path로 바로 씁니다.
+        if job.get("input_path"):
+            stdin_f = stack.enter_context(open(job["input_path"], "rb"))
+        else:
+            stdin_f = stack.enter_context(tempfile.TemporaryFile())
+            stdin_f.write(job["input"].encode("utf-8"))
+            stdin_f.seek(0)
+        if job.get("output_path"):
+            stdout_f = stack.enter_context(open(job["output_path"], "w+b"))
+        else:
+            stdout_f = stack.enter_context(tempfile.TemporaryFile())
+        stderr_f = stack.enter_context(tempfile.TemporaryFile())
+        # 자식이 죽으면 쓰기 끝이 닫히므로, 읽기 끝을 select 해서 종료를 기다립니다.
+        sentinel_r, sentinel_w = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        start = time.monotonic()
+        pid = os.fork()
+        spawn_ms = (time.monotonic() - received) * 1000
+        if pid == 0:
+            try:
+                os.close(sentinel_r)
+                os.chdir(job["cwd"])
+                os.dup2(stdin_f.fileno(), 0)
+                os.dup2(stdout_f.fileno(), 1)
+                os.dup2(stderr_f.fileno(), 2)
+                judge_limits.enter_child_limits(time_limit, child_memory_limit_mb, base_address_space, cgroup_path, output_limit_mb)
+                # exec 후에도 센티널 쓰기 끝이 열려 있어야 프로그램이 끝날 때까지 기다릴 수 있습니다.
+                os.set_inheritable(sentinel_w, True)
+            except BaseException:
+                os._exit(1)
+            if exec_argv:
+                _exec_program(exec_argv + list(job.get("argv") or ()))
+            _exec_child(code_obj, job.get("argv") or ())
+        os.close(sentinel_w)
+
+        status = None
+        deadline = start + judge_limits.wall_time_limit(time_limit)
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    status = "timeout"
+                    break
+                ready, _, _ = select.select([sentinel_r, conn], [], [], remaining)
+                if conn in ready and _cancel_requested(conn, job["job_id"]):
+                    status = "cancelled"
+                    break
+                if sentinel_r in ready:
+                    break
+        finally:
+            if status is not None:
+                try: os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError: pass
+            _, exit_status, rusage = os.wait4(pid, 0)
+            wall_ms = (time.monotonic() - start) * 1000
+            os.close(sentinel_r)
+
+        cpu_ms, memory_kb = judge_limits.usage_from_rusage(rusage)
+        oom_killed = False
+        if cgroup_path is not None:
+            cg_cpu_ms, cg_memory_kb, oom_killed = cgroup.usage(cgroup_path)
+            cpu_ms = cg_cpu_ms if cg_cpu_ms is not None else cpu_ms
+            memory_kb = cg_memory_kb if cg_memory_kb is not None else memory_kb
+            cgroup.remove(cgroup_path)
+        if status == "cancelled":
+            return {"status": "cancelled"}
+        stderr_f.seek(0)
+        stderr = stderr_f.read().decode("utf-8", errors="replace")
+        input_bytes = os.fstat(stdin_f.fileno()).st_size
+        output_bytes = os.fstat(stdout_f.fileno()).st_size
+        output = None
+        if not job.get("output_path"):
+            stdout_f.seek(0)
+            output = stdout_f.read().decode("utf-8", errors="replace").strip()
+
+    exit_code = os.WEXITSTATUS(exit_status) if os.WIFEXITED(exit_status) else -os.WTERMSIG(exit_status)
+    usage = {"time_ms": round(cpu_ms), "wall_ms": round(wall_ms), "memory_kb": memory_kb, "exit_code": exit_code,
+             "spawn_ms": round(spawn_ms, 2), "input_bytes": input_bytes, "output_bytes": output_bytes}
+    limit = judge_limits.classify(exit_status, cpu_ms, memory_kb, status == "timeout",
+                                  time_limit, memory_limit_mb, stderr, oom_killed)
+    if limit is not None:
+        status, kind = limit
+        result = {"status": status, **usage}
+        if kind:
+            result["limit"] = kind
+        return result
+    if stderr:
+        return {"status": "error", "stderr": stderr, **usage}
+    if output is None:
+        return {"status": "success", "output_path": job["output_path"], **usage}
+    return {"status": "success", "output": output, **usage}
+
+
+def _zygote_main(fd):
+    """새 인터프리터로 띄운 워커의 진입점입니다. fd는 풀과 이어진 소켓입니다."""
+    _worker_main(Connection(fd))
+
+
+def _worker_main(conn):
+    for name in PRELOAD_MODULES:
+        try: __import__(name)
+        except ImportError: pass
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        if isinstance(job, tuple):
+            # 이미 끝난 작업에 대해 늦게 도착한 취소 요청은 무시합니다.
+            continue
+        try:
+            result = _run_job(job, conn)
+        except Exception as e:
+            result = {"status": "error", "stderr": str(e)}
+        conn.send(result)
+
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+
+    def close(self, timeout=1):
+        try: self.conn.send(None)
+        except (OSError, ValueError): pass
+        self.conn.close()
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class JudgeWorkerPool:
+    """미리 띄워 둔 워커 프로세스들에 테스트 케이스 실행을 맡기는 풀입니다.
+
+    워커는 케이스마다 자기 자신을 fork해서 새 자식에서 제출 코드를 실행하고,
+    자식은 실행이 끝나면 버려집니다. 여러 스레드에서 동시에 run()을 호출해도 됩니다.
+
+    워커는 풀을 만든 프로세스(GUI)를 fork하지 않고 새 인터프리터로 띄웁니다. fork된 자식의 최대 RSS(ru_maxrss)에는
+    fork 시점의 부모 RSS가 들어가고, exec한 컴파일 언어 프로그램도 exec 전의 최대 RSS를 물려받으므로,
+    부모가 크면 맞는 코드도 메모리 초과가 됩니다. 작은 워커에서 fork하면 이 기준이 인터프리터 크기로 줄어듭니다.
+    """
+
+    def __init__(self, size=None):
+        self.size = size or int(os.environ.get(POOL_SIZE_ENV, 0)) or max(1, min(4, os.cpu_count() or 1))
+        self._idle = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._job_ids = itertools.count()
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        parent_sock, child_sock = socket.socketpair()
+        fd = child_sock.fileno()
+        bootstrap = f"import sys; sys.path.insert(0, {_SRC_DIR!r}); import judge_pool; judge_pool._zygote_main({fd})"
+        try:
+            process = subprocess.Popen([sys.executable, "-c", bootstrap], pass_fds=(fd,), stdin=subprocess.DEVNULL)
+        finally:
+            child_sock.close()
+        worker = _Worker(process, Connection(parent_sock.detach()))
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _discard(self, worker):
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.close(timeout=0)
+
+    def run(self, workspace, input_data, time_limit, memory_limit_mb, cancel_event=None,
+            input_path=None, output_path=None, output_limit_mb=judge_limits.OUTPUT_LIMIT_MB, argv=()):
+        """작업 공간(JudgeWorkspace)의 코드로 케이스 하나를 실행합니다.
+
+        input_path가 주어지면 input_data 대신 그 파일을 stdin으로 흘려 넣고,
+        output_path가 주어지면 출력을 메모리에 읽지 않고 그 파일에 남깁니다.
+        argv는 실행되는 코드의 sys.argv[1:](컴파일 언어는 명령행 인자)로 전달됩니다.
+        cancel_event가 set 되면 실행 중인 자식을 죽이고 cancelled를 반환합니다.
+        """
+        if self._closed:
+            raise RuntimeError("이미 종료된 채점 워커 풀입니다.")
+        worker = self._idle.get()
+        job_id = next(self._job_ids)
+        job = {"job_id": job_id, "bytecode_path": workspace.bytecode_path, "exec_argv": workspace.exec_argv,
+               "address_space_limit": workspace.spec["address_space_limit"], "cwd": workspace.path,
+               "input": input_data, "input_path": input_path, "output_path": output_path,
+               "time_limit": time_limit, "memory_limit_mb": memory_limit_mb, "output_limit_mb": output_limit_mb,
+               "argv": list(argv)}
+        try:
+            worker.conn.send(job)
+            cancel_sent = False
+            while not worker.conn.poll(POLL_INTERVAL):
+                if cancel_event is not None and cancel_event.is_set() and not cancel_sent:
+                    worker.conn.send(("cancel", job_id))
+                    cancel_sent = True
+            return worker.conn.recv()
+        except (EOFError, OSError) as e:
+            # 워커가 비정상 종료되었으면 새 워커로 교체합니다.
+            self._discard(worker)
+            worker = self._spawn()
+            return {"status": "error", "stderr": f"채점 워커 오류: {e}"}
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+def get_default_pool():
+    """공용 워커 풀을 처음 필요할 때 만들어 반환합니다. 지원하지 않는 환경이면 None."""
+    global _default_pool
+    if not is_supported():
+        return None
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = JudgeWorkerPool()
+            atexit.register(_default_pool.close)
+    return _default_pool
+
+
+def measure_overhead(samples=10, pool=None):
+    """빈 프로그램을 기존 subprocess 방식과 워커 풀로 각각 실행해 케이스당 오버헤드를 비교합니다."""
+    from utils import judge_single_case
+    pool = pool or get_default_pool()
+    if pool is None:
+        raise RuntimeError("이 환경에서는 워커 풀을 사용할 수 없습니다.")
+
+    def median_ms(run):
+        times = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            run()
+            times.append((time.perf_counter() - start) * 1000)
+        times.sort()
+        return times[len(times) // 2]
+
+    subprocess_ms = median_ms(lambda: judge_single_case("pass", "", 5, 128))
+    with JudgeWorkspace("pass") as workspace:
+        pool_ms = median_ms(lambda: pool.run(workspace, "", 5, 128))
+    return {
+        "samples": samples,
+        "subprocess_ms": round(subprocess_ms, 2),
+        "pool_ms": round(pool_ms, 2),
+        "saved_ms": round(subprocess_ms - pool_ms, 2),
+        "speedup": round(subprocess_ms / pool_ms, 1) if pool_ms else None,
+    }
+
+
+if __name__ == "__main__":
+    result = measure_overhead()
+    print(f"[채점 워커 풀] 케이스당 오버헤드: subprocess {result['subprocess_ms']}ms -> 워커 풀 {result['pool_ms']}ms "
+          f"({result['saved_ms']}ms 절약, {result['speedup']}배)")
@@ -0,0 +1,61 @@
+# judge_workspace.py (제출별 전용 작업 공간)
+import os
+import sys
+import shutil
+import marshal
+import tempfile
+import languages
+
+SOURCE_NAME = languages.LANGUAGES["python"]["source"]
+
+
+class JudgeWorkspace:
+    """제출 하나를 위한 전용 임시 디렉터리입니다.
+
+    소스는 한 번만 쓰고 컴파일(파이썬은 바이트코드)도 한 번만 해서 모든 테스트 케이스가 재사용합니다.
+    컴파일 결과는 languages의 캐시에 소스 해시로 보관되므로 같은 코드를 다시 제출해도 다시 컴파일하지 않습니다.
+    제출마다 디렉터리가 따로 생기므로 여러 채점이 동시에 돌아도 서로 덮어쓰지 않고,
+    with 블록이 끝나면 디렉터리째 한 번에 정리됩니다.
+    """
+
+    def __init__(self, user_code, language=languages.DEFAULT_LANGUAGE):
+        self.language = language
+        self.spec = languages.get_language(language)
+        self.path = tempfile.mkdtemp(prefix="nsdp_judge_")
+        self.source_path = os.path.join(self.path, self.spec["source"])
+        with open(self.source_path, "w", encoding="utf-8") as f:
+            f.write(user_code)
+        artifact, self.compile_error, self.compile_ms, self.compile_cached = \
+            languages.compile_cached(language, self.source_path, user_code)
+        # 파이썬은 워커가 바이트코드를 직접 읽고, 컴파일 언어는 exec_argv를 exec 합니다.
+        self.bytecode_path = artifact if self.spec["run"] is None else None
+        self.exec_argv = languages.run_command(language, artifact) if artifact else None
+
+    def output_path(self, case_num):
+        """파일 기반 케이스의 출력을 남겨 둘 경로입니다. (케이스마다 달라 동시 실행에도 안전)"""
+        return os.path.join(self.path, f"case_{case_num}.out")
+
+    def command(self):
+        """subprocess 경로에서 실행할 명령입니다. (작업 공간을 cwd로 실행)"""
+        if self.exec_argv is not None:
+            return list(self.exec_argv)
+        if getattr(sys, "frozen", False):
+            # PyInstaller로 묶인 경우 sys.executable은 파이썬이 아니므로 시스템 python으로 소스를 실행합니다.
+            return ["python", SOURCE_NAME]
+        return [sys.executable, self.bytecode_path]
+
+    def cleanup(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.cleanup()
+
+
+def load_bytecode(path):
+    """py_compile로 만든 .pyc 파일에서 코드 객체를 읽습니다."""
+    with open(path, "rb") as f:
+        f.seek(16)  # 매직 넘버, 플래그, 소스 mtime/크기 헤더
+        return marshal.load(f)
@@ -0,0 +1,200 @@
+# languages.py (제출 언어 정의와 컴파일 결과 캐시)
+import os
+import sys
+import json
+import time
+import shutil
+import signal
+import hashlib
+import tempfile
+import functools
+import subprocess
+import py_compile
+
+DEFAULT_LANGUAGE = "python"
+# 컴파일 결과는 (언어, 컴파일 명령, 컴파일러 버전, 소스)의 해시를 이름으로 하는 디렉터리에 보관합니다.
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "nsdp_compile_cache")
+MAX_CACHE_ENTRIES = 64
+# 이 시간 안에 쓴(컴파일하거나 캐시에서 꺼낸) 결과는 다른 채점이 아직 실행 중일 수 있으므로 지우지 않습니다.
+PRUNE_GRACE_SECONDS = 3600
+COMPILE_TIME_LIMIT = 30
+_EXE = ".exe" if sys.platform == "win32" else ""
+
+# source: 작업 공간에 저장할 소스 파일 이름, artifact: 컴파일 결과물 이름 (캐시 디렉터리 기준)
+# compile/run 명령의 {source}, {artifact}는 실제 경로로 바뀝니다.
+# strict_exit가 참이면 0이 아닌 종료 코드를 런타임 에러로 봅니다.
+# address_space_limit가 거짓이면 RLIMIT_AS 대신 종료 후 최대 RSS로만 메모리를 판정합니다. (JVM은 주소 공간을 크게 예약함)
+LANGUAGES = {
+    "python": {
+        "extensions": (".py",), "name": "Python 3", "lexer": "python", "source": "solution.py", "artifact": "solution.pyc",
+        "compile": None, "run": None, "strict_exit": False, "address_space_limit": True,
+        "template": "",
+    },
+    "c": {
+        "extensions": (".c",), "name": "C11 (gcc)", "lexer": "c", "source": "main.c", "artifact": "main" + _EXE,
+        "compile": ["gcc", "-O2", "-std=gnu11", "-pipe", "-o", "{artifact}", "{source}", "-lm"],
+        "run": ["{artifact}"], "strict_exit": True, "address_space_limit": True,
+        "template": "#include <stdio.h>\n\nint main(void) {\n    \n    return 0;\n}\n",
+    },
+    "cpp": {
+        "extensions": (".cpp", ".cc", ".cxx"), "name": "C++17 (g++)", "lexer": "cpp", "source": "main.cpp", "artifact": "main" + _EXE,
+        "compile": ["g++", "-O2", "-std=gnu++17", "-pipe", "-o", "{artifact}", "{source}"],
+        "run": ["{artifact}"], "strict_exit": True, "address_space_limit": True,
+        "template": "#include <bits/stdc++.h>\nusing namespace std;\n\nint main() {\n    ios::sync_with_stdio(false);\n    cin.tie(nullptr);\n    \n    return 0;\n}\n",
+    },
+    "java": {
+        "extensions": (".java",), "name": "Java", "lexer": "java", "source": "Main.java", "artifact": "classes",
+        "compile": ["javac", "-encoding", "UTF-8", "-d", "{artifact}", "{source}"],
+        "run": ["java", "-XX:+UseSerialGC", "-Xss64m", "-Dfile.encoding=UTF-8", "-cp", "{artifact}", "Main"],
+        "strict_exit": True, "address_space_limit": False,
+        "template": "import java.util.*;\nimport java.io.*;\n\npublic class Main {\n    public static void main(String[] args) throws IOException {\n        \n    }\n}\n",
+    },
+}
+
+
+def get_language(language):
+    try:
+        return LANGUAGES[language]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 언어입니다: {language}") from None
+
+
+def language_for_path(path):
+    """파일 확장자로 언어 id를 찾습니다. 지원하지 않는 확장자면 None."""
+    ext = os.path.splitext(path)[1].lower()
+    for language, spec in LANGUAGES.items():
+        if ext in spec["extensions"]:
+            return language
+    return None
+
+
+def language_by_name(name):
+    """UI에 보이는 이름(예: "C++17 (g++)")으로 언어 id를 찾습니다."""
+    for language, spec in LANGUAGES.items():
+        if spec["name"] == name:
+            return language
+    return DEFAULT_LANGUAGE
+
+
+@functools.lru_cache(maxsize=None)
+def compiler_version(command):
+    """캐시 키에 넣을 컴파일러 버전 문자열입니다. 컴파일러가 바뀌면 캐시도 새로 만들어집니다."""
+    if command is None:
+        return sys.version
+    try:
+        proc = subprocess.run([command, "-version" if command == "javac" else "--version"],
+                              capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return (proc.stdout or proc.stderr).strip().split("\n", 1)[0]
+
+
+def cache_key(language, source_code):
+    spec = get_language(language)
+    compiler = spec["compile"][0] if spec["compile"] else None
+    header = json.dumps([language, spec["compile"], spec["artifact"], compiler_version(compiler)])
+    return hashlib.sha256(header.encode("utf-8") + b"\0" + source_code.encode("utf-8")).hexdigest()
+
+
+def _compile_into(spec, source_path, out_dir):
+    """out_dir에 결과물을 만듭니다. 컴파일 에러면 메시지를, 성공하면 None을 반환합니다."""
+    artifact = os.path.join(out_dir, spec["artifact"])
+    if spec["compile"] is None:
+        try:
+            # 트레이스백에는 임시 경로 대신 solution.py로 표시되도록 dfile을 지정합니다.
+            py_compile.compile(source_path, cfile=artifact, dfile=spec["source"], doraise=True)
+        except py_compile.PyCompileError as e:
+            return e.msg
+        return None
+    # 소스가 있는 작업 공간에서 파일 이름만으로 컴파일해야 에러 메시지에 임시 경로가 나오지 않습니다.
+    command = [part.format(source=spec["source"], artifact=artifact) for part in spec["compile"]]
+    try:
+        proc = subprocess.run(command, cwd=os.path.dirname(source_path), capture_output=True,
+                              text=True, encoding="utf-8", errors="replace", timeout=COMPILE_TIME_LIMIT)
+    except FileNotFoundError:
+        # 제출 코드의 문제가 아니므로 컴파일 에러로 캐시하지 않도록 예외로 올려 보냅니다.
+        raise FileNotFoundError(f"컴파일러({command[0]})를 찾을 수 없습니다. 설치되어 있고 PATH에 있는지 확인하세요.")
+    except subprocess.TimeoutExpired:
+        raise TimeoutError(f"컴파일이 {COMPILE_TIME_LIMIT}초 안에 끝나지 않았습니다.")
+    if proc.returncode != 0:
+        return (proc.stderr or proc.stdout).strip() or f"컴파일러 종료 코드 {proc.returncode}"
+    return None
+
+
+def _prune_cache():
+    """오래 쓰지 않은 컴파일 결과부터 지워서 MAX_CACHE_ENTRIES개만 남깁니다.
+
+    최근 PRUNE_GRACE_SECONDS 안에 쓴 결과는 다른 채점이 실행 중일 수 있으므로 개수를 넘더라도 남겨 둡니다.
+    """
+    try:
+        entries = [(entry.stat().st_mtime, entry.path) for entry in os.scandir(CACHE_DIR)
+                   if entry.is_dir() and not entry.name.startswith(".")]
+    except OSError:
+        return
+    entries.sort()
+    cutoff = time.time() - PRUNE_GRACE_SECONDS
+    for mtime, path in entries[:max(0, len(entries) - MAX_CACHE_ENTRIES)]:
+        if mtime >= cutoff:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def compile_cached(language, source_path, source_code):
+    """소스를 컴파일하거나 캐시된 결과를 가져옵니다.
+
+    (결과물 경로, 컴파일 에러 메시지, 컴파일 시간 ms, 캐시 사용 여부)를 반환합니다.
+    컴파일 에러도 캐시하므로 같은 코드를 다시 제출하면 컴파일러를 다시 돌리지 않습니다.
+    시간 초과나 컴파일러가 없는 경우처럼 코드 탓이 아닌 실패는 캐시하지 않습니다.
+    """
+    spec = get_language(language)
+    entry_dir = os.path.join(CACHE_DIR, cache_key(language, source_code))
+    error_path = os.path.join(entry_dir, "compile_error.txt")
+    if os.path.isdir(entry_dir):
+        try: os.utime(entry_dir)
+        except OSError: pass
+        if os.path.exists(error_path):
+            with open(error_path, "r", encoding="utf-8") as f:
+                return None, f.read(), 0, True
+        return os.path.join(entry_dir, spec["artifact"]), None, 0, True
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # 임시 디렉터리에 만든 뒤 이름을 바꿔서, 동시에 같은 코드를 컴파일해도 반쯤 만든 결과를 보지 않게 합니다.
+    tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=CACHE_DIR)
+    start = time.perf_counter()
+    try:
+        compile_error = _compile_into(spec, source_path, tmp_dir)
+    except (TimeoutError, FileNotFoundError) as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None, str(e), round((time.perf_counter() - start) * 1000), False
+    compile_ms = round((time.perf_counter() - start) * 1000)
+    if compile_error is not None:
+        with open(os.path.join(tmp_dir, "compile_error.txt"), "w", encoding="utf-8") as f:
+            f.write(compile_error)
+    try:
+        os.rename(tmp_dir, entry_dir)
+        _prune_cache()
+    except OSError:
+        # 다른 채점이 먼저 같은 결과를 저장했으면 그것을 씁니다.
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    if compile_error is not None:
+        return None, compile_error, compile_ms, False
+    return os.path.join(entry_dir, spec["artifact"]), None, compile_ms, False
+
+
+def run_command(language, artifact):
+    """컴파일된 결과물을 실행할 명령입니다. 파이썬처럼 인터프리터가 바이트코드를 직접 읽는 언어는 None."""
+    spec = get_language(language)
+    if spec["run"] is None:
+        return None
+    return [part.format(artifact=artifact) for part in spec["run"]]
+
+
+def describe_exit(exit_code):
+    """strict_exit 언어가 0이 아닌 코드로 끝났을 때 보여줄 메시지입니다."""
+    if exit_code < 0:
+        try:
+            name = signal.Signals(-exit_code).name
+        except ValueError:
+            name = f"signal {-exit_code}"
+        return f"런타임 에러 ({name})"
+    return f"런타임 에러 (종료 코드 {exit_code})"
@@ -0,0 +1,303 @@
+# problem_importer.py (문제 텍스트 디렉터리 일괄 가져오기)
+#
+# 사용 예: python problem_importer.py texts/ --concurrency 4 --rpm 15
+#          python problem_importer.py texts/ --backend stub --dry-run    (API 없이 파이프라인 시험)
+# texts/ 안의 "<문제 id>_이름.txt" 파일마다 모델로 problems.json 형식을 만들고, 형식을 검사한 뒤
+# 문제 은행에 바로 합칩니다. 모델 응답은 프롬프트 해시별로 디스크에 캐시하므로, 다시 실행하면
+# 이미 변환한 문제는 API를 부르지 않습니다.
+import os
+import re
+import sys
+import json
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+import tempfile
+from gemini_parser import GeminiBackend, PROBLEM_TEXT_MARKER, build_prompt, extract_json
+
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "nsdp_import_cache")
+TEXT_SUFFIXES = (".txt", ".md")
+RETRY_BASE_SECONDS = 2.0
+_PROBLEM_ID = re.compile(r"^(\d+)")
+
+
+class ProblemSchemaError(ValueError):
+    """모델이 만든 문제가 problems.json 형식에 맞지 않을 때 발생합니다."""
+
+
+def validate_problem(problem):
+    """문제 dict가 문제 은행 형식에 맞는지 검사합니다. 맞지 않으면 ProblemSchemaError."""
+    errors = []
+    if not isinstance(problem, dict):
+        raise ProblemSchemaError("문제가 JSON 객체가 아닙니다.")
+    if not isinstance(problem.get("id"), int) or isinstance(problem.get("id"), bool) or problem["id"] <= 0:
+        errors.append("id는 양의 정수여야 합니다.")
+    for key in ("title", "description"):
+        if not isinstance(problem.get(key), str) or not problem[key].strip():
+            errors.append(f"{key}는 비어 있지 않은 문자열이어야 합니다.")
+    if "hint" in problem and not isinstance(problem["hint"], str):
+        errors.append("hint는 문자열이어야 합니다.")
+    if not isinstance(problem.get("stars"), int) or not 1 <= problem["stars"] <= 10:
+        errors.append("stars는 1~10 사이의 정수여야 합니다.")
+    if not isinstance(problem.get("time_limit"), (int, float)) or problem["time_limit"] <= 0:
+        errors.append("time_limit은 양수(초)여야 합니다.")
+    if not isinstance(problem.get("memory_limit"), int) or problem["memory_limit"] <= 0:
+        errors.append("memory_limit은 양의 정수(MB)여야 합니다.")
+    testcases = problem.get("testcases")
+    if not isinstance(testcases, list) or not testcases:
+        errors.append("testcases는 비어 있지 않은 목록이어야 합니다.")
+    else:
+        for i, case in enumerate(testcases, 1):
+            # 파일 케이스(input_file/output_file)도 허용합니다.
+            if not isinstance(case, dict) or not all(isinstance(case.get(k, case.get(f"{k}_file")), str) for k in ("input", "output")):
+                errors.append(f"테스트 케이스 #{i}에는 문자열 input(_file), output(_file)이 있어야 합니다.")
+    if errors:
+        raise ProblemSchemaError(" ".join(errors))
+    return problem
+
+
+class ResponseCache:
+    """프롬프트 해시 -> 모델 응답 텍스트를 파일 하나씩 저장하는 캐시입니다."""
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+
+    @staticmethod
+    def key(backend_name, prompt):
+        return hashlib.sha256(f"{backend_name}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key, response):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"response": response, "saved_at": time.time()}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class RateLimiter:
+    """분당 요청 수를 넘지 않도록 요청 시작 간격을 벌립니다."""
+
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class StubBackend:
+    """API 없이 파이프라인을 시험하기 위한 로컬 모델 대용입니다.
+
+    백준 형식의 문제 텍스트(제목 줄, "2 초 128 MB", 문제/입력/출력/예제 입력 N/예제 출력 N/힌트 절)를
+    규칙으로 읽어 모델과 같은 모양의 응답(```json 블록)을 만듭니다.
+    """
+
+    cache_name = "stub"
+    _SECTION = re.compile(r"^(문제|입력|출력|힌트|예제 입력 \d+|예제 출력 \d+)\s*$")
+    _LIMITS = re.compile(r"(\d+(?:\.\d+)?)\s*초.*?(\d+)\s*MB")
+
+    def generate(self, prompt):
+        text = prompt.split(PROBLEM_TEXT_MARKER, 1)[-1].strip()
+        lines = text.splitlines()
+        title = lines[0].replace("스페셜 저지", "").strip() if lines else ""
+        limits = self._LIMITS.search(text)
+        sections, current = {}, None
+        for line in lines[1:]:
+            match = self._SECTION.match(line.strip())
+            if match:
+                current = match.group(1)
+                sections[current] = []
+            elif current:
+                sections[current].append(line)
+        body = {name: "\n".join(content).strip() for name, content in sections.items()}
+        description = "\n\n".join(part for part in (body.get("문제"), body.get("입력") and "입력: " + body["입력"],
+                                                    body.get("출력") and "출력: " + body["출력"]) if part)
+        testcases, n = [], 1
+        while f"예제 입력 {n}" in body:
+            testcases.append({"input": body[f"예제 입력 {n}"], "output": body.get(f"예제 출력 {n}", "")})
+            n += 1
+        problem = {"id": 0, "title": title, "description": description, "hint": "미분류", "stars": 1,
+                   "time_limit": float(limits.group(1)) if limits else 1, "memory_limit": int(limits.group(2)) if limits else 128,
+                   "testcases": testcases}
+        if isinstance(problem["time_limit"], float) and problem["time_limit"].is_integer():
+            problem["time_limit"] = int(problem["time_limit"])
+        return "```json\n" + json.dumps(problem, ensure_ascii=False, indent=2) + "\n```"
+
+
+def get_backend(name):
+    if name == "stub":
+        return StubBackend()
+    return GeminiBackend()
+
+
+def discover_texts(root):
+    """root 아래의 문제 텍스트 파일 경로 목록입니다."""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        paths.extend(os.path.join(dirpath, name) for name in sorted(filenames) if name.endswith(TEXT_SUFFIXES))
+    return paths
+
+
+async def convert_one(path, backend, cache, limiter, semaphore, retries):
+    """텍스트 파일 하나를 문제 dict로 바꿉니다. 결과 기록(dict)을 반환하고 예외는 올려 보내지 않습니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        prompt = build_prompt(f.read())
+    key = cache.key(backend.cache_name, prompt)
+    match = _PROBLEM_ID.match(os.path.basename(path))
+    record = {"path": path, "cached": False, "attempts": 0}
+    cached = cache.get(key)
+    error = None
+    for attempt in range(retries + 1):
+        if cached is not None:
+            response, record["cached"] = cached, True
+            cached = None
+        else:
+            if attempt:
+                # 지수 백오프 + 지터
+                await asyncio.sleep(RETRY_BASE_SECONDS * 2 ** (attempt - 1) * (0.5 + random.random()))
+            async with semaphore:
+                await limiter.acquire()
+                record["attempts"] += 1
+                try:
+                    response = await asyncio.to_thread(backend.generate, prompt)
+                except Exception as e:
+                    error = f"모델 호출 실패: {e}"
+                    continue
+            record["cached"] = False
+        try:
+            problem = extract_json(response)
+            if match:
+                # 모델은 문제 번호를 모르므로 파일 이름의 id를 씁니다.
+                problem["id"] = int(match.group(1))
+            validate_problem(problem)
+        except (ValueError, ProblemSchemaError) as e:
+            error = f"형식 오류: {e}"
+            continue
+        if not record["cached"]:
+            cache.put(key, response)
+        return {**record, "status": "ok", "id": problem["id"], "problem": problem}
+    return {**record, "status": "failed", "error": error}
+
+
+async def convert_all(paths, backend, concurrency=4, requests_per_minute=15, retries=3, cache=None):
+    cache = cache or ResponseCache()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = RateLimiter(requests_per_minute)
+    tasks = [convert_one(path, backend, cache, limiter, semaphore, retries) for path in paths]
+    records = []
+    for count, future in enumerate(asyncio.as_completed(tasks), 1):
+        record = await future
+        records.append(record)
+        note = "캐시" if record["cached"] else f"시도 {record['attempts']}회"
+        detail = record.get("id") if record["status"] == "ok" else record["error"]
+        print(f"[{count}/{len(paths)}] {os.path.basename(record['path'])}: {record['status']} ({note}) {detail}", file=sys.stderr)
+    return sorted(records, key=lambda record: record["path"])
+
+
+def _format_entry(problem):
+    """problems.json의 항목처럼 두 칸 들여쓴 JSON 텍스트입니다."""
+    return "\n".join("  " + line for line in json.dumps(problem, ensure_ascii=False, indent=2).splitlines())
+
+
+def merge_into_bank(records, bank_path, on_duplicate="skip", dry_run=False):
+    """변환에 성공한 문제를 문제 은행에 합칩니다.
+
+    이미 있는 id나 이번에 두 번 나온 id는 중복으로 보고, on_duplicate가 skip이면 건너뛰고
+    replace면 바꾸고 fail이면 아무것도 쓰지 않고 ValueError를 냅니다.
+    추가만 있을 때는 파일 끝에 이어 붙여 기존 항목의 서식을 그대로 둡니다.
+    """
+    with open(bank_path, "r", encoding="utf-8") as f:
+        text = f.read()
+    bank = json.loads(text)
+    positions = {problem["id"]: i for i, problem in enumerate(bank)}
+    added, replaced, duplicates, seen = [], [], [], set()
+    for record in records:
+        if record["status"] != "ok":
+            continue
+        problem = record["problem"]
+        if problem["id"] in seen:
+            duplicates.append({"id": problem["id"], "path": record["path"], "reason": "같은 배치에 이미 있음"})
+            continue
+        seen.add(problem["id"])
+        if problem["id"] in positions:
+            duplicates.append({"id": problem["id"], "path": record["path"], "reason": "문제 은행에 이미 있음"})
+            if on_duplicate == "replace":
+                bank[positions[problem["id"]]] = problem
+                replaced.append(problem["id"])
+            continue
+        added.append(problem)
+    if duplicates and on_duplicate == "fail":
+        raise ValueError(f"중복된 문제 id: {sorted({d['id'] for d in duplicates})}")
+    report = {"added": [p["id"] for p in added], "replaced": replaced, "duplicates": duplicates}
+    if dry_run or not (added or replaced):
+        return report
+
+    if replaced:
+        text = json.dumps(bank + added, ensure_ascii=False, indent=2) + "\n"
+    else:
+        end = text.rstrip().rfind("]")
+        head = text[:end].rstrip()
+        separator = ",\n" if bank else "\n"
+        text = head + separator + ",\n".join(_format_entry(p) for p in added) + "\n]\n"
+    tmp_path = f"{bank_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, bank_path)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="문제 텍스트 디렉터리를 변환해 문제 은행에 합칩니다.")
+    parser.add_argument("root", help="문제 텍스트(.txt/.md)가 있는 디렉터리. 파일 이름은 문제 id로 시작")
+    parser.add_argument("--bank", help="합칠 문제 은행 (기본: resources/problems.json)")
+    parser.add_argument("--backend", choices=("gemini", "stub"), default="gemini", help="모델 백엔드 (stub: 오프라인 시험용)")
+    parser.add_argument("--concurrency", "-j", type=int, default=4, help="동시에 보낼 요청 수")
+    parser.add_argument("--rpm", type=float, default=15, help="분당 최대 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--retries", type=int, default=3, help="실패한 요청을 다시 보낼 횟수")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="모델 응답 캐시 디렉터리")
+    parser.add_argument("--on-duplicate", choices=("skip", "replace", "fail"), default="skip", help="이미 있는 id 처리")
+    parser.add_argument("--dry-run", action="store_true", help="변환과 검사만 하고 문제 은행은 바꾸지 않음")
+    args = parser.parse_args(argv)
+
+    bank_path = args.bank
+    if bank_path is None:
+        from utils import resource_path
+        bank_path = resource_path("problems.json")
+    paths = discover_texts(args.root)
+    print(f"[문제 가져오기] 텍스트 {len(paths)}개, 백엔드 {args.backend}, 동시 {args.concurrency}개", file=sys.stderr)
+    records = asyncio.run(convert_all(paths, get_backend(args.backend), args.concurrency, args.rpm,
+                                      args.retries, ResponseCache(args.cache_dir)))
+    try:
+        report = merge_into_bank(records, bank_path, args.on_duplicate, args.dry_run)
+    except ValueError as e:
+        print(f"[문제 가져오기] {e}", file=sys.stderr)
+        sys.exit(1)
+    report["failed"] = [{"path": r["path"], "error": r["error"]} for r in records if r["status"] != "ok"]
+    report["cached"] = sum(1 for r in records if r["cached"])
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if report["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+# problem_index.py (problems.json의 메타데이터 전용 지연 로딩 인덱스)
+#
+# 문제마다 id/별점/제목/힌트와 원본 파일 안의 바이트 위치만 배열로 들고 있고,
+# 설명과 테스트 케이스는 고른 문제 하나만 그 위치에서 읽어 파싱합니다.
+# 인덱스는 원본 옆의 사이드카 파일(problems.json.idx)에 저장되어, 원본이 바뀌지 않았으면
+# 다음 실행부터는 배열을 그대로 읽어 들이기만 합니다.
+#
+# 벤치마크: python problem_index.py bench --count 100000
+import os
+import sys
+import json
+import time
+import array
+import bisect
+import struct
+import tempfile
+import subprocess
+
+INDEX_SUFFIX = ".idx"
+_MAGIC = b"NSDPIDX1"
+_HEADER = struct.Struct("<8sQQI")  # magic, 원본 크기, 원본 mtime_ns, 문제 수
+_decoder = json.JSONDecoder()
+
+
+def _signature(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+class IndexedProblem(dict):
+    """인덱스에 있는 메타데이터(id, title, stars, hint)만 담은 문제 dict입니다.
+
+    그 밖의 항목(description, testcases 등)에 처음 접근하면 원본 파일에서 이 문제만 읽어 채웁니다.
+    문제 수만큼 만들어지므로 인스턴스 __dict__ 없이 슬롯만 씁니다.
+    """
+
+    __slots__ = ("_index", "_position", "_loaded")
+
+    def __init__(self, index, position, *args):
+        super().__init__(*args)
+        self._index = index
+        self._position = position
+        self._loaded = False
+
+    def _load(self):
+        if not self._loaded:
+            self._loaded = True
+            for key, value in self._index.read(self._position).items():
+                dict.setdefault(self, key, value)
+
+    def __missing__(self, key):
+        self._load()
+        if not dict.__contains__(self, key):
+            raise KeyError(key)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if not dict.__contains__(self, key):
+            self._load()
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def materialize(self):
+        self._load()
+        return dict(self)
+
+    def __reduce__(self):
+        return dict, (self.materialize(),)
+
+
+class ProblemIndex:
+    """문제 은행의 메타데이터 배열 인덱스입니다.
+
+    ids/stars/offsets/lengths는 array 하나씩이고, 제목과 힌트는 문자열 하나에 이어 붙인 뒤
+    (시작, 끝) 위치 배열로 찾으므로 인덱스 자체는 문제 수가 늘어도 파이썬 객체 수가 늘지 않습니다.
+    (10만 문제에서 약 10MB)
+
+    다만 problems()(load_problems)는 문제마다 메타데이터 dict(IndexedProblem)를 만들므로 그만큼은 문제 수에
+    비례해 늘어납니다. (10만 문제에서 인덱스까지 약 45MB, json.load 전체 로딩의 1/5 정도) 메모리가 빠듯하면 get()으로
+    필요한 문제만 꺼내 쓰세요. 수치는 python problem_index.py bench로 확인할 수 있습니다.
+    """
+
+    def __init__(self, source_path, ids, stars, offsets, lengths, strings, spans):
+        self.source_path = source_path
+        self.ids = ids            # array('q')
+        self.stars = stars        # array('h')
+        self.offsets = offsets    # array('Q'), 원본 파일 안의 바이트 위치
+        self.lengths = lengths    # array('I'), 바이트 길이
+        self._strings = strings   # 제목과 힌트를 이어 붙인 문자열
+        self._spans = spans       # array('I'), 문제마다 [제목 시작, 제목 끝, 힌트 시작, 힌트 끝]
+        # id로 찾기 위한 정렬된 id 배열과 원래 위치
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        self._sorted_ids = array.array("q", (ids[i] for i in order))
+        self._sorted_pos = array.array("I", order)
+        self._hints = {}          # 같은 힌트 문자열은 문제들이 하나를 같이 씁니다.
+
+    def __len__(self):
+        return len(self.ids)
+
+    # --- 만들기 / 저장 / 읽기 ---
+    @classmethod
+    def build(cls, source_path):
+        """원본 JSON을 한 번 훑어 인덱스를 만듭니다. 문제 하나씩 파싱하고 메타데이터만 남깁니다."""
+        with open(source_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        ids, stars = array.array("q"), array.array("h")
+        offsets, lengths, spans = array.array("Q"), array.array("I"), array.array("I")
+        parts, string_len = [], 0
+        pos = text.index("[") + 1
+        byte_pos, char_pos = len(text[:pos].encode("utf-8")), pos
+        while True:
+            while text[pos] in " \t\r\n,":
+                pos += 1
+            if text[pos] == "]":
+                break
+            problem, end = _decoder.raw_decode(text, pos)
+            # 문자 위치를 바이트 위치로 바꿉니다. (앞에서부터 이어서 세므로 전체 O(n))
+            byte_pos += len(text[char_pos:pos].encode("utf-8"))
+            length = len(text[pos:end].encode("utf-8"))
+            ids.append(problem["id"])
+            stars.append(problem.get("stars", 1))
+            offsets.append(byte_pos)
+            lengths.append(length)
+            for field in ("title", "hint"):
+                value = problem.get(field) or ""
+                spans.extend((string_len, string_len + len(value)))
+                parts.append(value)
+                string_len += len(value)
+            byte_pos += length
+            pos = char_pos = end
+        return cls(source_path, ids, stars, offsets, lengths, "".join(parts), spans)
+
+    def save(self, index_path):
+        size, mtime_ns = _signature(self.source_path)
+        strings = self._strings.encode("utf-8")
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, size, mtime_ns, len(self)))
+            for arr in (self.ids, self.stars, self.offsets, self.lengths, self._spans):
+                f.write(arr.tobytes())
+            f.write(struct.pack("<Q", len(strings)))
+            f.write(strings)
+        os.replace(tmp_path, index_path)
+
+    @classmethod
+    def load_saved(cls, source_path, index_path):
+        """저장된 인덱스를 읽습니다. 원본이 바뀌었거나 형식이 다르면 None."""
+        try:
+            with open(index_path, "rb") as f:
+                magic, size, mtime_ns, count = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC or (size, mtime_ns) != _signature(source_path):
+                    return None
+                arrays = []
+                for typecode, per_problem in (("q", 1), ("h", 1), ("Q", 1), ("I", 1), ("I", 4)):
+                    arr = array.array(typecode)
+                    arr.fromfile(f, count * per_problem)
+                    arrays.append(arr)
+                (strings_len,) = struct.unpack("<Q", f.read(8))
+                strings = f.read(strings_len).decode("utf-8")
+        except (OSError, EOFError, struct.error, UnicodeDecodeError):
+            return None
+        ids, stars, offsets, lengths, spans = arrays
+        return cls(source_path, ids, stars, offsets, lengths, strings, spans)
+
+    @classmethod
+    def open(cls, source_path, index_path=None):
+        """저장된 인덱스가 최신이면 읽고, 아니면 새로 만들어 저장한 뒤 반환합니다."""
+        index_path = index_path or source_path + INDEX_SUFFIX
+        index = cls.load_saved(source_path, index_path)
+        if index is None:
+            index = cls.build(source_path)
+            try:
+                index.save(index_path)
+            except OSError as e:
+                print(f"[문제 인덱스] 인덱스를 저장하지 못했습니다: {e}")
+        return index
+
+    # --- 조회 ---
+    def position(self, problem_id):
+        i = bisect.bisect_left(self._sorted_ids, problem_id)
+        if i < len(self._sorted_ids) and self._sorted_ids[i] == problem_id:
+            return self._sorted_pos[i]
+        return None
+
+    def _string(self, position, field):
+        base = position * 4 + (0 if field == "title" else 2)
+        return self._strings[self._spans[base]:self._spans[base + 1]]
+
+    def meta(self, position):
+        """위치의 메타데이터 dict입니다. (id, title, stars, hint)"""
+        meta = {"id": self.ids[position], "title": self._string(position, "title"), "stars": self.stars[position]}
+        hint = self._string(position, "hint")
+        if hint:
+            meta["hint"] = self._hints.setdefault(hint, hint)
+        return meta
+
+    def read(self, position):
+        """원본 파일에서 그 문제 하나만 읽어 전체 dict로 파싱합니다."""
+        with open(self.source_path, "rb") as f:
+            f.seek(self.offsets[position])
+            return json.loads(f.read(self.lengths[position]).decode("utf-8"))
+
+    def get(self, problem_id):
+        position = self.position(problem_id)
+        return None if position is None else self.problem(position)
+
+    def problem(self, position):
+        return IndexedProblem(self, position, self.meta(position))
+
+    def problems(self):
+        """load_problems와 같은 모양의 목록입니다. 각 항목은 메타데이터만 들고 있다가 필요할 때 나머지를 읽습니다.
+
+        설명과 테스트 케이스는 읽지 않지만 메타데이터 dict는 문제마다 하나씩 만듭니다. (클래스 설명 참고)
+        """
+        return [self.problem(i) for i in range(len(self))]
+
+
+# --- 벤치마크 ---
+def _synthetic_bank(path, count):
+    """설명과 테스트 케이스가 들어간 가짜 문제 은행을 만듭니다."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for i in range(count):
+            problem = {
+                "id": 100000 + i, "title": f"문제 {i}", "description": "두 정수 A와 B를 입력받아 A+B를 출력하시오. " * 8,
+                "hint": "구현, 수학" if i % 2 else "반복문", "stars": 1 + i % 5, "time_limit": 1, "memory_limit": 128,
+                "testcases": [{"input": " ".join(str(j) for j in range(60)), "output": str(sum(range(60)))}] * 3,
+            }
+            f.write(("," if i else "") + json.dumps(problem, ensure_ascii=False) + "\n")
+        f.write("]\n")
+
+
+def _bench_child(mode, path):
+    import psutil
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+    start = time.perf_counter()
+    if mode == "json":
+        with open(path, "r", encoding="utf-8") as f:
+            problems = json.load(f)
+        chosen = problems[len(problems) // 2]["testcases"]
+    else:
+        index = ProblemIndex.open(path)
+        opened_rss = process.memory_info().rss
+        # load_problems(NSDP_PROBLEM_BACKEND=index)가 돌려주는 것과 같은 목록을 만들고, 그중 하나의 테스트 케이스를 읽습니다.
+        problems = list(index.problems())
+        chosen = problems[len(problems) // 2]["testcases"]
+    elapsed = time.perf_counter() - start
+    result = {"seconds": round(elapsed, 4), "rss_mb": round((process.memory_info().rss - rss_before) / 2 ** 20, 1),
+              "cases": len(chosen)}
+    if mode != "json":
+        result["index_rss_mb"] = round((opened_rss - rss_before) / 2 ** 20, 1)
+    print(json.dumps(result))
+
+
+def benchmark(count):
+    """json.load 전체 로딩과 인덱스(처음 만들 때/저장된 인덱스 읽을 때)의 시작 시간과 RSS 증가량을 비교합니다."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "problems.json")
+        _synthetic_bank(path, count)
+        results = {"problems": count, "file_mb": round(os.path.getsize(path) / 2 ** 20, 1)}
+        for label, mode in (("json_load", "json"), ("index_build", "index"), ("index_load", "index")):
+            # 프로세스마다 따로 재야 RSS가 서로 섞이지 않습니다.
+            out = subprocess.run([sys.executable, __file__, "_bench-child", mode, path],
+                                 capture_output=True, text=True, check=True).stdout
+            results[label] = json.loads(out.strip().splitlines()[-1])
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == "_bench-child":
+        _bench_child(sys.argv[2], sys.argv[3])
+    elif len(sys.argv) >= 2 and sys.argv[1] == "bench":
+        count = int(sys.argv[sys.argv.index("--count") + 1]) if "--count" in sys.argv else 100000
+        print(json.dumps(benchmark(count), ensure_ascii=False, indent=2))
+    else:
+        print("사용법: python problem_index.py bench [--count N]")
@@ -0,0 +1,286 @@
+# problem_pack.py (압축 바이너리 문제 팩)
+#
+# problems.json 대신 배포할 수 있는 .nsdppack 파일을 만들고 읽습니다.
+#   [헤더][문자열 테이블][문제 레코드 (고정 길이)][zlib 블롭들]
+# 제목/힌트는 문자열 테이블(같은 힌트는 한 번만 저장)에, 설명 등 나머지 항목과 테스트 케이스는
+# 문제마다 따로 압축한 블롭에 넣고 레코드에 (위치, 길이)를 적어 둡니다.
+# 파일을 mmap으로 열어 고른 문제의 블롭만 복사 없이 풀기 때문에 다른 문제는 읽지 않습니다.
+#
+# 사용 예:
+#   python problem_pack.py build ../resources/problems.json ../resources/problems.nsdppack
+#   python problem_pack.py unpack ../resources/problems.nsdppack out.json
+#   python problem_pack.py bench --count 100000
+import os
+import sys
+import json
+import time
+import mmap
+import zlib
+import array
+import struct
+import tempfile
+import subprocess
+
+PACK_SUFFIX = ".nsdppack"
+_MAGIC = b"NSDPPK01"
+FORMAT_VERSION = 1
+COMPRESS_LEVEL = 6
+# magic, 버전, 문제 수, 문자열 테이블 위치, 레코드 위치
+_HEADER = struct.Struct("<8sIIQQ")
+# id, 별점(-1이면 없음), 제목 문자열 번호, 힌트 문자열 번호(-1이면 없음),
+# 나머지 항목 블롭 (위치, 길이), 테스트 케이스 블롭 (위치, 길이), 테스트 케이스 수
+_RECORD = struct.Struct("<qhiiQIQII")
+# 레코드에 따로 두는 항목 (나머지는 항목 순서와 함께 details 블롭에)
+_RECORD_KEYS = ("id", "title", "hint", "stars", "testcases")
+
+
+def _compress(value):
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), COMPRESS_LEVEL)
+
+
+def write_pack(problems, pack_path):
+    """문제 목록을 팩 파일로 씁니다. 임시 파일에 쓴 뒤 교체합니다."""
+    strings, string_ids = [], {}
+
+    def string_id(value):
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    blobs, records, blob_pos = [], [], 0
+    for problem in problems:
+        details = {"key_order": list(problem.keys()),
+                   "fields": {k: v for k, v in problem.items() if k not in _RECORD_KEYS}}
+        details_blob, cases_blob = _compress(details), _compress(problem.get("testcases", []))
+        blobs += [details_blob, cases_blob]
+        records.append([problem["id"], problem.get("stars", -1), string_id(problem.get("title", "")),
+                        string_id(problem["hint"]) if "hint" in problem else -1,
+                        blob_pos, len(details_blob), blob_pos + len(details_blob), len(cases_blob),
+                        len(problem.get("testcases", []))])
+        blob_pos += len(details_blob) + len(cases_blob)
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array.array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    string_table = struct.pack("<I", len(strings)) + offsets.tobytes() + b"".join(encoded)
+    strings_pos = _HEADER.size
+    records_pos = strings_pos + len(string_table)
+    blobs_pos = records_pos + _RECORD.size * len(records)
+
+    tmp_path = f"{pack_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, len(records), strings_pos, records_pos))
+        f.write(string_table)
+        for record in records:
+            record[4] += blobs_pos
+            record[6] += blobs_pos
+            f.write(_RECORD.pack(*record))
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, pack_path)
+    return len(records)
+
+
+class PackedProblem(dict):
+    """팩의 레코드에 있는 항목(id, title, hint, stars)만 담은 문제 dict입니다.
+
+    설명 등 나머지 항목과 테스트 케이스는 처음 접근할 때 각각의 블롭만 풀어서 채웁니다.
+    """
+
+    def __init__(self, pack, position, *args):
+        super().__init__(*args)
+        self._pack = pack
+        self._position = position
+        self._key_order = None
+
+    def _load_details(self):
+        if self._key_order is None:
+            details = self._pack.details(self._position)
+            self._key_order = details["key_order"]
+            for key, value in details["fields"].items():
+                dict.setdefault(self, key, value)
+
+    def __missing__(self, key):
+        if key == "testcases":
+            testcases = self._pack.testcases(self._position)
+            dict.__setitem__(self, "testcases", testcases)
+            return testcases
+        self._load_details()
+        if not dict.__contains__(self, key):
+            raise KeyError(key)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if key == "testcases":
+            return True
+        if not dict.__contains__(self, key):
+            self._load_details()
+        return dict.__contains__(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def materialize(self):
+        """모든 항목을 원래 JSON의 순서대로 채운 일반 dict를 반환합니다."""
+        self._load_details()
+        self["testcases"]
+        return {key: dict.__getitem__(self, key) for key in self._key_order}
+
+    def __reduce__(self):
+        return dict, (self.materialize(),)
+
+
+class ProblemPack:
+    """mmap으로 연 팩 파일입니다."""
+
+    def __init__(self, pack_path):
+        self.path = pack_path
+        with open(pack_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, strings_pos, self._records_pos = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"문제 팩 형식이 아닙니다: {pack_path}")
+        (string_count,) = struct.unpack_from("<I", self._mm, strings_pos)
+        self._string_offsets = array.array("I")
+        self._string_offsets.frombytes(self._mm[strings_pos + 4:strings_pos + 4 + 4 * (string_count + 1)])
+        self._strings_data = strings_pos + 4 + 4 * (string_count + 1)
+        self._view = memoryview(self._mm)
+
+    def close(self):
+        self._view.release()
+        self._mm.close()
+
+    def __len__(self):
+        return self.count
+
+    def string(self, index):
+        start = self._strings_data + self._string_offsets[index]
+        end = self._strings_data + self._string_offsets[index + 1]
+        return self._mm[start:end].decode("utf-8")
+
+    def record(self, position):
+        return _RECORD.unpack_from(self._mm, self._records_pos + position * _RECORD.size)
+
+    def meta(self, position):
+        problem_id, stars, title, hint, *_ = self.record(position)
+        meta = {"id": problem_id, "title": self.string(title)}
+        if hint >= 0:
+            meta["hint"] = self.string(hint)
+        if stars >= 0:
+            meta["stars"] = stars
+        return meta
+
+    def _blob(self, offset, length):
+        # memoryview로 넘겨 블롭을 따로 복사하지 않고 바로 풉니다.
+        return json.loads(zlib.decompress(self._view[offset:offset + length]))
+
+    def details(self, position):
+        record = self.record(position)
+        return self._blob(record[4], record[5])
+
+    def testcases(self, position):
+        record = self.record(position)
+        return self._blob(record[6], record[7])
+
+    def problems(self):
+        """load_problems와 같은 모양의 목록입니다. 레코드는 한 번에 풀고 문자열은 한 번씩만 디코딩합니다."""
+        strings = [self.string(i) for i in range(len(self._string_offsets) - 1)]
+        end = self._records_pos + _RECORD.size * self.count
+        problems = []
+        for i, (problem_id, stars, title, hint, *_) in enumerate(_RECORD.iter_unpack(self._view[self._records_pos:end])):
+            meta = {"id": problem_id, "title": strings[title]}
+            if hint >= 0: meta["hint"] = strings[hint]
+            if stars >= 0: meta["stars"] = stars
+            problems.append(PackedProblem(self, i, meta))
+        return problems
+
+
+_packs = {}
+
+def load_pack(pack_path):
+    """경로별로 열어 둔 팩의 문제 목록을 반환합니다. 파일이 새로 만들어졌으면 다시 엽니다."""
+    st = os.stat(pack_path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _packs.get(pack_path)
+    if cached is None or cached[0] != signature:
+        # 예전 팩은 닫지 않습니다. 이미 나눠 준 문제가 아직 테스트 케이스를 읽을 수 있어야 합니다.
+        cached = _packs[pack_path] = (signature, ProblemPack(pack_path))
+    return cached[1].problems()
+
+
+# --- 벤치마크 ---
+def _bench_child(mode, path):
+    import psutil
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+    start = time.perf_counter()
+    if mode == "json":
+        with open(path, "r", encoding="utf-8") as f:
+            problems = json.load(f)
+    else:
+        problems = ProblemPack(path).problems()
+    loaded = time.perf_counter()
+    chosen = problems[len(problems) // 2]["testcases"]
+    done = time.perf_counter()
+    print(json.dumps({"load_s": round(loaded - start, 4), "testcases_ms": round((done - loaded) * 1000, 3),
+                      "rss_mb": round((process.memory_info().rss - rss_before) / 2 ** 20, 1), "cases": len(chosen)}))
+
+
+def benchmark(count):
+    """problems.json(indent=2)과 팩의 파일 크기, 로딩 시간, RSS 증가량, 한 문제 테스트 케이스 읽기 시간을 비교합니다."""
+    from problem_index import _synthetic_bank
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, "raw.json")
+        json_path = os.path.join(tmp, "problems.json")
+        pack_path = os.path.join(tmp, "problems" + PACK_SUFFIX)
+        _synthetic_bank(raw_path, count)
+        with open(raw_path, "r", encoding="utf-8") as f:
+            problems = json.load(f)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(problems, f, ensure_ascii=False, indent=2)
+        start = time.perf_counter()
+        write_pack(problems, pack_path)
+        results = {"problems": count, "build_s": round(time.perf_counter() - start, 3),
+                   "json_mb": round(os.path.getsize(json_path) / 2 ** 20, 2),
+                   "pack_mb": round(os.path.getsize(pack_path) / 2 ** 20, 2)}
+        del problems
+        for label, mode, path in (("json", "json", json_path), ("pack", "pack", pack_path)):
+            # 프로세스마다 따로 재야 RSS가 서로 섞이지 않습니다.
+            out = subprocess.run([sys.executable, __file__, "_bench-child", mode, path],
+                                 capture_output=True, text=True, check=True).stdout
+            results[label] = json.loads(out.strip().splitlines()[-1])
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 3 and argv[0] == "_bench-child":
+        _bench_child(argv[1], argv[2])
+    elif argv and argv[0] == "bench":
+        count = int(argv[argv.index("--count") + 1]) if "--count" in argv else 100000
+        print(json.dumps(benchmark(count), ensure_ascii=False, indent=2))
+    elif len(argv) == 3 and argv[0] == "build":
+        with open(argv[1], "r", encoding="utf-8") as f:
+            problems = json.load(f)
+        count = write_pack(problems, argv[2])
+        print(f"문제 {count}개를 {argv[2]}에 저장했습니다. ({os.path.getsize(argv[1]):,} -> {os.path.getsize(argv[2]):,} 바이트)")
+    elif len(argv) == 3 and argv[0] == "unpack":
+        problems = [problem.materialize() for problem in ProblemPack(argv[1]).problems()]
+        with open(argv[2], "w", encoding="utf-8") as f:
+            json.dump(problems, f, ensure_ascii=False, indent=2)
+        print(f"문제 {len(problems)}개를 {argv[2]}로 내보냈습니다.")
+    else:
+        print("사용법: python problem_pack.py build <problems.json> <problems.nsdppack>\n"
+              "        python problem_pack.py unpack <problems.nsdppack> <problems.json>\n"
+              "        python problem_pack.py bench [--count N]")
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# problem_store.py (SQLite 기반 문제 저장소)
+#
+# problems.json을 통째로 읽는 대신, 문제 메타데이터와 테스트 케이스를 나눠 SQLite에 저장합니다.
+# 추천에 필요한 메타데이터만 먼저 읽고, 테스트 케이스는 실제로 고른 문제의 것만 필요할 때 가져옵니다.
+#
+# 사용 예:
+#   python problem_store.py import ../resources/problems.json ../resources/problems.db
+#   python problem_store.py export ../resources/problems.db exported.json
+import os
+import sys
+import json
+import sqlite3
+import threading
+
+DB_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+SCHEMA_VERSION = 1
+# problems 테이블의 열로 저장하는 항목. 나머지 항목(checker, generator 등)은 extra에 JSON으로 저장합니다.
+COLUMNS = ("id", "title", "description", "hint", "stars", "time_limit", "memory_limit")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS problems (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    title TEXT, description TEXT, hint TEXT, stars INTEGER, time_limit, memory_limit,
+    extra TEXT NOT NULL,
+    key_order TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_problems_stars ON problems(stars);
+CREATE INDEX IF NOT EXISTS idx_problems_position ON problems(position);
+CREATE TABLE IF NOT EXISTS problem_tags (
+    problem_id INTEGER NOT NULL REFERENCES problems(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (problem_id, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_problem_tags_tag ON problem_tags(tag);
+CREATE TABLE IF NOT EXISTS testcases (
+    problem_id INTEGER NOT NULL REFERENCES problems(id) ON DELETE CASCADE,
+    case_num INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (problem_id, case_num)
+);
+"""
+
+
+def hint_tags(hint):
+    """힌트 문자열("반복문, 입출력")을 태그 목록으로 나눕니다."""
+    if not hint:
+        return []
+    return [tag.strip() for tag in hint.split(",") if tag.strip()]
+
+
+class LazyProblem(dict):
+    """메타데이터만 담긴 문제 dict입니다. problem["testcases"]에 처음 접근할 때 저장소에서 읽어 옵니다.
+
+    일반 dict처럼 쓸 수 있으므로 load_problems를 쓰던 코드는 그대로 동작합니다.
+    """
+
+    def __init__(self, store, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._store = store
+
+    def __missing__(self, key):
+        if key != "testcases":
+            raise KeyError(key)
+        testcases = self._store.testcases(self["id"])
+        dict.__setitem__(self, "testcases", testcases)
+        return testcases
+
+    def __contains__(self, key):
+        return key == "testcases" or super().__contains__(key)
+
+    def get(self, key, default=None):
+        if key == "testcases":
+            return self["testcases"]
+        return super().get(key, default)
+
+    def materialize(self):
+        """테스트 케이스까지 모두 채운 일반 dict를 반환합니다. (다른 프로세스로 넘기거나 JSON으로 쓸 때)"""
+        self["testcases"]
+        return dict(self)
+
+    def __reduce__(self):
+        return dict, (self.materialize(),)
+
+
+class ProblemStore:
+    """문제 은행 SQLite 저장소입니다. 여러 스레드에서 써도 되도록 연결 하나를 잠금으로 보호합니다."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def get_meta(self, key, default=None):
+        rows = self._query("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0][0] if rows else default
+
+    # --- 가져오기 / 내보내기 ---
+    def import_problems(self, problems, source_signature=""):
+        """문제 목록(problems.json 형식)으로 저장소 내용을 통째로 바꿉니다."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM testcases")
+            self._conn.execute("DELETE FROM problem_tags")
+            self._conn.execute("DELETE FROM problems")
+            for position, problem in enumerate(problems):
+                extra = {k: v for k, v in problem.items() if k not in COLUMNS and k != "testcases"}
+                self._conn.execute(
+                    "INSERT INTO problems (id, position, title, description, hint, stars, time_limit, memory_limit, extra, key_order)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (problem["id"], position, *(problem.get(column) for column in COLUMNS[1:]),
+                     json.dumps(extra, ensure_ascii=False), json.dumps(list(problem.keys()), ensure_ascii=False)))
+                self._conn.executemany("INSERT OR IGNORE INTO problem_tags (problem_id, tag) VALUES (?, ?)",
+                                       [(problem["id"], tag) for tag in hint_tags(problem.get("hint"))])
+                self._conn.executemany("INSERT INTO testcases (problem_id, case_num, data) VALUES (?, ?, ?)",
+                                       [(problem["id"], i, json.dumps(case, ensure_ascii=False))
+                                        for i, case in enumerate(problem.get("testcases", []))])
+            self._conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                   [("schema_version", str(SCHEMA_VERSION)), ("source_signature", source_signature)])
+        return len(problems)
+
+    def import_json(self, json_path):
+        with open(json_path, "r", encoding="utf-8") as f:
+            problems = json.load(f)
+        return self.import_problems(problems, file_signature(json_path))
+
+    def export_problems(self):
+        """저장된 문제를 problems.json과 같은 형식(항목 순서 포함)의 목록으로 돌려줍니다."""
+        return [problem.materialize() for problem in self.all_problems()]
+
+    def export_json(self, json_path):
+        problems = self.export_problems()
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(problems, f, ensure_ascii=False, indent=2)
+        return len(problems)
+
+    # --- 조회 ---
+    def _problem_from_row(self, row):
+        problem_id, title, description, hint, stars, time_limit, memory_limit, extra, key_order = row
+        values = dict(zip(COLUMNS, (problem_id, title, description, hint, stars, time_limit, memory_limit)))
+        values.update(json.loads(extra))
+        # 원래 JSON의 항목 순서를 지키고, 원래 없던 항목은 만들지 않습니다.
+        return LazyProblem(self, ((key, values[key]) for key in json.loads(key_order) if key != "testcases"))
+
+    _SELECT = ("SELECT id, title, description, hint, stars, time_limit, memory_limit, extra, key_order FROM problems")
+
+    def all_problems(self):
+        """모든 문제의 메타데이터를 저장 순서대로 반환합니다. 테스트 케이스는 읽지 않습니다."""
+        return [self._problem_from_row(row) for row in self._query(self._SELECT + " ORDER BY position")]
+
+    def get(self, problem_id):
+        rows = self._query(self._SELECT + " WHERE id = ?", (problem_id,))
+        return self._problem_from_row(rows[0]) if rows else None
+
+    def testcases(self, problem_id):
+        rows = self._query("SELECT data FROM testcases WHERE problem_id = ? ORDER BY case_num", (problem_id,))
+        return [json.loads(data) for (data,) in rows]
+
+    def ids_by_stars(self, min_stars, max_stars):
+        return [row[0] for row in self._query(
+            "SELECT id FROM problems WHERE stars BETWEEN ? AND ? ORDER BY position", (min_stars, max_stars))]
+
+    def ids_by_tag(self, tag):
+        return [row[0] for row in self._query(
+            "SELECT problem_id FROM problem_tags WHERE tag = ? ORDER BY problem_id", (tag,))]
+
+    def count(self):
+        return self._query("SELECT COUNT(*) FROM problems")[0][0]
+
+
+def file_signature(path):
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_store(db_path):
+    """경로별로 하나씩 열어 둔 저장소를 반환합니다."""
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = _stores[db_path] = ProblemStore(db_path)
+        return store
+
+
+def store_for_json(json_path, db_path=None):
+    """problems.json 옆의 problems.db를 반환합니다. JSON이 바뀌었으면 먼저 다시 가져옵니다."""
+    db_path = db_path or os.path.splitext(json_path)[0] + ".db"
+    store = get_store(db_path)
+    signature = file_signature(json_path)
+    if store.get_meta("source_signature") != signature:
+        count = store.import_json(json_path)
+        print(f"[문제 저장소] {os.path.basename(json_path)}에서 문제 {count}개를 가져왔습니다.")
+    return store
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 3 or argv[0] not in ("import", "export"):
+        print("사용법: python problem_store.py import <problems.json> <problems.db>\n"
+              "        python problem_store.py export <problems.db> <problems.json>")
+        sys.exit(2)
+    command, source, target = argv
+    if command == "import":
+        with ProblemStore(target) as store:
+            print(f"문제 {store.import_json(source)}개를 {target}에 저장했습니다.")
+    else:
+        with ProblemStore(source) as store:
+            print(f"문제 {store.export_json(target)}개를 {target}로 내보냈습니다.")
+
+
+if __name__ == "__main__":
+    main()
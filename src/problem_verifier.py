@@ -0,0 +1,275 @@
+# problem_verifier.py (문제 은행 검증 / 중복 검사)
+#
+# 사용 예: python problem_verifier.py --jobs 4
+# problems.json의 모든 문제에 대해
+#   1) 형식 검사 (problem_importer.validate_problem)
+#   2) 정답 코드를 모든 테스트 케이스(숨은 테스트 포함)로 채점해 테스트 케이스가 맞는지 확인
+#   3) id 중복, 같은 테스트 케이스, 거의 같은 문제 설명 찾기
+# 를 하고 보고서(resources/verification_report.json)를 씁니다.
+#
+# 정답 코드는 문제의 "reference" 항목, resources/references/<id>.<확장자>, generator의 reference 순서로 찾습니다.
+# 문제 내용과 정답 코드가 바뀌지 않은 문제(지문 해시가 같은 문제)는 이전 보고서의 결과를 다시 씁니다.
+# 보고서에서 실패한 문제는 잠금 화면에 나오지 않습니다. (blocked_ids)
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import zlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import judge_io
+import judge_pool
+import languages
+from problem_importer import ProblemSchemaError, validate_problem
+
+REPORT_NAME = "verification_report.json"
+REFERENCE_DIR = "references"
+VERIFIER_VERSION = 1
+# 거의 같은 설명 찾기: 글자 5-gram의 MinHash 64개를 16개 밴드(4개씩)로 나눈 LSH
+SHINGLE_SIZE = 5
+MINHASH_COUNT = 64
+LSH_BANDS = 16
+NEAR_DUPLICATE_THRESHOLD = 0.8
+_MERSENNE = (1 << 61) - 1
+_MINHASH_PARAMS = [(int.from_bytes(hashlib.sha256(f"a{i}".encode()).digest()[:8], "big") % _MERSENNE or 1,
+                    int.from_bytes(hashlib.sha256(f"b{i}".encode()).digest()[:8], "big") % _MERSENNE)
+                   for i in range(MINHASH_COUNT)]
+# 실패로 보고 잠금 화면에서 빼는 상태
+BLOCKING_STATUSES = ("schema_error", "failed", "duplicate_id")
+# 다음 실행에서 재사용하지 않는 상태. 중복 id는 문제 은행 전체에 달린 결과이고,
+# judge_error(채점기 자체의 오류)는 문제 탓이 아니므로 잠금 화면에서 빼지 않고 다음에 다시 실행합니다.
+NOT_REUSED_STATUSES = ("duplicate_id", "judge_error")
+
+
+def reference_path(problem):
+    """문제의 정답 코드 경로입니다. 없으면 None."""
+    if problem.get("reference"):
+        return judge_io.testcase_path(problem["reference"])
+    for spec in languages.LANGUAGES.values():
+        for ext in spec["extensions"]:
+            path = judge_io.testcase_path(os.path.join(REFERENCE_DIR, f"{problem.get('id')}{ext}"))
+            if os.path.exists(path):
+                return path
+    generator = problem.get("generator")
+    if isinstance(generator, dict) and generator.get("reference"):
+        return judge_io.testcase_path(generator["reference"])
+    return None
+
+
+def _file_digest(path):
+    """파일 내용 해시입니다. 큰 테스트 파일도 메모리에 다 올리지 않도록 나눠 읽습니다."""
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(judge_io.CHUNK_SIZE), b""):
+                h.update(chunk)
+    except OSError:
+        return "missing"
+    return h.hexdigest()
+
+
+def fingerprint(problem, ref_path=None):
+    """문제 내용, 파일 케이스와 생성기, 정답 코드를 모두 반영한 지문입니다. 하나라도 바뀌면 다시 검증합니다."""
+    h = hashlib.sha256(f"v{VERIFIER_VERSION}\0".encode())
+    h.update(json.dumps(problem, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+    files = [case[key] for case in problem.get("testcases", []) if isinstance(case, dict)
+             for key in ("input_file", "output_file") if key in case]
+    generator = problem.get("generator")
+    if isinstance(generator, dict):
+        files += [generator[key] for key in ("script", "reference") if generator.get(key)]
+    for relative_path in files:
+        h.update(_file_digest(judge_io.testcase_path(relative_path)).encode())
+    if ref_path:
+        h.update(_file_digest(ref_path).encode())
+    return h.hexdigest()
+
+
+# --- 중복 검사 ---
+def _normalize(text):
+    """공백과 문장 부호를 지우고 소문자로 바꾼 설명입니다."""
+    return re.sub(r"[\W_]+", "", (text or "").lower())
+
+
+def _minhash(text):
+    shingles = {zlib.crc32(text[i:i + SHINGLE_SIZE].encode("utf-8")) for i in range(max(1, len(text) - SHINGLE_SIZE + 1))}
+    return [min((a * s + b) % _MERSENNE for s in shingles) for a, b in _MINHASH_PARAMS]
+
+
+def _testcase_digest(problem):
+    return hashlib.sha256(json.dumps(problem.get("testcases"), ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def find_duplicates(problems):
+    """id 중복, 테스트 케이스가 똑같은 문제, 설명이 (거의) 같은 문제를 찾습니다."""
+    by_id, by_tests = {}, {}
+    for index, problem in enumerate(problems):
+        by_id.setdefault(problem.get("id"), []).append(index)
+        by_tests.setdefault(_testcase_digest(problem), []).append(problem.get("id"))
+    duplicate_ids = [{"id": pid, "positions": positions} for pid, positions in by_id.items() if len(positions) > 1]
+    same_testcases = [ids for ids in by_tests.values() if len(ids) > 1]
+
+    # LSH: 밴드 하나라도 같은 문제들만 후보로 비교합니다.
+    signatures = [_minhash(_normalize(problem.get("description"))) for problem in problems]
+    rows = MINHASH_COUNT // LSH_BANDS
+    buckets, candidates = {}, set()
+    for index, signature in enumerate(signatures):
+        for band in range(LSH_BANDS):
+            key = (band, tuple(signature[band * rows:(band + 1) * rows]))
+            for other in buckets.setdefault(key, []):
+                candidates.add((other, index))
+            buckets[key].append(index)
+    near_duplicates = []
+    for a, b in sorted(candidates):
+        similarity = sum(x == y for x, y in zip(signatures[a], signatures[b])) / MINHASH_COUNT
+        if similarity >= NEAR_DUPLICATE_THRESHOLD:
+            near_duplicates.append({"ids": [problems[a].get("id"), problems[b].get("id")], "similarity": round(similarity, 3)})
+    return {"duplicate_ids": duplicate_ids, "same_testcases": same_testcases, "near_duplicates": near_duplicates}
+
+
+# --- 정답 코드 실행 ---
+def _init_worker():
+    # 프로세스마다 워커 풀을 띄우므로, 코어를 나눠 쓰도록 풀 크기를 줄입니다.
+    os.environ[judge_pool.POOL_SIZE_ENV] = "1"
+
+
+def run_reference(problem, ref_path):
+    """정답 코드로 문제를 채점합니다. 모든 케이스를 통과해야 테스트 케이스가 맞는 것입니다.
+
+    채점기나 생성기가 예외를 내거나 채점기 오류(is_judge_failure)가 나면 failed가 아니라 judge_error입니다.
+    """
+    from utils import check_solution, is_judge_failure
+    with open(ref_path, "r", encoding="utf-8") as f:
+        code = f.read()
+    language = languages.language_for_path(ref_path) or languages.DEFAULT_LANGUAGE
+    start = time.perf_counter()
+    try:
+        result = check_solution(problem, code, use_cache=False, language=language)
+    except Exception as e:
+        return {"status": "judge_error", "message": f"검증 중 오류: {e}",
+                "elapsed_ms": round((time.perf_counter() - start) * 1000)}
+    elapsed_ms = round((time.perf_counter() - start) * 1000)
+    if is_judge_failure(result):
+        return {"status": "judge_error", "message": result.get("stderr") or "채점기 오류", "elapsed_ms": elapsed_ms}
+    if isinstance(result, str) and result.startswith("정답"):
+        return {"status": "ok", "message": result, "elapsed_ms": elapsed_ms}
+    if isinstance(result, str):
+        return {"status": "failed", "message": f"정답 코드가 틀렸습니다: {result}", "elapsed_ms": elapsed_ms}
+    case = f"테스트 케이스 #{result['case_num']}: " if result.get("case_num") else ""
+    return {"status": "failed", "message": f"{case}{result['status']} {result.get('stderr', '')}".strip(),
+            "elapsed_ms": elapsed_ms}
+
+
+def load_report(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def verify_bank(problems, previous=None, jobs=None):
+    """문제 목록을 검증해 보고서(dict)를 반환합니다. previous 보고서에서 지문이 같은 문제는 다시 실행하지 않습니다."""
+    previous_results = {(r["id"], r["fingerprint"]): r for r in (previous or {}).get("problems", [])}
+    results, pending = [None] * len(problems), []
+    for index, problem in enumerate(problems):
+        ref_path = reference_path(problem)
+        record = {"id": problem.get("id"), "title": problem.get("title"), "fingerprint": fingerprint(problem, ref_path),
+                  "reference": ref_path and os.path.relpath(ref_path, judge_io.testcase_path(""))}
+        try:
+            validate_problem(problem)
+        except ProblemSchemaError as e:
+            results[index] = {**record, "status": "schema_error", "message": str(e)}
+            continue
+        reused = previous_results.get((record["id"], record["fingerprint"]))
+        if reused is not None and reused.get("status") not in NOT_REUSED_STATUSES:
+            results[index] = {**reused, "reused": True}
+        elif ref_path is None:
+            results[index] = {**record, "status": "no_reference", "message": "정답 코드가 없어 테스트 케이스를 확인하지 못했습니다."}
+        else:
+            results[index] = record
+            pending.append((index, problem, ref_path))
+
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    print(f"[문제 검증] 문제 {len(problems)}개 중 {len(pending)}개 실행 (이전 결과 재사용 {sum(1 for r in results if r.get('reused'))}개), "
+          f"프로세스 {jobs}개", file=sys.stderr)
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+            futures = {executor.submit(run_reference, problem, ref_path): index for index, problem, ref_path in pending}
+            for count, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                results[index] = {**results[index], **future.result(), "reused": False}
+                print(f"[{count}/{len(pending)}] {results[index]['id']}: {results[index]['status']}", file=sys.stderr)
+
+    duplicates = find_duplicates(problems)
+    # 같은 id가 여러 번 나오면 어느 쪽이 잠금 화면에 쓰일지 모르므로 모두 실패로 봅니다.
+    # 문제 자체의 결과가 아니므로 따로 상태를 두어, 중복을 없앤 뒤에는 재사용하지 않고 다시 검증합니다.
+    duplicate_ids = {entry["id"] for entry in duplicates["duplicate_ids"]}
+    for record in results:
+        if record["id"] in duplicate_ids:
+            record.update(status="duplicate_id", message=f"id {record['id']}이(가) 문제 은행에 여러 번 있습니다.")
+    statuses = {}
+    for record in results:
+        statuses[record["status"]] = statuses.get(record["status"], 0) + 1
+    return {"version": VERIFIER_VERSION, "summary": {"problems": len(problems), "statuses": statuses,
+                                                     "executed": len(pending)},
+            "problems": results, **duplicates}
+
+
+def blocked_ids(problems, report_path=None):
+    """보고서에서 실패한 문제 중, 그 뒤로 바뀌지 않은(지문이 같은) 문제의 id 집합입니다."""
+    if report_path is None:
+        report_path = judge_io.testcase_path(REPORT_NAME)
+    failed = {r["id"]: r["fingerprint"] for r in load_report(report_path).get("problems", [])
+              if r.get("status") in BLOCKING_STATUSES}
+    if not failed:
+        return set()
+    blocked = set()
+    for problem in problems:
+        if problem.get("id") in failed:
+            data = problem.materialize() if hasattr(problem, "materialize") else problem
+            if fingerprint(data, reference_path(data)) == failed[problem["id"]]:
+                blocked.add(problem["id"])
+    return blocked
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="문제 은행 검증 (정답 코드 실행, 형식 검사, 중복 검사)")
+    parser.add_argument("--problems", help="문제 파일 (기본: resources/problems.json)")
+    parser.add_argument("--report", help=f"보고서 경로 (기본: resources/{REPORT_NAME})")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="동시에 검증할 프로세스 수 (기본: 코어 수)")
+    parser.add_argument("--force", action="store_true", help="이전 결과를 재사용하지 않고 모두 다시 실행")
+    parser.add_argument("--strict", action="store_true", help="정답 코드가 없는 문제나 거의 같은 문제도 실패로 보고 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    problems_path = args.problems or judge_io.testcase_path("problems.json")
+    report_path = args.report or judge_io.testcase_path(REPORT_NAME)
+    # 중복 id를 찾아야 하므로 저장소를 거치지 않고 JSON을 그대로 읽습니다.
+    with open(problems_path, "r", encoding="utf-8") as f:
+        problems = json.load(f)
+    report = verify_bank(problems, None if args.force else load_report(report_path), args.jobs)
+    tmp_path = f"{report_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, report_path)
+
+    for record in report["problems"]:
+        if record["status"] != "ok":
+            print(f"  {record['id']} {record['title']}: {record['status']} - {record.get('message', '')}", file=sys.stderr)
+    for entry in report["same_testcases"]:
+        print(f"  테스트 케이스가 같은 문제: {entry}", file=sys.stderr)
+    for entry in report["near_duplicates"]:
+        print(f"  설명이 거의 같은 문제: {entry['ids']} (유사도 {entry['similarity']})", file=sys.stderr)
+    print(f"[문제 검증] {report['summary']['statuses']} -> {report_path}", file=sys.stderr)
+    statuses = report["summary"]["statuses"]
+    # 채점기 오류는 문제를 막지는 않지만 검증이 끝나지 않은 것이므로 종료 코드에는 반영합니다.
+    failing = sum(statuses.get(s, 0) for s in (*BLOCKING_STATUSES, "judge_error"))
+    if args.strict:
+        failing += statuses.get("no_reference", 0) + len(report["near_duplicates"]) + len(report["same_testcases"])
+    if failing:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+# rating.py (Elo 방식 실력 레이팅)
+#
+# 사용자 레이팅 하나와 문제별 난이도 추정치를 두고, 이벤트(정답, 오답 제출, 포기, 새로고침)마다
+# Elo 식으로 둘 다 O(1)에 갱신합니다. 정답 확률 P = 1 / (1 + 10^((난이도 - 레이팅) / 400)).
+# 아직 기록이 없는 문제의 난이도는 별점에서 정합니다. (별 1개 = 1000, 별마다 +150)
+#
+# 설정 파일에는 config["rating"] = {"user": [레이팅, 이벤트 수], "problems": {"<id>": [난이도, 이벤트 수]}}
+# 형태로 기록이 있는 문제만 저장합니다.
+#
+# 기존 풀이 기록으로 레이팅 다시 만들기: python rating.py replay [--write]
+import sys
+import math
+import json
+import bisect
+import random
+
+DEFAULT_RATING = 1000.0
+STAR_BASE = 1000.0
+STAR_STEP = 150.0
+MAX_STARS = 10
+# 추천할 문제의 예상 정답 확률 범위 (config["rating_band"]로 바꿀 수 있음)
+DEFAULT_BAND = (0.55, 0.8)
+# band 안에 문제가 없을 때 가까운 난이도에서 고를 후보 수
+NEAREST_CANDIDATES = 5
+USER_K = 32.0
+PROVISIONAL_K = 64.0      # 처음 PROVISIONAL_EVENTS번은 빨리 자리를 찾도록 크게 움직입니다.
+PROVISIONAL_EVENTS = 10
+PROBLEM_K = 24.0          # 문제 난이도는 기록이 쌓일수록 덜 움직입니다.
+# 이벤트별 (결과 점수, 반영 비율)
+EVENTS = {
+    "solve": (1.0, 1.0),
+    "wrong": (0.0, 0.5),     # 틀린 제출은 한 번 더 시도할 수 있으므로 절반만 반영
+    "give_up": (0.0, 1.0),
+    "refresh": (0.0, 0.25),  # 풀어 보지 않고 넘긴 것이라 약하게만 반영
+}
+# 이 시간 안에 풀면 온전한 정답, 그 뒤로는 SLOW_SOLVE_SECONDS까지 점수가 SLOW_SOLVE_SCORE로 줄어듭니다.
+FAST_SOLVE_SECONDS = 600
+SLOW_SOLVE_SECONDS = 3600
+SLOW_SOLVE_SCORE = 0.75
+
+
+def star_difficulty(stars):
+    """별점에 해당하는 기본 난이도입니다."""
+    return STAR_BASE + STAR_STEP * ((stars or 1) - 1)
+
+
+def expected_score(rating, difficulty):
+    return 1.0 / (1.0 + 10.0 ** ((difficulty - rating) / 400.0))
+
+
+def solve_score(elapsed_s):
+    """푸는 데 걸린 시간을 반영한 정답 점수입니다."""
+    if elapsed_s is None or elapsed_s <= FAST_SOLVE_SECONDS:
+        return 1.0
+    ratio = min(1.0, (elapsed_s - FAST_SOLVE_SECONDS) / (SLOW_SOLVE_SECONDS - FAST_SOLVE_SECONDS))
+    return 1.0 - (1.0 - SLOW_SOLVE_SCORE) * ratio
+
+
+class RatingEngine:
+    """사용자 레이팅과 문제별 난이도 추정치입니다."""
+
+    def __init__(self, rating=DEFAULT_RATING, events=0, problems=None):
+        self.rating = rating
+        self.events = events
+        self._problems = problems or {}  # 문제 id -> [난이도, 이벤트 수]
+
+    def difficulty(self, problem_id, stars=1):
+        entry = self._problems.get(problem_id)
+        return entry[0] if entry else star_difficulty(stars)
+
+    def expected(self, problem_id, stars=1):
+        """이 문제를 풀 확률 추정치입니다."""
+        return expected_score(self.rating, self.difficulty(problem_id, stars))
+
+    def record(self, event, problem_id, stars=1, elapsed_s=None):
+        """이벤트 하나를 반영하고 새 레이팅을 반환합니다."""
+        score, weight = EVENTS[event]
+        if event == "solve":
+            score = solve_score(elapsed_s)
+        difficulty, count = self._problems.get(problem_id) or (star_difficulty(stars), 0)
+        surprise = score - expected_score(self.rating, difficulty)
+        user_k = PROVISIONAL_K if self.events < PROVISIONAL_EVENTS else USER_K
+        self.rating += weight * user_k * surprise
+        self._problems[problem_id] = [difficulty - weight * PROBLEM_K / (1 + count / 10) * surprise, count + 1]
+        self.events += 1
+        return self.rating
+
+    def level(self):
+        """레이팅에 해당하는 별점 레벨입니다. (calculate_user_level과 같은 1~10 척도)"""
+        return max(1, min(MAX_STARS, round((self.rating - STAR_BASE) / STAR_STEP) + 1))
+
+    def difficulty_range(self, band=None):
+        """예상 정답 확률이 band = (낮은 쪽, 높은 쪽) 안에 드는 난이도 범위 (쉬운 쪽, 어려운 쪽)입니다."""
+        low, high = band or DEFAULT_BAND
+        to_difficulty = lambda p: self.rating + 400.0 * math.log10(1.0 / p - 1.0)
+        return to_difficulty(high), to_difficulty(low)
+
+    # --- 저장 ---
+    def to_dict(self):
+        return {"user": [round(self.rating, 1), self.events],
+                "problems": {str(pid): [round(d, 1), n] for pid, (d, n) in self._problems.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        rating, events = data.get("user", [DEFAULT_RATING, 0])
+        return cls(rating, events, {int(pid): list(entry) for pid, entry in data.get("problems", {}).items()})
+
+    def save_to(self, config):
+        config["rating"] = self.to_dict()
+
+    @classmethod
+    def from_config(cls, config, all_problems=(), history=None):
+        """config의 레이팅을 읽습니다. 아직 없으면 기존 풀이 기록으로 만듭니다."""
+        if "rating" in config:
+            return cls.from_dict(config["rating"])
+        return replay(config, all_problems, history)
+
+
+def replay(config, all_problems=(), history=None):
+    """풀이 기록(history_log.HistoryLog, 없으면 config의 solve_history / incorrect_history)으로 레이팅을 처음부터 다시 만듭니다.
+
+    예전 기록에는 시간 순서와 풀이 시간이 없으므로, 아직 못 푼 문제의 오답을 먼저 반영하고
+    풀이 기록을 순서대로 반영합니다.
+    """
+    stars_by_id = {p["id"]: p.get("stars", 1) for p in all_problems}
+    if history is not None:
+        solve_history, incorrect_history = history.solve_history, sorted(history.incorrect_ids)
+    else:
+        solve_history, incorrect_history = config.get("solve_history", []), config.get("incorrect_history", [])
+    engine = RatingEngine()
+    solved_ids = {item["id"] for item in solve_history}
+    for problem_id in incorrect_history:
+        if problem_id not in solved_ids:
+            engine.record("wrong", problem_id, stars_by_id.get(problem_id, 1))
+    for item in solve_history:
+        engine.record("solve", item["id"], item.get("stars", stars_by_id.get(item["id"], 1)))
+    return engine
+
+
+class RatingRecommender:
+    """풀지 않은 문제를 (난이도, id) 순으로 정렬해 두고, 예상 정답 확률이 band 안인 문제를 고릅니다.
+
+    RecommendationIndex와 같은 방식(mark_solved, sync_history, recommend)으로 씁니다.
+    band 안에 문제가 없으면 band 가운데에 가까운 난이도의 문제들 중 하나를, 다 풀었으면 None을 반환합니다.
+    """
+
+    def __init__(self, all_problems, engine, solve_history=(), band=None):
+        self.engine = engine
+        self.band = tuple(band or DEFAULT_BAND)
+        self.rebuild(all_problems, solve_history)
+
+    def rebuild(self, all_problems, solve_history=()):
+        self._problems = {p["id"]: p for p in all_problems}
+        self._solved = {item["id"] for item in solve_history}
+        self._history_len = len(solve_history)
+        self._keys = {pid: self.engine.difficulty(pid, p.get("stars", 1))
+                      for pid, p in self._problems.items() if pid not in self._solved}
+        self._sorted = sorted((difficulty, pid) for pid, difficulty in self._keys.items())
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def _remove(self, problem_id):
+        key = self._keys.pop(problem_id, None)
+        if key is not None:
+            del self._sorted[bisect.bisect_left(self._sorted, (key, problem_id))]
+
+    def mark_solved(self, problem_id):
+        self._solved.add(problem_id)
+        self._remove(problem_id)
+
+    def update(self, problem_id):
+        """엔진에서 이 문제의 난이도가 바뀌었을 때 호출해 정렬 위치를 고칩니다."""
+        problem = self._problems.get(problem_id)
+        if problem is None or problem_id in self._solved:
+            return
+        self._remove(problem_id)
+        key = self._keys[problem_id] = self.engine.difficulty(problem_id, problem.get("stars", 1))
+        bisect.insort(self._sorted, (key, problem_id))
+
+    def sync_history(self, solve_history):
+        if len(solve_history) < self._history_len:
+            self.rebuild(list(self._problems.values()), solve_history)
+            return
+        for item in solve_history[self._history_len:]:
+            self.mark_solved(item["id"])
+        self._history_len = len(solve_history)
+
+    def recommend(self, solve_history, rng=random, exclude=()):
+        """band 안의 문제 중 무작위로 고릅니다. exclude의 문제(방금 새로고침/포기한 문제)는 다른 후보가 있는 한 고르지 않습니다.
+
+        band 안에 문제가 없으면 band 가운데 난이도에 가까운 문제 NEAREST_CANDIDATES개 중에서 무작위로 고릅니다.
+        """
+        self.sync_history(solve_history)
+        print(f"[추천 시스템] 현재 레이팅: {self.engine.rating:.0f} (레벨 {self.engine.level()})")
+        if not self._sorted:
+            return None # 모든 문제를 다 푼 경우
+        easy, hard = self.engine.difficulty_range(self.band)
+        start = bisect.bisect_left(self._sorted, (easy, -math.inf))
+        end = bisect.bisect_right(self._sorted, (hard, math.inf))
+        excluded = sum(1 for pid in set(exclude) if pid in self._keys and easy <= self._keys[pid] <= hard)
+        if end - start > excluded:
+            while True:
+                problem_id = self._sorted[rng.randrange(start, end)][1]
+                if problem_id not in exclude:
+                    return self._problems[problem_id]
+        # band 안에 문제가 없으면 가운데 난이도에서 가까운 순서로 양쪽으로 넓혀 가며 후보를 모읍니다.
+        print("[추천 시스템] 목표 정답 확률에 맞는 문제가 없어, 가까운 난이도의 문제 중에서 추천합니다.")
+        center = (easy + hard) / 2
+        right = bisect.bisect_left(self._sorted, (center, -math.inf))
+        left = right - 1
+        candidates = []
+        while len(candidates) < NEAREST_CANDIDATES and (left >= 0 or right < len(self._sorted)):
+            if right >= len(self._sorted) or (left >= 0 and center - self._sorted[left][0] <= self._sorted[right][0] - center):
+                entry, left = self._sorted[left], left - 1
+            else:
+                entry, right = self._sorted[right], right + 1
+            if entry[1] not in exclude:
+                candidates.append(entry[1])
+        if not candidates:
+            # 남은 문제가 방금 넘긴 문제뿐입니다.
+            candidates = [pid for _, pid in self._sorted]
+        return self._problems[rng.choice(candidates)]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] != "replay":
+        print("사용법: python rating.py replay [--write]")
+        sys.exit(2)
+    from utils import load_config, load_problems, save_config, flush_config
+    from history_log import HistoryLog
+    config, problems = load_config(), load_problems()
+    engine = replay(config, problems, HistoryLog.from_config(config))
+    print(f"레이팅 {engine.rating:.1f} (레벨 {engine.level()}), 이벤트 {engine.events}개, 난이도 추정 문제 {len(engine._problems)}개")
+    for problem in problems:
+        print(f"  {problem['id']:>6} {problem.get('stars', 1):>2}★  난이도 {engine.difficulty(problem['id'], problem.get('stars', 1)):7.1f}"
+              f"  예상 정답 확률 {engine.expected(problem['id'], problem.get('stars', 1)):.2f}")
+    if "--write" in argv:
+        engine.save_to(config)
+        save_config(config)
+        flush_config()
+        print("config.json에 저장했습니다.")
+    else:
+        print(json.dumps(engine.to_dict(), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# recommendation.py (난이도별 버킷으로 문제 추천)
+#
+# recommend_problem은 매번 풀이 기록 전체로 집합을 만들고 문제 전체를 두 번 걸러냅니다.
+# RecommendationIndex는 풀지 않은 문제를 별점별 버킷에 미리 나눠 두고, 문제를 풀면 그 문제만
+# 버킷에서 빼므로(맨 뒤 항목과 자리를 바꿔 pop) 추천은 버킷 길이만 보고 바로 고를 수 있습니다.
+#
+# 벤치마크: python recommendation.py [--problems 100000] [--history 100000]
+import sys
+import time
+import random
+from utils import calculate_user_level
+
+
+class _Bucket:
+    """순서 없는 문제 목록입니다. 추가/삭제/무작위 선택이 모두 O(1)입니다."""
+
+    def __init__(self):
+        self.items = []
+        self.slots = {}  # 문제 id -> items 안의 위치
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, problem):
+        if problem["id"] not in self.slots:
+            self.slots[problem["id"]] = len(self.items)
+            self.items.append(problem)
+
+    def remove(self, problem_id):
+        slot = self.slots.pop(problem_id, None)
+        if slot is None:
+            return
+        last = self.items.pop()
+        if slot < len(self.items):
+            self.items[slot] = last
+            self.slots[last["id"]] = slot
+
+
+class RecommendationIndex:
+    """풀지 않은 문제를 별점별로 나눠 둔 추천 인덱스입니다.
+
+    recommend_problem과 같은 규칙으로 고릅니다: 레벨 ~ 레벨+1 별점의 문제 중 무작위,
+    없으면 풀지 않은 문제 전체 중 무작위, 모두 풀었으면 None.
+    level이 주어지면 사용자 레벨을 solve_history에서 다시 계산하지 않고 level()로 얻습니다.
+    (history_log.HistoryAggregates.level처럼 O(1)로 유지되는 값)
+    """
+
+    def __init__(self, all_problems, solve_history=(), level=None):
+        self._level = level
+        self.rebuild(all_problems, solve_history)
+
+    def rebuild(self, all_problems, solve_history=()):
+        """문제 은행이 통째로 바뀌었을 때 다시 만듭니다."""
+        self._problems = {p["id"]: p for p in all_problems}
+        self._solved = set()
+        self._history_len = 0
+        self._buckets = {}   # 별점 -> _Bucket
+        self._unsolved = _Bucket()
+        for problem in all_problems:
+            self._add_unsolved(problem)
+        self.sync_history(solve_history)
+
+    def _add_unsolved(self, problem):
+        self._buckets.setdefault(problem.get("stars", 1), _Bucket()).add(problem)
+        self._unsolved.add(problem)
+
+    def _remove_unsolved(self, problem):
+        bucket = self._buckets.get(problem.get("stars", 1))
+        if bucket is not None:
+            bucket.remove(problem["id"])
+        self._unsolved.remove(problem["id"])
+
+    def __len__(self):
+        """풀지 않은 문제 수입니다."""
+        return len(self._unsolved)
+
+    # --- 증분 갱신 ---
+    def mark_solved(self, problem_id):
+        if problem_id in self._solved:
+            return
+        self._solved.add(problem_id)
+        problem = self._problems.get(problem_id)
+        if problem is not None:
+            self._remove_unsolved(problem)
+
+    def sync_history(self, solve_history):
+        """지난번 이후 solve_history에 새로 붙은 기록만 반영합니다. 기록이 줄었으면 처음부터 다시 셉니다."""
+        if len(solve_history) < self._history_len:
+            self.rebuild(list(self._problems.values()), solve_history)
+            return
+        for item in solve_history[self._history_len:]:
+            self.mark_solved(item["id"])
+        self._history_len = len(solve_history)
+
+    def add_problem(self, problem):
+        """문제 은행에 문제가 추가(또는 수정)되었을 때 호출합니다."""
+        self.remove_problem(problem["id"])
+        self._problems[problem["id"]] = problem
+        if problem["id"] not in self._solved:
+            self._add_unsolved(problem)
+
+    def remove_problem(self, problem_id):
+        problem = self._problems.pop(problem_id, None)
+        if problem is not None and problem_id not in self._solved:
+            self._remove_unsolved(problem)
+
+    def update(self, problem_id):
+        """RatingRecommender와 같은 인터페이스입니다. 별점만 보므로 할 일이 없습니다."""
+
+    # --- 추천 ---
+    def recommend(self, solve_history, rng=random, exclude=()):
+        """사용자 레벨에 맞는 문제를 추천합니다. (recommend_problem과 같은 결과 분포)
+
+        exclude의 문제(방금 새로고침/포기한 문제)는 다른 후보가 있는 한 고르지 않습니다.
+        """
+        self.sync_history(solve_history)
+        user_level = self._level() if self._level else calculate_user_level(solve_history)
+        print(f"[추천 시스템] 현재 사용자 레벨: {user_level}")
+        if not self._unsolved:
+            return None # 모든 문제를 다 푼 경우
+
+        # 1순위: 현재 레벨과 같거나 +1 높은 문제 (별점 종류 수만큼만 봅니다)
+        buckets = [b for stars, b in self._buckets.items() if b and user_level <= stars <= user_level + 1]
+        problem = _draw(buckets, rng, exclude)
+        if problem is not None:
+            return problem
+
+        # 2순위: 후보가 없으면, 풀지 않은 문제 전체에서 선택
+        print("[추천 시스템] 적합한 난이도의 문제가 없어, 풀지 않은 모든 문제 중에서 추천합니다.")
+        return _draw([self._unsolved], rng, exclude) or self._unsolved.items[rng.randrange(len(self._unsolved))]
+
+
+def _draw(buckets, rng, exclude=()):
+    """버킷들을 합친 것에서 exclude에 없는 문제를 무작위로 고릅니다. 없으면 None."""
+    total = sum(len(b) for b in buckets)
+    excluded = sum(1 for pid in set(exclude) for b in buckets if pid in b.slots)
+    if total <= excluded:
+        return None
+    while True:
+        pick = rng.randrange(total)
+        for bucket in buckets:
+            if pick < len(bucket):
+                problem = bucket.items[pick]
+                break
+            pick -= len(bucket)
+        if problem["id"] not in exclude:
+            return problem
+
+
+# --- 벤치마크 ---
+def benchmark(problem_count=100000, history_count=100000, repeat=20):
+    import io
+    import contextlib
+    from utils import recommend_problem
+    rng = random.Random(0)
+    problems = [{"id": i, "title": f"문제 {i}", "stars": rng.randint(1, 5)} for i in range(problem_count)]
+    # 기록은 앞쪽 절반의 문제를 반복해서 푼 것으로 만듭니다. (뒤쪽 절반은 풀지 않은 채로 남음)
+    solved_range = max(1, problem_count // 2)
+    solve_history = [{"id": i % solved_range, "stars": problems[i % solved_range]["stars"]} for i in range(history_count)]
+    results = {"problems": len(problems), "history": len(solve_history)}
+
+    def timed(fn):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                fn()
+        return round((time.perf_counter() - start) / repeat * 1000, 4)
+
+    start = time.perf_counter()
+    index = RecommendationIndex(problems, solve_history)
+    results["index_build_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    results["recommend_problem_ms"] = timed(lambda: recommend_problem(problems, solve_history))
+    results["index_recommend_ms"] = timed(lambda: index.recommend(solve_history))
+
+    def solve_one():
+        problem = index.recommend(solve_history)
+        solve_history.append({"id": problem["id"], "stars": problem["stars"]})
+    results["index_solve_and_recommend_ms"] = timed(solve_one)
+    return results
+
+
+if __name__ == "__main__":
+    def _arg(name, default):
+        return int(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+    for key, value in benchmark(_arg("--problems", 100000), _arg("--history", 100000)).items():
+        print(f"{key}: {value}")
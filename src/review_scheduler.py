@@ -0,0 +1,119 @@
+# review_scheduler.py (틀린 문제 간격 반복 복습)
+#
+# 틀리거나 포기한 문제를 SM-2와 비슷한 간격으로 다시 보여줍니다.
+# 틀리면 RELEARN_SECONDS 뒤에 다시 나오고, 맞힐 때마다 1일 -> 6일 -> (이전 간격 x 쉬움 계수)로 간격이 늘어납니다.
+# 복습에서 연속으로 GRADUATE_REPS번 맞히면 복습 대상에서 빠집니다.
+# 다음 복습 시각은 힙에 넣어 두므로 갱신과 "지금 복습할 문제" 찾기가 O(log n)입니다.
+#
+# 설정 파일에는 config["review_schedule"] = {"<id>": [다음 복습 시각, 간격(초), 쉬움 계수, 연속 정답 수]}로 저장합니다.
+import time
+import heapq
+
+DAY = 24 * 60 * 60
+RELEARN_SECONDS = 10 * 60   # 틀린 뒤 다시 보여줄 때까지
+SNOOZE_SECONDS = 10 * 60    # 복습 문제를 새로고침으로 넘겼을 때 미루는 시간
+FIRST_INTERVAL = 1 * DAY
+SECOND_INTERVAL = 6 * DAY
+GRADUATE_REPS = 3
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# 이벤트별 SM-2 응답 품질 (0~5, 3 이상이 정답)
+QUALITY = {"solve": 4, "wrong": 1, "give_up": 0}
+
+
+class ReviewScheduler:
+    """문제 id별 복습 일정과, 다음 복습 시각 순서의 힙입니다.
+
+    일정이 바뀌면 힙에 새 항목을 넣고, 예전 항목은 꺼낼 때 일정과 시각이 다르면 버립니다.
+    """
+
+    def __init__(self, schedule=None):
+        self._schedule = schedule or {}  # 문제 id -> [다음 복습 시각, 간격, 쉬움 계수, 연속 정답 수]
+        self._heap = [(entry[0], pid) for pid, entry in self._schedule.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._schedule)
+
+    def __contains__(self, problem_id):
+        return problem_id in self._schedule
+
+    def _set(self, problem_id, due, interval, ease, reps):
+        self._schedule[problem_id] = [due, interval, ease, reps]
+        heapq.heappush(self._heap, (due, problem_id))
+
+    def record(self, event, problem_id, now=None):
+        """문제에 대한 이벤트(solve, wrong, give_up, refresh)로 일정을 갱신합니다.
+
+        복습 대상이 아닌 문제를 맞힌 것은 무시합니다. (처음부터 맞힌 문제는 복습하지 않음)
+        연속 정답 수가 GRADUATE_REPS가 되면 일정에서 지웁니다.
+        """
+        now = time.time() if now is None else now
+        entry = self._schedule.get(problem_id)
+        if event == "refresh":
+            if entry is not None:
+                self._set(problem_id, now + SNOOZE_SECONDS, *entry[1:])
+            return
+        quality = QUALITY[event]
+        if entry is None:
+            if quality >= 3:
+                return
+            entry = [now, 0, DEFAULT_EASE, 0]
+        _, interval, ease, reps = entry
+        # SM-2 쉬움 계수 갱신
+        ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        if quality < 3:
+            reps, interval = 0, RELEARN_SECONDS
+        else:
+            reps += 1
+            if reps >= GRADUATE_REPS:
+                self.remove(problem_id)
+                return
+            interval = FIRST_INTERVAL if reps == 1 else SECOND_INTERVAL if reps == 2 else round(interval * ease)
+        self._set(problem_id, now + interval, interval, round(ease, 2), reps)
+
+    def remove(self, problem_id):
+        self._schedule.pop(problem_id, None)
+
+    def _peek(self, valid_ids=None):
+        """일정이 가장 이른 문제 (id, 시각). 힙 맨 위의 낡은 항목과 valid_ids에 없는 문제는 정리합니다."""
+        while self._heap:
+            due, problem_id = self._heap[0]
+            entry = self._schedule.get(problem_id)
+            if entry is None or entry[0] != due:
+                heapq.heappop(self._heap)
+            elif valid_ids is not None and problem_id not in valid_ids:
+                heapq.heappop(self._heap)
+                del self._schedule[problem_id]
+            else:
+                return problem_id, due
+        return None, None
+
+    def next_due(self, now=None, valid_ids=None):
+        """지금 복습할 때가 된 문제 중 가장 오래 기다린 문제의 id입니다. 없으면 None."""
+        now = time.time() if now is None else now
+        problem_id, due = self._peek(valid_ids)
+        return problem_id if due is not None and due <= now else None
+
+    def next_due_at(self, valid_ids=None):
+        """다음 복습 시각입니다. 복습할 문제가 없으면 None. (때가 되기 전의 문제는 내지 않습니다)"""
+        return self._peek(valid_ids)[1]
+
+    # --- 저장 ---
+    def to_dict(self):
+        return {str(pid): [round(due), interval, ease, reps] for pid, (due, interval, ease, reps) in self._schedule.items()}
+
+    def save_to(self, config):
+        config["review_schedule"] = self.to_dict()
+
+    @classmethod
+    def from_config(cls, config, now=None, incorrect_ids=None):
+        """config의 복습 일정을 읽습니다. 일정이 없는 오답 문제(incorrect_ids, 없으면 config의 incorrect_history)는
+        지금 바로 복습할 문제로 넣습니다."""
+        now = time.time() if now is None else now
+        schedule = {int(pid): list(entry) for pid, entry in config.get("review_schedule", {}).items()}
+        if incorrect_ids is None:
+            incorrect_ids = config.get("incorrect_history", [])
+        for problem_id in incorrect_ids:
+            schedule.setdefault(problem_id, [round(now), 0, DEFAULT_EASE, 0])
+        return cls(schedule)
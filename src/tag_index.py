@@ -0,0 +1,211 @@
+# tag_index.py (hint 태그 역색인)
+#
+# 문제의 hint("문자열, 반복문")를 태그로 나눠 정규화하고, 태그 -> 문제 id 목록(정렬) 역색인을 만듭니다.
+# 태그 AND/OR 조건과 별점 범위를 조합해 문제를 고를 수 있어, 설정의 연습 범위
+#   config["practice_filter"] = {"all": ["그래프"], "any": ["dp", "bfs"], "min_stars": 4, "max_stars": 6}
+# 에 맞는 문제만 잠금 화면에 낼 수 있습니다.
+#
+# 벤치마크: python tag_index.py [--problems 100000]
+import re
+import sys
+import time
+import bisect
+import random
+import unicodedata
+from functools import lru_cache
+from problem_store import hint_tags
+
+# 같은 뜻의 다른 표기를 하나로 모읍니다. (정규화한 뒤의 표기 기준)
+TAG_ALIASES = {
+    "dp": "다이나믹 프로그래밍",
+    "동적 계획법": "다이나믹 프로그래밍",
+    "bfs": "너비 우선 탐색",
+    "dfs": "깊이 우선 탐색",
+    "그래프": "그래프 이론",
+    "입출력": "기본 입출력",
+    "문자열 처리": "문자열",
+    "반복": "반복문",
+}
+
+
+@lru_cache(maxsize=4096)
+def normalize_tag(tag):
+    """유니코드 정규화(NFC), 소문자, 공백 정리 후 별칭을 대표 태그로 바꿉니다."""
+    tag = re.sub(r"\s+", " ", unicodedata.normalize("NFC", tag)).strip().lower()
+    return TAG_ALIASES.get(tag, tag)
+
+
+@lru_cache(maxsize=4096)
+def _hint_to_tags(hint):
+    return frozenset(normalize_tag(tag) for tag in hint_tags(hint))
+
+
+def problem_tags(problem):
+    # 같은 힌트 문자열이 많이 반복되므로 힌트 단위로 캐시합니다.
+    return _hint_to_tags(problem.get("hint") or "")
+
+
+class TagIndex:
+    """태그 -> 정렬된 문제 id 목록 역색인입니다.
+
+    조회용으로 태그마다 별점별 id 집합도 함께 두어, 교집합/합집합을 집합 연산으로 한 번에 계산합니다.
+    """
+
+    def __init__(self, all_problems=()):
+        self._postings = {}   # 태그 -> 정렬된 id 목록
+        self._members = {}    # 태그 -> id 집합
+        self._by_stars = {}   # 태그 -> {별점: id 집합}
+        self._all_by_stars = {}  # 별점 -> id 집합 (태그 조건이 없을 때)
+        self._tags = {}       # 문제 id -> 태그 집합
+        self._stars = {}      # 문제 id -> 별점
+        self._all = []        # 정렬된 모든 id
+        self._build(all_problems)
+
+    def __len__(self):
+        return len(self._all)
+
+    def _build(self, all_problems):
+        """처음 한 번은 모두 모은 뒤 정렬합니다. (하나씩 넣는 것보다 빠릅니다)"""
+        # 같은 id가 여러 번 있으면 마지막 것을 씁니다.
+        for problem in {problem["id"]: problem for problem in all_problems}.values():
+            self._insert(problem, sort=False)
+        self._all.sort()
+        for posting in self._postings.values():
+            posting.sort()
+
+    def _insert(self, problem, sort=True):
+        problem_id = problem["id"]
+        stars = problem.get("stars", 1)
+        tags = problem_tags(problem)
+        self._tags[problem_id] = tags
+        self._stars[problem_id] = stars
+        add = bisect.insort if sort else list.append
+        add(self._all, problem_id)
+        self._all_by_stars.setdefault(stars, set()).add(problem_id)
+        for tag in tags:
+            add(self._postings.setdefault(tag, []), problem_id)
+            self._members.setdefault(tag, set()).add(problem_id)
+            self._by_stars.setdefault(tag, {}).setdefault(stars, set()).add(problem_id)
+
+    # --- 증분 갱신 ---
+    def add_problem(self, problem):
+        """문제를 색인에 넣습니다. 이미 있는 id면 태그/별점을 바꿉니다."""
+        self.remove_problem(problem["id"])
+        self._insert(problem)
+
+    def remove_problem(self, problem_id):
+        tags = self._tags.pop(problem_id, None)
+        if tags is None:
+            return
+        stars = self._stars.pop(problem_id)
+        del self._all[bisect.bisect_left(self._all, problem_id)]
+        self._discard(self._all_by_stars, stars, problem_id)
+        for tag in tags:
+            posting = self._postings[tag]
+            del posting[bisect.bisect_left(posting, problem_id)]
+            self._members[tag].discard(problem_id)
+            self._discard(self._by_stars[tag], stars, problem_id)
+            if not posting:
+                del self._postings[tag], self._members[tag], self._by_stars[tag]
+
+    @staticmethod
+    def _discard(buckets, stars, problem_id):
+        bucket = buckets[stars]
+        bucket.discard(problem_id)
+        if not bucket:
+            del buckets[stars]
+
+    # --- 조회 ---
+    def tags(self):
+        """태그별 문제 수입니다. (많은 순)"""
+        return sorted(((tag, len(ids)) for tag, ids in self._postings.items()), key=lambda item: (-item[1], item[0]))
+
+    def _in_range(self, buckets, low, high):
+        """별점 범위 안의 id 집합입니다. 별점 종류는 몇 개뿐이라 버킷을 합치기만 하면 됩니다."""
+        sets = [ids for stars, ids in buckets.items() if low <= stars <= high]
+        if len(sets) == 1:
+            return sets[0]
+        return set().union(*sets)
+
+    def query(self, all_of=(), any_of=(), min_stars=None, max_stars=None):
+        """조건에 맞는 문제 id를 정렬해서 반환합니다.
+
+        all_of의 태그를 모두 가지고, any_of가 있으면 그중 하나 이상을 가지며, 별점이 범위 안인 문제입니다.
+        가장 작은 집합에서 시작해 나머지와 교집합을 구하므로 비용은 결과 쪽 크기를 따라갑니다.
+        """
+        all_of = {normalize_tag(tag) for tag in all_of}
+        requested_any = {normalize_tag(tag) for tag in any_of}
+        any_of = {tag for tag in requested_any if tag in self._members}
+        if any(tag not in self._members for tag in all_of) or (requested_any and not any_of):
+            return []
+        ranged = min_stars is not None or max_stars is not None
+        low = float("-inf") if min_stars is None else min_stars
+        high = float("inf") if max_stars is None else max_stars
+
+        if not all_of and not any_of:
+            if not ranged:
+                return list(self._all)
+            return sorted(self._in_range(self._all_by_stars, low, high))
+        if len(all_of) + len(any_of) == 1 and not ranged:
+            return list(self._postings[next(iter(all_of or any_of))])
+
+        def tag_set(tag):
+            return self._in_range(self._by_stars[tag], low, high) if ranged else self._members[tag]
+
+        if all_of:
+            ordered = sorted(all_of, key=lambda tag: len(self._members[tag]))
+            result = tag_set(ordered[0])
+            for tag in ordered[1:]:
+                result = result & self._members[tag]
+                if not result:
+                    return []
+            if any_of:
+                # OR 쪽이 크더라도 이미 줄어든 결과만 훑습니다.
+                any_sets = [self._members[tag] for tag in any_of]
+                result = {pid for pid in result if any(pid in members for members in any_sets)}
+        else:
+            result = set().union(*(tag_set(tag) for tag in any_of))
+        return sorted(result)
+
+    def query_filter(self, practice_filter):
+        """설정의 practice_filter(dict)로 조회합니다. 비어 있으면 None (제한 없음)."""
+        if not practice_filter:
+            return None
+        return self.query(practice_filter.get("all", ()), practice_filter.get("any", ()),
+                          practice_filter.get("min_stars"), practice_filter.get("max_stars"))
+
+
+# --- 벤치마크 ---
+def benchmark(problem_count=100000, repeat=200):
+    rng = random.Random(0)
+    vocabulary = ["구현", "수학", "문자열", "반복문", "그래프 이론", "다이나믹 프로그래밍", "그리디", "정렬", "이분 탐색",
+                  "너비 우선 탐색", "깊이 우선 탐색", "트리", "자료 구조", "브루트포스", "시뮬레이션", "백트래킹",
+                  "최단 경로", "분할 정복", "비트마스킹", "누적 합", "두 포인터", "해시", "스택", "큐", "우선순위 큐",
+                  "유니온 파인드", "세그먼트 트리", "기하학", "정수론", "조합론"]
+    problems = [{"id": i, "stars": rng.randint(1, 10), "hint": ", ".join(rng.sample(vocabulary, rng.randint(1, 3)))}
+                for i in range(problem_count)]
+    start = time.perf_counter()
+    index = TagIndex(problems)
+    results = {"problems": problem_count, "tags": len(index.tags()), "build_ms": round((time.perf_counter() - start) * 1000, 1)}
+    queries = {
+        "and_2_tags": dict(all_of=["그래프", "dp"]),
+        "and_2_tags_stars_4_6": dict(all_of=["그래프", "dp"], min_stars=4, max_stars=6),
+        "or_2_tags_stars_4_6": dict(any_of=["그래프", "dp"], min_stars=4, max_stars=6),
+        "and_3_tags": dict(all_of=["그래프", "dp", "트리"]),
+    }
+    for name, query in queries.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            found = index.query(**query)
+        results[name] = {"ms": round((time.perf_counter() - start) / repeat * 1000, 4), "results": len(found)}
+    start = time.perf_counter()
+    for i in range(repeat):
+        index.add_problem({"id": problem_count + i, "stars": 5, "hint": "그래프, DP"})
+    results["add_problem_ms"] = round((time.perf_counter() - start) / repeat * 1000, 4)
+    return results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[sys.argv.index("--problems") + 1]) if "--problems" in sys.argv else 100000
+    for key, value in benchmark(count).items():
+        print(f"{key}: {value}")
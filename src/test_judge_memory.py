@@ -0,0 +1,52 @@
+# test_judge_memory.py (무거운 부모 프로세스에서 채점했을 때 메모리 측정 확인)
+#
+# GUI처럼 메모리를 많이 쓰는 프로세스에서 워커 풀을 만들어도, 맞는 코드가 메모리 초과로 나오지 않는지 확인합니다.
+# 실행: python test_judge_memory.py   (pytest로도 실행할 수 있습니다)
+import shutil
+import judge_pool
+from judge_workspace import JudgeWorkspace
+
+PARENT_MB = 150
+MEMORY_LIMIT_MB = 128
+
+PYTHON_CODE = "a, b = map(int, input().split())\nprint(a + b)\n"
+C_CODE = '#include <stdio.h>\nint main(void) { int a, b; scanf("%d %d", &a, &b); printf("%d\\n", a + b); return 0; }\n'
+
+
+def _heavy_parent():
+    # 실제로 RSS에 올라가도록 페이지마다 한 번씩 씁니다.
+    ballast = bytearray(PARENT_MB * 1024 * 1024)
+    for i in range(0, len(ballast), 4096):
+        ballast[i] = 1
+    return ballast
+
+
+def _judge(pool, code, language):
+    with JudgeWorkspace(code, language=language) as workspace:
+        return pool.run(workspace, "1 2", 5, MEMORY_LIMIT_MB)
+
+
+def test_heavy_parent_does_not_cause_memory_limit_exceeded():
+    if not judge_pool.is_supported():
+        print("워커 풀을 쓸 수 없는 환경이라 건너뜁니다.")
+        return
+    ballast = _heavy_parent()
+    pool = judge_pool.JudgeWorkerPool(1)
+    try:
+        cases = [("python", PYTHON_CODE)]
+        if shutil.which("gcc"):
+            cases.append(("c", C_CODE))
+        for language, code in cases:
+            result = _judge(pool, code, language)
+            assert result["status"] == "success", (language, result)
+            assert result["output"] == "3", (language, result)
+            assert result["memory_kb"] < PARENT_MB * 1024, (language, result)
+            print(f"{language}: {result['memory_kb']}KB (부모 {PARENT_MB}MB)")
+    finally:
+        pool.close()
+        del ballast
+
+
+if __name__ == "__main__":
+    test_heavy_parent_does_not_cause_memory_limit_exceeded()
+    print("통과")
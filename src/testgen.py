@@ -0,0 +1,144 @@
+# testgen.py (생성기 기반 숨은 테스트 케이스)
+#
+# problems.json의 문제에 다음과 같이 generator를 지정하면 큰 숨은 테스트를 만들어 채점에 더합니다.
+#   "generator": {"script": "generators/10950_gen.py", "reference": "generators/10950_ref.py",
+#                 "seeds": [1, 2, 3], "args": ["100000"]}
+# 생성기는 `gen.py <seed> <args...>`로 실행되어 입력을 stdout에 쓰고, 기대 출력은 그 입력으로
+# 정답 코드(reference)를 실행해서 얻습니다. 만든 파일은 디스크에 캐시되어 다음 채점부터 재사용됩니다.
+import os
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import judge_io
+import languages
+from judge_workspace import JudgeWorkspace
+
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "nsdp_generated_tests")
+GENERATOR_TIME_LIMIT = 10
+GENERATOR_MEMORY_LIMIT = 1024
+GENERATOR_OUTPUT_LIMIT_MB = 256
+
+_problem_locks = {}
+_problem_locks_guard = threading.Lock()
+_prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nsdp-testgen")
+
+
+class GenerationError(Exception):
+    """생성기나 정답 코드가 실패해서 숨은 테스트를 만들 수 없을 때 발생합니다."""
+
+
+def _read_script(relative_path):
+    path = judge_io.testcase_path(relative_path)
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read(), languages.language_for_path(path) or languages.DEFAULT_LANGUAGE
+
+
+def _sha256(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:32]
+
+
+def _seeds(spec):
+    seeds = spec.get("seeds", [1])
+    if isinstance(seeds, int):
+        return list(range(1, seeds + 1))
+    return list(seeds)
+
+
+def _lock_for(key):
+    with _problem_locks_guard:
+        return _problem_locks.setdefault(key, threading.Lock())
+
+
+def _run_to_file(workspace, path, argv=(), input_path=None):
+    """workspace의 코드를 실행해 stdout을 path에 씁니다. 임시 파일에 쓴 뒤 교체하므로 반쯤 쓴 파일이 남지 않습니다."""
+    from utils import run_testcase  # utils가 이 모듈을 import 하므로 순환을 피해 여기서 가져옵니다.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        result = run_testcase(workspace, "", GENERATOR_TIME_LIMIT, GENERATOR_MEMORY_LIMIT, input_path=input_path,
+                              output_path=tmp_path, output_limit_mb=GENERATOR_OUTPUT_LIMIT_MB, argv=[str(a) for a in argv])
+        if result["status"] != "success":
+            raise GenerationError(f"{os.path.basename(path)} 생성 실패 ({result['status']}): {result.get('stderr', '')}".strip())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path): os.remove(tmp_path)
+
+
+def hidden_cases(problem, parallel=None):
+    """문제의 숨은 테스트 케이스를 (필요하면 만들어서) 파일 케이스 목록으로 반환합니다.
+
+    generator가 없는 문제는 빈 목록입니다. 같은 생성기/시드의 입력과 같은 정답 코드의 출력은
+    한 번만 만들고, 여러 시드는 parallel개씩 동시에 만듭니다. 채점 스레드에서 호출해야 합니다.
+    """
+    spec = problem.get("generator")
+    if not spec:
+        return []
+    generator_code, generator_language = _read_script(spec["script"])
+    reference_code, reference_language = _read_script(spec["reference"])
+    args = spec.get("args", [])
+    generator_hash = _sha256(generator_language, generator_code, *args)
+    reference_hash = _sha256(reference_language, reference_code)
+    case_dir = os.path.join(CACHE_DIR, generator_hash)
+    cases = [{"input_file": os.path.join(case_dir, f"{seed}.in"),
+              "output_file": os.path.join(case_dir, f"{reference_hash}_{seed}.out"),
+              "hidden": True, "seed": seed} for seed in _seeds(spec)]
+    missing = [case for case in cases if not os.path.exists(case["output_file"])]
+    if not missing:
+        return cases
+
+    with _lock_for((generator_hash, reference_hash)):
+        missing = [case for case in missing if not os.path.exists(case["output_file"])]
+        if not missing:
+            return cases
+        os.makedirs(case_dir, exist_ok=True)
+        print(f"[숨은 테스트] {problem.get('id')}번 문제: {len(missing)}개 생성 중...")
+        with JudgeWorkspace(generator_code, generator_language) as generator, \
+                JudgeWorkspace(reference_code, reference_language) as reference:
+            for workspace, role in ((generator, "생성기"), (reference, "정답 코드")):
+                if workspace.compile_error:
+                    raise GenerationError(f"{role} 컴파일 실패: {workspace.compile_error}")
+
+            def build(case):
+                if not os.path.exists(case["input_file"]):
+                    _run_to_file(generator, case["input_file"], argv=[case["seed"], *args])
+                _run_to_file(reference, case["output_file"], input_path=case["input_file"])
+
+            if parallel is None:
+                from utils import default_parallelism
+                parallel = default_parallelism()
+            with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+                # list()로 모두 기다리면서 첫 예외를 그대로 올려 보냅니다.
+                list(executor.map(build, missing))
+    return cases
+
+
+def case_count(problem):
+    """공개 + 숨은 테스트 케이스 수입니다. (숨은 테스트를 만들지 않고 셉니다)"""
+    spec = problem.get("generator")
+    return len(problem["testcases"]) + (len(_seeds(spec)) if spec else 0)
+
+
+def with_hidden_cases(problem):
+    """공개 테스트 케이스 뒤에 숨은 테스트 케이스를 붙인 문제 사본을 반환합니다."""
+    hidden = hidden_cases(problem)
+    if not hidden:
+        return problem
+    return {**problem, "testcases": list(problem["testcases"]) + hidden}
+
+
+def prefetch(problem):
+    """문제가 화면에 나오면 미리 숨은 테스트를 만들어 둡니다. 백그라운드 스레드에서 돌아 UI를 막지 않습니다."""
+    if not problem or not problem.get("generator"):
+        return None
+
+    def run():
+        try:
+            hidden_cases(problem)
+        except Exception as e:
+            print(f"[숨은 테스트] {problem.get('id')}번 문제 미리 생성 실패: {e}")
+
+    return _prefetch_executor.submit(run)
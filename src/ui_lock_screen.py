@@ -1,11 +1,22 @@
 # ui_lock_screen.py (자체 코드 에디터 구현 버전)
 import customtkinter as ctk
 from tkinter import messagebox
-import random
+import time
 from datetime import date
-from utils import load_problems, check_solution, load_config, save_config, recommend_problem
+from utils import load_problems, load_config, save_config, format_usage, default_parallelism, is_judge_failure
+from recommendation import RecommendationIndex
+from rating import RatingEngine, RatingRecommender
+from review_scheduler import ReviewScheduler
+from problem_verifier import blocked_ids
+from tag_index import TagIndex
+from history_log import HistoryLog
+from utils import CASE_TABLE_HEADER, format_case_row, format_summary
+from judge_async import submit_solution
+import judge_io
+import languages
+import testgen
 from pygments import lex
-from pygments.lexers import PythonLexer
+from pygments.lexers import get_lexer_by_name
 
 # --- 디자인 시스템 색상 및 폰트 정의 ---
 class Theme:
@@ -18,6 +29,10 @@ class Theme:
     STAR_COLOR = "#FFC300"
     FONT_FAMILY = "Malgun Gothic"
 
+# 채점 진행 이벤트의 status를 콘솔에 보여줄 문구
+STATUS_TEXT = {"wrong_answer": "오답", "timeout": "시간 초과", "memory_limit_exceeded": "메모리 초과",
+               "output_limit_exceeded": "출력 초과", "error": "에러", "compile_error": "컴파일 에러"}
+
 # ▼▼▼ 우리만의 새로운 코드 에디터 위젯 ▼▼▼
 class CodeEditor(ctk.CTkFrame):
     def __init__(self, master, language="python", **kwargs):
@@ -37,7 +52,7 @@ class CodeEditor(ctk.CTkFrame):
         self.code_text.bind("<KeyRelease>", self.on_key_release)
         self.code_text.bind("<Return>", self.on_return)
         
-        self.lexer = PythonLexer()
+        self.set_language(language, highlight=False)
         self.tag_colors = {
             "Token.Keyword": "#cc7832",
             "Token.Name.Builtin": "#9876aa",
@@ -51,6 +66,13 @@ class CodeEditor(ctk.CTkFrame):
         for token, color in self.tag_colors.items():
             self.code_text.tag_config(str(token), foreground=color)
 
+    def set_language(self, language, highlight=True):
+        """구문 강조에 쓸 렉서를 언어에 맞게 바꿉니다."""
+        self.language = language
+        self.lexer = get_lexer_by_name(languages.get_language(language)["lexer"])
+        if highlight:
+            self.highlight_syntax()
+
     def on_key_release(self, event=None):
         self.update_line_numbers()
         self.highlight_syntax()
@@ -63,7 +85,7 @@ class CodeEditor(ctk.CTkFrame):
             previous_line = self.code_text.get(f"{current_line_number-1}.0", f"{current_line_number-1}.end")
             indentation = len(previous_line) - len(previous_line.lstrip())
             
-            if previous_line.strip().endswith(":"):
+            if previous_line.strip().endswith(":" if self.language == "python" else "{"):
                 indentation += 4
                 
             self.code_text.insert(tk.INSERT, " " * indentation)
@@ -117,6 +139,11 @@ class CodeEditor(ctk.CTkFrame):
     def delete(self, start="1.0", end="end"):
         self.code_text.delete(start, end)
         self.on_key_release()
+
+    def set_text(self, text):
+        self.code_text.delete("1.0", "end")
+        self.code_text.insert("1.0", text)
+        self.on_key_release()
 # ▲▲▲ 우리만의 새로운 코드 에디터 위젯 ▲▲▲
 
 class LockScreenApp:
@@ -139,10 +166,43 @@ class LockScreenApp:
         self.solved_count = 0
         self.points = self.config.get("user_points", 0)
         self.all_problems = load_problems()
-        self.is_review_mode = False
+        # 검증 보고서(problem_verifier.py)에서 실패한 문제는 잘못된 테스트 케이스로 포인트를 잃지 않도록 내지 않습니다.
+        blocked = blocked_ids(self.all_problems)
+        if blocked: self.all_problems = [p for p in self.all_problems if p["id"] not in blocked]
+        # 기본은 레이팅으로 예상 정답 확률이 목표 범위인 문제를, "stars"면 예전처럼 별점 레벨로 추천합니다.
+        # 풀이 기록은 history.log에 이벤트로 남깁니다. 예전 config의 기록은 처음 열 때 옮깁니다.
+        had_legacy_history = "solve_history" in self.config or "incorrect_history" in self.config
+        self.history = HistoryLog.from_config(self.config)
+        if had_legacy_history: save_config(self.config)
+        self.rating = RatingEngine.from_config(self.config, self.all_problems, self.history)
+        # 설정의 연습 범위(태그/별점)가 있으면 그 안의 문제만 냅니다. 맞는 문제가 없으면 전체에서 냅니다.
+        practice_filter = self.config.get("practice_filter")
+        if practice_filter:
+            allowed = TagIndex(self.all_problems).query_filter(practice_filter)
+            if allowed:
+                allowed = set(allowed)
+                self.all_problems = [p for p in self.all_problems if p["id"] in allowed]
+            else:
+                print(f"연습 범위 {practice_filter}에 맞는 문제가 없어 전체 문제에서 출제합니다.")
+        if self.config.get("recommend_mode", "rating") == "stars":
+            self.recommender = RecommendationIndex(self.all_problems, self.history.solve_history,
+                                                   level=self.history.aggregates.level)
+        else:
+            self.recommender = RatingRecommender(self.all_problems, self.rating, self.history.solve_history,
+                                                 band=self.config.get("rating_band"))
+        self.problem_started_at = time.monotonic()
+        # 틀린 문제는 복습 일정에 따라 새 문제 사이사이에 다시 나옵니다.
+        self.problems_by_id = {p["id"]: p for p in self.all_problems}
+        self.reviews = ReviewScheduler.from_config(self.config, incorrect_ids=self.history.incorrect_ids)
+        self.is_review_problem = False
+        self.skipped_problem_id = None   # 방금 새로고침/포기한 문제 (바로 다시 내지 않습니다)
         self.refresh_confirm_pending = False
         self.give_up_confirm_pending = False
         self.action_button_reset_timer = None
+        self.judge_job = None
+        self.judged_case_count = 0
+        self.language = self.config.get("language", languages.DEFAULT_LANGUAGE)
+        if self.language not in languages.LANGUAGES: self.language = languages.DEFAULT_LANGUAGE
         loading_frame.destroy()
         self.setup_ui()
         self.load_new_problem()
@@ -180,7 +240,7 @@ class LockScreenApp:
         editor_console_frame.pack(pady=10, padx=40, fill="both", expand=True)
 
         # ▼▼▼ CTkCodeBox 대신 우리가 만든 CodeEditor 사용 ▼▼▼
-        self.code_editor = CodeEditor(editor_console_frame, fg_color=Theme.CONSOLE_BG, corner_radius=10, border_width=1, border_color=Theme.GRAY_DARK)
+        self.code_editor = CodeEditor(editor_console_frame, language=self.language, fg_color=Theme.CONSOLE_BG, corner_radius=10, border_width=1, border_color=Theme.GRAY_DARK)
         self.code_editor.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         self.output_console = ctk.CTkTextbox(editor_console_frame, font=("Courier New", 14), corner_radius=10, fg_color=Theme.CONSOLE_BG, border_width=1, border_color=Theme.GRAY_DARK)
@@ -193,6 +253,11 @@ class LockScreenApp:
         self.result_label.pack(side="left", expand=True)
         button_container = ctk.CTkFrame(bottom_frame, fg_color="transparent")
         button_container.pack(side="right")
+        self.language_menu = ctk.CTkOptionMenu(button_container, values=[spec["name"] for spec in languages.LANGUAGES.values()],
+                                               command=self.on_language_change, font=(Theme.FONT_FAMILY, 14), height=40,
+                                               fg_color=Theme.GRAY_DARK, button_color=Theme.GRAY_DARK, button_hover_color=Theme.DEEP_BLUE)
+        self.language_menu.set(languages.get_language(self.language)["name"])
+        self.language_menu.pack(side="left", padx=(0, 20))
         self.refresh_button = ctk.CTkButton(button_container, text="새로고침 (2P)", command=self.on_refresh, font=(Theme.FONT_FAMILY, 16), height=40, fg_color=Theme.GRAY_DARK, hover_color=Theme.DEEP_BLUE, corner_radius=8)
         self.refresh_button.pack(side="left", padx=(0, 5))
         self.give_up_button = ctk.CTkButton(button_container, text="문제 포기 (10P)", command=self.on_give_up, font=(Theme.FONT_FAMILY, 16), height=40, fg_color=Theme.GRAY_DARK, hover_color=Theme.DEEP_BLUE, corner_radius=8)
@@ -201,64 +266,163 @@ class LockScreenApp:
         self.submit_button.pack(side="left")
         self.root.bind("<Control-f>", self.on_force_solve)
 
+    def on_language_change(self, name):
+        language = languages.language_by_name(name)
+        if language == self.language: return
+        # 아직 아무것도 작성하지 않았으면 새 언어의 기본 코드로 바꿔 줍니다.
+        user_code = self.code_editor.get("1.0", "end-1c")
+        previous_template = languages.get_language(self.language)["template"]
+        self.language = language
+        self.code_editor.set_language(language)
+        if not user_code.strip() or user_code == previous_template:
+            self.code_editor.set_text(languages.get_language(language)["template"])
+        self.config["language"] = language
+        save_config(self.config)
+
     # ... (on_submit, load_new_problem 등 나머지 함수는 이전과 동일)
     def on_submit(self):
         self.reset_action_buttons()
         user_code = self.code_editor.get("1.0", "end-1c")
         if not self.problem or not user_code.strip(): return
+        self.cancel_judging()
         self.output_console.configure(state="normal")
         self.output_console.delete("1.0", "end")
-        result = check_solution(self.problem, user_code)
+        self.output_console.configure(state="disabled")
+        self.judged_case_count = 0
+        self.result_label.configure(text="채점 중...", text_color="white")
+        self.submit_button.configure(state="disabled")
+        # 채점은 백그라운드에서 돌고, 진행 상황은 root.after로 UI 스레드에 넘겨 받습니다.
+        # 이벤트가 어느 채점에서 왔는지 함께 넘깁니다. job은 submit_solution이 돌아온 뒤에 정해지므로 리스트에 담아 두고
+        # UI 스레드에서 꺼냅니다. (root.after 콜백은 on_submit이 끝난 뒤에 불리므로 그때는 항상 채워져 있습니다)
+        submitted = []
+        self.judge_job = submit_solution(self.problem, user_code,
+                                         on_event=lambda event: self.root.after(0, lambda: self.on_judge_event(event, submitted[0])),
+                                         parallel=default_parallelism(), language=self.language)
+        submitted.append(self.judge_job)
+        self.judge_job.add_done_callback(lambda job: self.root.after(0, self.on_judge_done, job))
+
+    def cancel_judging(self):
+        if self.judge_job is not None:
+            self.judge_job.cancel()
+            self.judge_job = None
+            self.submit_button.configure(state="normal")
+
+    def on_judge_event(self, event, job):
+        # 취소되었거나 다른 제출로 바뀐 채점에서 늦게 도착한 이벤트는 버립니다.
+        if job is not self.judge_job: return
+        if event["type"] == "compiled":
+            # 컴파일 언어만 컴파일 시간을 실행 시간과 따로 보여줍니다. (실패는 최종 결과에서 표시)
+            if event["ok"] and languages.get_language(event["language"])["compile"]:
+                compile_text = "캐시 사용" if event["cached"] else f"{event['compile_ms']}ms"
+                self.append_console(f"컴파일 완료 ({compile_text})\n")
+            return
+        if event["type"] == "summary":
+            if event["cases"]: self.append_console(f"\n{format_summary(event)}\n")
+            return
+        case_num = event["case_num"]
+        if event["type"] == "started":
+            self.result_label.configure(text=f"채점 중... (#{case_num} 실행)", text_color="white")
+            return
+        # 케이스 결과는 한 줄씩 표로 쌓습니다. (병렬 채점이면 끝난 순서대로)
+        if self.judged_case_count == 0:
+            self.append_console(CASE_TABLE_HEADER + "\n")
+        self.judged_case_count += 1
+        status_text = "통과" if event["type"] == "passed" else STATUS_TEXT.get(event["status"], event["status"])
+        self.append_console(format_case_row(case_num, status_text, event) + "\n")
+        self.result_label.configure(text=f"채점 중... ({self.judged_case_count}/{testgen.case_count(self.problem)})")
+
+    def append_console(self, text):
+        self.output_console.configure(state="normal")
+        self.output_console.insert("end", text)
+        self.output_console.configure(state="disabled")
+
+    def on_judge_done(self, job):
+        # 새로고침/포기 등으로 취소되었거나 이미 다른 제출로 바뀐 채점 결과는 무시합니다.
+        if job is not self.judge_job or job.cancelled: return
+        self.judge_job = None
+        self.submit_button.configure(state="normal")
+        try:
+            result = job.result()
+        except Exception as e:
+            result = {"status": "error", "stderr": str(e), "case_num": self.judged_case_count + 1}
+        self.show_judge_result(result)
+
+    def show_judge_result(self, result):
+        self.output_console.configure(state="normal")
+        if self.judged_case_count:
+            self.output_console.insert("end", "\n")
         if isinstance(result, str):
             if "정답" in result:
+                self.output_console.insert("end", result)
                 self.handle_correct_answer()
             else:
                 self.result_label.configure(text="")
-                self.output_console.insert("1.0", result)
-                incorrect_ids = set(self.config.get("incorrect_history", []))
-                incorrect_ids.add(self.problem["id"])
-                self.config["incorrect_history"] = list(incorrect_ids)
+                self.output_console.insert("end", result)
+                self.record_attempt("wrong")
                 save_config(self.config)
         elif isinstance(result, dict):
             self.result_label.configure(text="")
             error_text = ""
-            if result["status"] == "error": error_text = f'테스트 케이스 #{result["case_num"]} 에서 에러 발생:\n\n{result["stderr"]}'
-            elif result["status"] == "timeout": error_text = f'테스트 케이스 #{result["case_num"]} 에서 시간 초과!'
-            elif result["status"] == "memory_limit_exceeded": error_text = f'테스트 케이스 #{result["case_num"]} 에서 메모리 초과!'
-            self.output_console.insert("1.0", error_text)
-            incorrect_ids = set(self.config.get("incorrect_history", []))
-            incorrect_ids.add(self.problem["id"])
-            self.config["incorrect_history"] = list(incorrect_ids)
+            if is_judge_failure(result):
+                # 제출 코드의 잘못이 아니므로 오답으로 기록하지 않습니다.
+                self.output_console.insert("end", f'채점 중 오류가 발생했습니다. 다시 제출해 주세요.\n\n{result["stderr"]}')
+                self.output_console.configure(state="disabled")
+                return
+            if result["status"] == "compile_error": error_text = f'컴파일 에러:\n\n{result["stderr"]}'
+            elif result["status"] == "error": error_text = f'테스트 케이스 #{result["case_num"]} 에서 에러 발생:\n\n{result["stderr"]}'
+            elif result["status"] == "timeout":
+                kind = {"cpu": " (CPU 시간)", "wall": " (실행 시간)"}.get(result.get("limit"), "")
+                error_text = f'테스트 케이스 #{result["case_num"]} 에서 시간 초과{kind}! {format_usage(result)}'
+            elif result["status"] == "memory_limit_exceeded": error_text = f'테스트 케이스 #{result["case_num"]} 에서 메모리 초과! {format_usage(result)}'
+            elif result["status"] == "output_limit_exceeded": error_text = f'테스트 케이스 #{result["case_num"]} 에서 출력 초과! {format_usage(result)}'
+            elif result["status"] == "cancelled":
+                self.output_console.configure(state="disabled")
+                return
+            self.output_console.insert("end", error_text)
+            # 컴파일 에러는 문제를 풀 실력과 상관이 적으므로 오답 기록에만 남기고 레이팅에 반영하지 않습니다.
+            self.record_attempt("wrong", rated=result["status"] != "compile_error")
             save_config(self.config)
         self.output_console.configure(state="disabled")
 
     def load_new_problem(self):
         self.reset_action_buttons()
+        self.cancel_judging()
         self.output_console.configure(state="normal")
         self.output_console.delete("1.0", "end")
         self.output_console.configure(state="disabled")
-        if not self.is_review_mode:
-            self.problem = recommend_problem(self.all_problems, self.config.get("solve_history", []))
+        # 복습할 때가 된 문제가 있으면 먼저 냅니다. 때가 되지 않은 복습 문제는 내지 않습니다.
+        review_id = self.reviews.next_due(valid_ids=self.problems_by_id)
+        self.is_review_problem = review_id is not None
+        if self.is_review_problem:
+            self.problem = self.problems_by_id[review_id]
         else:
-            incorrect_ids = self.config.get("incorrect_history", [])
-            review_problems = [p for p in self.all_problems if p["id"] in incorrect_ids]
-            self.problem = random.choice(review_problems) if review_problems else None
+            exclude = () if self.skipped_problem_id is None else (self.skipped_problem_id,)
+            self.problem = self.recommender.recommend(self.history.solve_history, exclude=exclude)
+        self.skipped_problem_id = None
         if not self.problem:
-            incorrect_ids = self.config.get("incorrect_history", [])
-            if incorrect_ids and not self.is_review_mode:
-                self.is_review_mode = True
-                self.problem_label.configure(text="모든 문제를 해결했습니다! 이제 틀렸던 문제에 다시 도전하세요.")
-                self.root.after(2000, self.load_new_problem)
+            self.submit_button.configure(state="disabled")
+            self.refresh_button.configure(state="disabled")
+            self.give_up_button.configure(state="disabled")
+            due_at = self.reviews.next_due_at(valid_ids=self.problems_by_id)
+            if due_at is not None:
+                self.problem_label.configure(text=f"모든 문제를 해결했습니다! 다음 복습은 {time.strftime('%m월 %d일 %H:%M', time.localtime(due_at))}에 열립니다.")
+                # 복습 시각이 되면 다시 확인합니다. (after는 너무 먼 시간을 받지 않으므로 최대 1시간마다)
+                wait_ms = int(min(max(due_at - time.time(), 1), 60 * 60) * 1000)
+                self.root.after(wait_ms, self.load_new_problem)
             else:
                 self.problem_label.configure(text="완벽합니다! 모든 문제를 마스터했습니다. 축하합니다!")
-                self.submit_button.configure(state="disabled")
-                self.refresh_button.configure(state="disabled")
-                self.give_up_button.configure(state="disabled")
             return
+        self.submit_button.configure(state="normal")
+        self.refresh_button.configure(state="normal")
+        self.give_up_button.configure(state="normal")
+        self.problem_started_at = time.monotonic()
+        # 숨은 테스트가 있는 문제면 풀이하는 동안 백그라운드에서 미리 만들어 둡니다.
+        testgen.prefetch(self.problem)
         stars = self.problem.get('stars', 1)
         points = stars * 2
         self.difficulty_label.configure(text="★" * stars)
-        self.problem_label.configure(text=f"{self.problem['title']} ({points}P)\n\n{self.problem['description']}")
+        review_tag = "[복습] " if self.is_review_problem else ""
+        self.problem_label.configure(text=f"{review_tag}{self.problem['title']} ({points}P)\n\n{self.problem['description']}")
         time_limit = self.problem.get("time_limit", 5)
         mem_limit = self.problem.get("memory_limit", 128)
         self.limits_label.configure(text=f"제한: {time_limit}초, {mem_limit}MB")
@@ -269,16 +433,29 @@ class LockScreenApp:
         self.input_example_box.delete("1.0", "end")
         self.output_example_box.delete("1.0", "end")
         if self.problem['testcases']:
-            input_text = self.problem['testcases'][0]['input']
-            output_text = self.problem['testcases'][0]['output']
+            input_text = judge_io.sample_text(self.problem['testcases'][0], "input")
+            output_text = judge_io.sample_text(self.problem['testcases'][0], "output")
             self.input_example_box.insert("1.0", f"> Input\n---\n{input_text}")
             self.output_example_box.insert("1.0", f"> Output\n---\n{output_text}")
         self.input_example_box.configure(state="disabled")
         self.output_console.configure(state="disabled")
-        self.code_editor.delete("1.0", "end")
+        self.code_editor.set_text(languages.get_language(self.language)["template"])
         self.result_label.configure(text="")
         self.update_status()
 
+    def record_attempt(self, event, rated=True):
+        """현재 문제에 대한 이벤트를 풀이 기록에 남기고, rated면 레이팅과 복습 일정에도 반영합니다.
+        레이팅과 복습 일정은 뒤이은 save_config에서 함께 저장됩니다."""
+        if not self.problem: return
+        self.history.record(event, self.problem["id"], self.problem.get("stars", 1))
+        if not rated: return
+        elapsed = time.monotonic() - self.problem_started_at if event == "solve" else None
+        self.rating.record(event, self.problem["id"], self.problem.get("stars", 1), elapsed)
+        self.rating.save_to(self.config)
+        self.recommender.update(self.problem["id"])
+        self.reviews.record(event, self.problem["id"])
+        self.reviews.save_to(self.config)
+
     def handle_correct_answer(self, is_give_up=False):
         if not self.problem: return
         self.reset_action_buttons()
@@ -290,13 +467,9 @@ class LockScreenApp:
             gain = stars * 2
             self.points += gain
             self.config["user_points"] = self.points
-            solved_ids = {item['id'] for item in self.config.get("solve_history", [])}
-            if self.problem["id"] not in solved_ids:
-                self.config.get("solve_history", []).append({"id": self.problem["id"], "stars": stars})
-            incorrect_ids = set(self.config.get("incorrect_history", []))
-            if self.problem["id"] in incorrect_ids:
-                incorrect_ids.remove(self.problem["id"])
-                self.config["incorrect_history"] = list(incorrect_ids)
+            # 풀이 기록(푼 문제 집합, 오답 목록)은 record_attempt가 history.log에 남기면서 함께 갱신합니다.
+            self.recommender.mark_solved(self.problem["id"])
+            self.record_attempt("solve")
             result_text = f"정답입니다! {gain}P 획득!"
         self.update_status()
         if self.solved_count >= self.target_solve_count:
@@ -319,6 +492,9 @@ class LockScreenApp:
             self.root.after(2000, lambda: self.result_label.configure(text=""))
             return
         if self.refresh_confirm_pending:
+            self.cancel_judging()
+            self.record_attempt("refresh")
+            if self.problem: self.skipped_problem_id = self.problem["id"]
             self.points -= cost
             self.config["user_points"] = self.points
             save_config(self.config)
@@ -336,6 +512,9 @@ class LockScreenApp:
             self.root.after(2000, lambda: self.result_label.configure(text=""))
             return
         if self.give_up_confirm_pending:
+            self.cancel_judging()
+            self.record_attempt("give_up")
+            if self.problem: self.skipped_problem_id = self.problem["id"]
             self.points -= cost
             self.config["user_points"] = self.points
             save_config(self.config)
@@ -359,4 +538,5 @@ class LockScreenApp:
         self.status_label.configure(text=f"성공: {self.solved_count} / {self.target_solve_count}")
         self.points_label.configure(text=f"포인트: {self.points}P")
     def on_force_solve(self, event=None):
+        self.cancel_judging()
         self.handle_correct_answer()
\ No newline at end of file
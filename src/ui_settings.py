@@ -3,10 +3,9 @@ import customtkinter as ctk
 from tkinter import messagebox
 import winreg
 import os
-import json
 import winshell
 from itertools import chain
-from utils import load_config
+from utils import load_config, save_config, flush_config
 
 # ... (get_installed_apps 함수 등은 이전과 동일)
 def get_installed_apps():
@@ -124,10 +123,41 @@ class SettingsWindow:
         self.solve_count_spinbox = ctk.CTkEntry(frame)
         self.solve_count_spinbox.insert(0, self.config.get("unlock_condition", {}).get("value", 1))
         self.solve_count_spinbox.pack(anchor="w")
-        
+
+        # 연습 범위: 힌트 태그와 별점으로 잠금 화면에 나올 문제를 좁힙니다. (비워 두면 전체)
+        practice_filter = self.config.get("practice_filter", {})
+        ctk.CTkLabel(frame, text="연습 범위 - 모두 포함할 태그 (쉼표로 구분):").pack(anchor="w", pady=(20, 5))
+        self.filter_all_entry = ctk.CTkEntry(frame, width=300)
+        self.filter_all_entry.insert(0, ", ".join(practice_filter.get("all", [])))
+        self.filter_all_entry.pack(anchor="w")
+        ctk.CTkLabel(frame, text="연습 범위 - 하나라도 포함할 태그 (예: 그래프, DP):").pack(anchor="w", pady=(10, 5))
+        self.filter_any_entry = ctk.CTkEntry(frame, width=300)
+        self.filter_any_entry.insert(0, ", ".join(practice_filter.get("any", [])))
+        self.filter_any_entry.pack(anchor="w")
+        ctk.CTkLabel(frame, text="연습 범위 - 별점 (최소 ~ 최대):").pack(anchor="w", pady=(10, 5))
+        stars_row = ctk.CTkFrame(frame, fg_color="transparent")
+        stars_row.pack(anchor="w")
+        self.filter_min_entry = ctk.CTkEntry(stars_row, width=60)
+        self.filter_min_entry.insert(0, practice_filter.get("min_stars", ""))
+        self.filter_min_entry.pack(side="left")
+        ctk.CTkLabel(stars_row, text=" ~ ").pack(side="left")
+        self.filter_max_entry = ctk.CTkEntry(stars_row, width=60)
+        self.filter_max_entry.insert(0, practice_filter.get("max_stars", ""))
+        self.filter_max_entry.pack(side="left")
+
         ctk.CTkButton(frame, text="저장", command=self.save_settings).pack(anchor="w", pady=20)
         return frame
 
+    def read_practice_filter(self):
+        """연습 범위 입력을 config["practice_filter"] 형식으로 바꿉니다. 모두 비었으면 None."""
+        practice_filter = {}
+        for key, entry in (("all", self.filter_all_entry), ("any", self.filter_any_entry)):
+            tags = [tag.strip() for tag in entry.get().split(",") if tag.strip()]
+            if tags: practice_filter[key] = tags
+        for key, entry in (("min_stars", self.filter_min_entry), ("max_stars", self.filter_max_entry)):
+            if entry.get().strip(): practice_filter[key] = int(entry.get())
+        return practice_filter or None
+
     def create_app_lock_frame(self):
         frame = ctk.CTkFrame(self.window, fg_color="transparent")
         ctk.CTkLabel(frame, text="앱 잠금 설정", font=ctk.CTkFont(size=18, weight="bold")).pack(anchor="w")
@@ -159,6 +189,13 @@ class SettingsWindow:
     def save_settings(self):
         # 일반 설정 저장
         self.config["unlock_condition"]["value"] = int(self.solve_count_spinbox.get())
+        try:
+            practice_filter = self.read_practice_filter()
+        except ValueError:
+            messagebox.showerror("저장 실패", "연습 범위의 별점은 숫자로 입력해주세요.")
+            return
+        if practice_filter: self.config["practice_filter"] = practice_filter
+        else: self.config.pop("practice_filter", None)
         
         # 앱 잠금 설정 저장
         blocked_apps = []
@@ -171,8 +208,9 @@ class SettingsWindow:
         self.config["daily_unlock_enabled"] = self.daily_unlock_var.get() == "on"
 
         try:
-            with open("config.json", "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            # 잠금 화면과 같은 저장소로 저장하고, 오류를 바로 알리도록 기다렸다가 닫습니다.
+            save_config(self.config)
+            flush_config()
             messagebox.showinfo("저장 완료", "설정이 성공적으로 저장되었습니다.\n(앱 잠금 등 일부 기능은 재시작해야 적용됩니다)")
             self.window.destroy()
         except Exception as e:
@@ -1,4 +1,7 @@
+import copy
 import json
+import logging
+import sqlite3
 import subprocess
 import os
 import threading
@@ -6,6 +9,32 @@ import psutil
 import time
 import random
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import judge_pool
+import judge_limits
+import judge_io
+import languages
+import testgen
+import problem_store
+import problem_index
+import problem_pack
+from judge_workspace import JudgeWorkspace
+from checkers import CheckerError, OutputChecker
+from verdict_cache import VerdictCache
+from file_cache import FileCache
+import config_store
+
+# NSDP_DEBUG=1 로 실행하면 리소스 경로 같은 디버그 로그를 출력합니다.
+logger = logging.getLogger("nsdp")
+if os.environ.get("NSDP_DEBUG"):
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("DEBUG: %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.DEBUG)
+
+# config.json, problems.json을 파일이 바뀌었을 때만 다시 읽기 위한 캐시
+_file_cache = FileCache()
 
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -15,68 +44,192 @@ def resource_path(relative_path):
         base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
         
     final_path = os.path.join(base_path, "resources", relative_path)
-    
-    # ▼▼▼ 디버깅을 위한 print 구문 추가 ▼▼▼
-    print(f"DEBUG: Accessing resource at -> {final_path}")
-    
+    logger.debug("Accessing resource at -> %s", final_path)
     return final_path
 
 # ... 이하 모든 함수는 이전과 동일합니다 ...
+PROBLEM_BACKEND_ENV = "NSDP_PROBLEM_BACKEND"
+
 def load_problems(filepath="problems.json"):
+    """문제 목록을 불러옵니다. 테스트 케이스는 problem["testcases"]에 처음 접근할 때 저장소에서 읽습니다.
+
+    .nsdppack 파일(또는 problems.json이 없고 problems.nsdppack만 있으면)이면 압축 문제 팩을,
+    .db 파일이면 그 SQLite 저장소를, JSON이면 옆에 만든 problems.db를 (JSON이 바뀌었으면 다시 가져와서) 씁니다.
+    환경 변수 NSDP_PROBLEM_BACKEND=index이면 DB 없이 JSON 옆의 메타데이터 인덱스(problems.json.idx)를 씁니다.
+    파일이 바뀌지 않았으면 이전에 읽은 목록을 그대로 씁니다.
+    반환하는 목록은 사본이라 항목을 빼거나 더해도 되지만, 안의 문제 dict는 모든 호출이 함께 쓰는 캐시이므로
+    읽기만 해야 합니다. 문제를 고쳐야 하면 copy.deepcopy(problem)(지연 로딩 문제는 problem.materialize())를 쓰세요.
+    """
+    path = resource_path(filepath)
+    if not os.path.exists(path):
+        # problems.json 대신 문제 팩(problem_pack.py)만 배포한 경우
+        packed = os.path.splitext(path)[0] + problem_pack.PACK_SUFFIX
+        if os.path.exists(packed): path = packed
+    return list(_file_cache.get(path, _read_problems))
+
+def _read_problems(path):
     try:
-        with open(resource_path(filepath), "r", encoding="utf-8") as f:
+        if path.endswith(problem_pack.PACK_SUFFIX):
+            return problem_pack.load_pack(path)
+        if path.endswith(problem_store.DB_SUFFIXES):
+            return problem_store.get_store(path).all_problems()
+        if os.environ.get(PROBLEM_BACKEND_ENV) == "index":
+            return problem_index.ProblemIndex.open(path).problems()
+        return problem_store.store_for_json(path).all_problems()
+    except FileNotFoundError: return []
+    except (sqlite3.Error, OSError) as e:
+        print(f"문제 저장소를 사용할 수 없어 JSON을 직접 읽습니다: {e}")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError: return []
 
+def _read_config(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def load_config(filepath="config.json"):
+    """설정을 불러옵니다. 파일이 바뀌지 않았으면 다시 파싱하지 않고, 호출한 쪽이 고쳐도 되도록 사본을 반환합니다."""
+    path = resource_path(filepath)
+    # 아직 파일에 쓰지 않은 저장 내용이 있으면 그것이 최신입니다.
+    pending = config_store.get_store(path, on_written=_config_written).pending()
+    if pending is not None:
+        return copy.deepcopy(pending)
     try:
-        with open(resource_path(filepath), "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"unlock_condition": {"mode": "count", "value": 1}, "blocked_apps": [], "user_points": 0, 
-                "daily_unlock_enabled": True, "last_completion_date": "", "solve_history": [], "incorrect_history": []}
+        return copy.deepcopy(_file_cache.get(path, _read_config))
+    except FileNotFoundError:
+        pass
+    except ValueError as e:  # JSONDecodeError, UnicodeDecodeError
+        _set_aside_config(path, e)
+    return {"unlock_condition": {"mode": "count", "value": 1}, "blocked_apps": [], "user_points": 0, 
+            "daily_unlock_enabled": True, "last_completion_date": ""}
 
-def save_config(data, filepath="config.json"):
+def _set_aside_config(path, error):
+    """읽을 수 없는 설정 파일을 config.json.bad로 옮겨 둡니다.
+
+    기본 설정으로 시작한 뒤의 저장이, 손으로 되살릴 수 있는 깨진 파일(포인트, 기록)을 덮어쓰지 않게 합니다.
+    """
+    bad_path = f"{path}.bad"
+    if os.path.exists(bad_path):
+        bad_path = f"{path}.bad.{time.strftime('%Y%m%d-%H%M%S')}"
     try:
-        with open(resource_path(filepath), "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"설정 저장 중 오류 발생: {e}")
-def judge_single_case(user_code: str, input_data: str, time_limit: int, memory_limit_mb: int) -> dict:
-    solution_filename = "temp_solution.py"
-    with open(solution_filename, "w", encoding="utf-8") as f: f.write(user_code)
+        os.replace(path, bad_path)
+        print(f"설정 파일을 읽을 수 없어 {bad_path}로 옮기고 기본 설정으로 시작합니다: {error}")
+    except OSError as e:
+        print(f"설정 파일을 읽을 수 없고 옮기지도 못했습니다: {e}")
+    _file_cache.invalidate(path)
+
+def _config_written(path, data):
+    # 저장소가 쓴 내용을 그대로 캐시에 넣어 다음 load_config가 파일을 다시 읽지 않게 합니다.
+    # (data는 저장소만 가진 사본이라 따로 복사하지 않아도 됩니다)
+    _file_cache.put(path, data)
+
+def save_config(data, filepath="config.json"):
+    """설정 저장을 맡기고 바로 돌아옵니다. 백그라운드에서 잠깐 모았다가 원자적으로 씁니다. (config_store.py)"""
+    config_store.get_store(resource_path(filepath), on_written=_config_written).save(data)
+
+def flush_config(filepath="config.json"):
+    """맡겨 둔 설정을 바로 씁니다. 쓰기 오류는 그대로 올려 보냅니다."""
+    config_store.get_store(resource_path(filepath), on_written=_config_written).flush()
+
+def config_write_stats(filepath="config.json"):
+    """설정 저장 요청 수, 실제 쓰기 수, 쓰기 시간(ms)입니다."""
+    return config_store.get_store(resource_path(filepath), on_written=_config_written).stats()
+
+def cache_stats():
+    """파일 이름별 캐시 적중/실패 횟수입니다. 적중한 만큼 파일을 다시 읽지 않았습니다."""
+    return _file_cache.stats()
+def judge_single_case(user_code: str, input_data: str, time_limit: int, memory_limit_mb: int, cancel_event=None, workspace=None,
+                      input_path=None, output_path=None, output_limit_mb=judge_limits.OUTPUT_LIMIT_MB, argv=(),
+                      language=languages.DEFAULT_LANGUAGE) -> dict:
+    # 작업 공간을 넘겨받지 않았으면 이 케이스만을 위한 작업 공간을 만들고 끝나면 정리합니다.
+    owns_workspace = workspace is None
+    if owns_workspace:
+        workspace = JudgeWorkspace(user_code, language)
+    if workspace.compile_error:
+        if owns_workspace: workspace.cleanup()
+        return {"status": "compile_error", "stderr": workspace.compile_error}
     memory_limit_bytes = memory_limit_mb * 1024 * 1024
+    output_limit_bytes = output_limit_mb * 1024 * 1024
+    # 출력은 항상 파일로 받아서 크기를 확인하고, output_path가 없을 때만 읽어서 돌려줍니다.
+    keep_output = output_path is not None
+    if not keep_output:
+        fd, output_path = tempfile.mkstemp(suffix=".out", dir=workspace.path)
+        os.close(fd)
+    stdin_f = open(input_path, "rb") if input_path else None
+    stdout_f = open(output_path, "wb")
     try:
-        proc = subprocess.Popen(['python', solution_filename],
-                              stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        spawn_start = time.monotonic()
+        proc = subprocess.Popen(workspace.command() + list(argv), cwd=workspace.path,
+                              stdin=stdin_f or subprocess.PIPE, stdout=stdout_f, stderr=subprocess.PIPE,
                               text=True, encoding="utf-8")
+        start = time.monotonic()
         p = psutil.Process(proc.pid)
         memory_exceeded = threading.Event()
+        output_exceeded = threading.Event()
+        # rlimit이 없는 환경(Windows)용 경로라서 폴링으로 제한하고, 마지막 표본으로 사용량을 기록합니다.
+        usage = {"time_ms": 0, "memory_kb": 0, "spawn_ms": round((start - spawn_start) * 1000, 2),
+                 "input_bytes": os.fstat(stdin_f.fileno()).st_size if stdin_f else len(input_data.encode("utf-8"))}
         def monitor_memory():
             while proc.poll() is None:
                 try:
-                    if p.memory_info().rss > memory_limit_bytes:
+                    mem = p.memory_info()
+                    cpu = p.cpu_times()
+                    usage["time_ms"] = round((cpu.user + cpu.system) * 1000)
+                    usage["memory_kb"] = max(usage["memory_kb"], getattr(mem, "peak_wset", mem.rss) // 1024)
+                    if mem.rss > memory_limit_bytes:
                         memory_exceeded.set()
                         p.kill()
                         return
+                    if os.path.getsize(output_path) > output_limit_bytes:
+                        output_exceeded.set()
+                        p.kill()
+                        return
                 except psutil.NoSuchProcess: return
                 time.sleep(0.05)
         mon_thread = threading.Thread(target=monitor_memory)
         mon_thread.daemon = True
         mon_thread.start()
-        stdout, stderr = proc.communicate(input=input_data, timeout=time_limit)
+        # 취소 요청을 확인할 수 있도록 짧은 간격으로 나누어 기다립니다.
+        deadline = time.monotonic() + time_limit
+        pending_input = None if stdin_f else input_data
+        while True:
+            try:
+                _, stderr = proc.communicate(input=pending_input, timeout=min(0.05, max(deadline - time.monotonic(), 0)))
+                break
+            except subprocess.TimeoutExpired:
+                pending_input = None
+                if cancel_event is not None and cancel_event.is_set():
+                    proc.kill()
+                    proc.communicate()
+                    return {"status": "cancelled"}
+                if time.monotonic() >= deadline:
+                    raise
+        usage["wall_ms"] = round((time.monotonic() - start) * 1000)
+        usage["exit_code"] = proc.returncode
+        usage["output_bytes"] = os.path.getsize(output_path)
         if memory_exceeded.is_set():
-            return {"status": "memory_limit_exceeded"}
+            return {"status": "memory_limit_exceeded", **usage}
+        if output_exceeded.is_set() or os.path.getsize(output_path) > output_limit_bytes:
+            return {"status": "output_limit_exceeded", **usage}
         if stderr:
-            return {"status": "error", "stderr": stderr}
-        return {"status": "success", "output": stdout.strip()}
+            return {"status": "error", "stderr": stderr, **usage}
+        if keep_output:
+            return {"status": "success", "output_path": output_path, **usage}
+        with open(output_path, "r", encoding="utf-8", errors="replace") as f:
+            return {"status": "success", "output": f.read().strip(), **usage}
     except subprocess.TimeoutExpired:
         proc.kill()
-        return {"status": "timeout"}
+        proc.communicate()
+        usage["wall_ms"] = round((time.monotonic() - start) * 1000)
+        return {"status": "timeout", "limit": "wall", **usage}
     except Exception as e:
         return {"status": "error", "stderr": str(e)}
     finally:
-        if os.path.exists(solution_filename): os.remove(solution_filename)
+        stdout_f.close()
+        if stdin_f: stdin_f.close()
+        if not keep_output and os.path.exists(output_path): os.remove(output_path)
+        if owns_workspace: workspace.cleanup()
 
 # ▼▼▼ 레벨 계산 함수 새로 추가 ▼▼▼
 def calculate_user_level(solve_history, max_history=10):
@@ -114,27 +267,278 @@ def recommend_problem(all_problems, solve_history):
     return random.choice(candidates)
 
 
-def check_solution(problem, user_code):
-    # ... (이 함수는 이전과 동일)
-    time_limit = problem.get("time_limit", 5)
-    memory_limit_mb = problem.get("memory_limit", 128)
+def run_testcase(workspace, input_data: str, time_limit: int, memory_limit_mb: int, cancel_event=None, **io_options) -> dict:
+    """워커 풀을 쓸 수 있으면 풀에서, 아니면 subprocess 방식으로 작업 공간의 코드로 케이스 하나를 실행합니다.
+
+    io_options(input_path, output_path, output_limit_mb, argv)는 그대로 실행기에 전달됩니다.
+    결과의 judge_ms는 워커 대기와 결과 전달까지 포함해 이 케이스에 든 전체 시간입니다.
+    """
+    started = time.monotonic()
+    pool = judge_pool.get_default_pool()
+    if pool is None:
+        result = judge_single_case(None, input_data, time_limit, memory_limit_mb, cancel_event, workspace, **io_options)
+    else:
+        result = pool.run(workspace, input_data, time_limit, memory_limit_mb, cancel_event, **io_options)
+    # C/C++/Java는 0이 아닌 종료 코드(세그폴트 등)를 stderr가 비어 있어도 런타임 에러로 봅니다.
+    if result["status"] == "success" and result.get("exit_code") and workspace.spec["strict_exit"]:
+        result = {k: v for k, v in result.items() if k not in ("output", "output_path")}
+        result.update(status="error", stderr=languages.describe_exit(result["exit_code"]))
+    if "wall_ms" in result:
+        result["judge_ms"] = round((time.monotonic() - started) * 1000, 2)
+    return result
+
+def _case_verdict(case_num, case, result, checker, workspace):
+    """케이스 결과를 판정합니다. 통과면 None, 실패면 check_solution이 돌려줄 값을 반환합니다.
+
+    special checker가 판정하지 못하면 time_ms 없는 error(is_judge_failure)를 돌려줘 오답으로 기록되지 않게 합니다.
+    """
+    if result["status"] == "success":
+        try:
+            accepted, reason = checker.check(case, result, workspace, case_num)
+        except CheckerError as e:
+            return {"status": "error", "stderr": str(e), "case_num": case_num}
+        if accepted:
+            return None
+        expected = case["output"] if "output" in case else judge_io.preview(judge_io.testcase_path(case["output_file"]))
+        actual = result["output"] if "output" in result else judge_io.preview(result["output_path"])
+        label = f"{case_num}번 테스트 케이스" + ("(숨은 테스트)" if case.get("hidden") else "")
+        message = f"{label}에서 '오답'\n- 기대값: {expected}\n- 실제값: {actual}"
+        return message + (f"\n- 이유: {reason}" if reason else "")
+    result["case_num"] = case_num
+    return result
+
+class _AnyEvent:
+    """여러 Event 중 하나라도 set 되었으면 set으로 보이는 읽기 전용 Event입니다."""
+    def __init__(self, *events):
+        self.events = [e for e in events if e is not None]
+
+    def is_set(self):
+        return any(e.is_set() for e in self.events)
+
+def _emit(on_event, event_type, case_num, result=None, status=None):
+    """on_event 콜백으로 케이스 진행 이벤트(started/passed/failed)를 보냅니다."""
+    if on_event is None:
+        return
+    event = {"type": event_type, "case_num": case_num}
+    if status:
+        event["status"] = status
+    if result is not None:
+        for key in ("time_ms", "wall_ms", "memory_kb", "limit", "spawn_ms", "judge_ms", "input_bytes", "output_bytes", "cached"):
+            if key in result:
+                event[key] = result[key]
+    on_event(event)
+
+def _judge_case(workspace, checker, case, case_num, time_limit, memory_limit_mb, on_event, cancel_event,
+                output_limit_mb=judge_limits.OUTPUT_LIMIT_MB, submission_cache=None):
+    """케이스 하나를 실행하고 (실행 결과, 실패 판정)을 돌려줍니다. 통과하거나 취소되면 판정은 None입니다.
+
+    submission_cache에 같은 제출/케이스의 결과가 있으면 실행하지 않고 그 결과를 씁니다.
+    """
+    _emit(on_event, "started", case_num)
+    cached = submission_cache.get(case) if submission_cache is not None else None
+    if cached is not None:
+        result, verdict = cached
+        result["cached"] = True
+    else:
+        input_data, input_path = judge_io.case_input(case)
+        output_path = workspace.output_path(case_num) if "output_file" in case else None
+        result = run_testcase(workspace, input_data, time_limit, memory_limit_mb, cancel_event,
+                              input_path=input_path, output_path=output_path, output_limit_mb=output_limit_mb)
+        if result["status"] == "cancelled":
+            return result, None
+        verdict = _case_verdict(case_num, case, result, checker, workspace)
+        if submission_cache is not None and not is_judge_failure(verdict):
+            submission_cache.put(case, result, verdict)
+    if verdict is None:
+        _emit(on_event, "passed", case_num, result)
+    else:
+        _emit(on_event, "failed", case_num, result, verdict["status"] if isinstance(verdict, dict) else "wrong_answer")
+    return result, verdict
+
+def _check_parallel(problem, workspace, checker, time_limit, memory_limit_mb, parallel, on_event=None, cancel_event=None,
+                    output_limit_mb=judge_limits.OUTPUT_LIMIT_MB, submission_cache=None):
+    """테스트 케이스를 최대 parallel개씩 동시에 실행합니다.
+
+    어떤 케이스가 실패하면 그보다 번호가 큰 케이스만 취소하고, 번호가 작은 케이스는 끝까지 실행합니다.
+    따라서 결과는 항상 실패한 케이스 중 번호가 가장 작은 것으로 정해집니다.
+    """
+    cases = problem["testcases"]
+    cancel_events = [threading.Event() for _ in cases]
+    failures = {}
+    lowest_failure = [len(cases)]
+    lock = threading.Lock()
+
+    def run(i):
+        if i > lowest_failure[0] or (cancel_event is not None and cancel_event.is_set()):
+            return None
+        result, verdict = _judge_case(workspace, checker, cases[i], i + 1, time_limit, memory_limit_mb,
+                                      on_event, _AnyEvent(cancel_event, cancel_events[i]), output_limit_mb, submission_cache)
+        if result["status"] == "cancelled":
+            return None
+        if verdict is not None:
+            with lock:
+                failures[i] = verdict
+                if i < lowest_failure[0]:
+                    lowest_failure[0] = i
+                    for event in cancel_events[i + 1:]:
+                        event.set()
+        return result
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        results = [result for result in executor.map(run, range(len(cases))) if result is not None]
+    if cancel_event is not None and cancel_event.is_set():
+        return {"status": "cancelled"}, results
+    if failures:
+        return failures[min(failures)], results
+    return _accepted_message(results, time_limit, memory_limit_mb, workspace), results
+
+def _check_sequential(problem, workspace, checker, time_limit, memory_limit_mb, on_event=None, cancel_event=None,
+                      output_limit_mb=judge_limits.OUTPUT_LIMIT_MB, submission_cache=None):
+    """테스트 케이스를 순서대로 실행하다가 처음 실패한 케이스에서 멈춥니다."""
+    results = []
     for i, case in enumerate(problem["testcases"]):
-        input_data = case["input"]
-        expected_output = case["output"]
-        result = judge_single_case(user_code, input_data, time_limit, memory_limit_mb)
-        if result["status"] == "success":
-            if result["output"] != expected_output:
-                return f"{i+1}번 테스트 케이스에서 '오답'\n- 기대값: {expected_output}\n- 실제값: {result['output']}"
-        else:
-            result["case_num"] = i + 1
-            return result
-    return "정답입니다!"
+        if cancel_event is not None and cancel_event.is_set():
+            return {"status": "cancelled"}, results
+        result, verdict = _judge_case(workspace, checker, case, i + 1, time_limit, memory_limit_mb,
+                                      on_event, cancel_event, output_limit_mb, submission_cache)
+        if result["status"] == "cancelled":
+            return result, results
+        results.append(result)
+        if verdict is not None:
+            return verdict, results
+    return _accepted_message(results, time_limit, memory_limit_mb, workspace), results
 
-def load_config(filepath="config.json"):
+def summarize_results(results, workspace=None):
+    """실행한 케이스들의 측정값을 제출 하나의 요약으로 합칩니다."""
+    measured = [r for r in results if "time_ms" in r]
+    summary = {
+        "cases": len(measured),
+        "cached_cases": sum(1 for r in measured if r.get("cached")),
+        "wall_ms": sum(r.get("wall_ms", 0) for r in measured),
+        "cpu_ms": sum(r["time_ms"] for r in measured),
+        "max_time_ms": max((r["time_ms"] for r in measured), default=0),
+        "max_memory_kb": max((r["memory_kb"] for r in measured), default=0),
+        "spawn_ms": round(sum(r.get("spawn_ms", 0) for r in measured), 2),
+        "judge_ms": round(sum(r.get("judge_ms", 0) for r in measured), 2),
+        "input_bytes": sum(r.get("input_bytes", 0) for r in measured),
+        "output_bytes": sum(r.get("output_bytes", 0) for r in measured),
+    }
+    if workspace is not None:
+        summary["compile_ms"] = workspace.compile_ms
+    return summary
+
+def format_bytes(size):
+    if size < 1024:
+        return f"{size}B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f}KB"
+    return f"{size / 1024 / 1024:.1f}MB"
+
+def format_case_row(case_num, status_text, result):
+    """결과 콘솔의 케이스별 표 한 줄입니다. (번호, 결과, 실행 시간, CPU 시간, 메모리, 출력 크기)"""
+    if "time_ms" not in result:
+        return f"{case_num:>3}  {status_text}"
+    cached = " (캐시)" if result.get("cached") else ""
+    return (f"{case_num:>3}  {status_text:<6} {result.get('wall_ms', 0):>6}ms {result['time_ms']:>6}ms "
+            f"{result['memory_kb'] / 1024:>7.1f}MB {format_bytes(result.get('output_bytes', 0)):>8}{cached}")
+
+CASE_TABLE_HEADER = "  #  결과        실행      CPU      메모리     출력"
+
+def format_summary(summary):
+    """제출 요약 한 줄입니다. 채점기 자체 비용(프로세스 준비, 전체 채점 시간)도 함께 보여줍니다."""
+    return (f"케이스 {summary['cases']}개: 실행 {summary['wall_ms']}ms (CPU {summary['cpu_ms']}ms), "
+            f"최대 메모리 {summary['max_memory_kb'] / 1024:.1f}MB, 입력 {format_bytes(summary['input_bytes'])} / "
+            f"출력 {format_bytes(summary['output_bytes'])}, 프로세스 준비 {summary['spawn_ms']:.1f}ms, "
+            f"채점 {summary['judge_ms']:.1f}ms")
+
+def _compile_summary(workspace):
+    """컴파일 언어의 컴파일 시간 문구입니다. (실행 시간과 따로 보여줍니다)"""
+    if not workspace.spec["compile"]:
+        return ""
+    return "컴파일 캐시 사용" if workspace.compile_cached else f"컴파일 {workspace.compile_ms}ms"
+
+def _accepted_message(results, time_limit, memory_limit_mb, workspace=None):
+    """정답 메시지에 케이스 중 가장 큰 시간/메모리 사용량을 제한과 함께 붙입니다."""
+    measured = [r for r in results if r and "time_ms" in r]
+    if not measured:
+        return "정답입니다!"
+    max_time = max(r["time_ms"] for r in measured)
+    max_memory = max(r["memory_kb"] for r in measured)
+    usage = f"시간 {max_time}ms / {time_limit}초, 메모리 {max_memory / 1024:.1f}MB / {memory_limit_mb}MB"
+    compile_text = _compile_summary(workspace) if workspace is not None else ""
+    return f"정답입니다! ({usage}{', ' + compile_text if compile_text else ''})"
+
+def format_usage(result):
+    """실패 결과에 측정된 시간/메모리 사용량이 있으면 '(시간 ..ms, 메모리 ..MB)' 형태로 돌려줍니다."""
+    if "time_ms" not in result:
+        return ""
+    return f"(시간 {result['time_ms']}ms, 메모리 {result['memory_kb'] / 1024:.1f}MB)"
+
+def is_judge_failure(result):
+    """채점기 쪽 오류(워커/실행기 예외)인지 확인합니다. 프로그램을 실행해 측정한 결과에는 time_ms가 있습니다."""
+    return isinstance(result, dict) and result.get("status") == "error" and "time_ms" not in result
+
+def default_parallelism():
+    """동시에 실행해도 케이스끼리 CPU를 나눠 쓰지 않도록 코어 수(와 워커 풀 크기)로 제한합니다."""
+    pool = judge_pool.get_default_pool()
+    limit = os.cpu_count() or 1
+    if pool is not None:
+        limit = min(limit, pool.size)
+    return max(1, limit)
+
+_verdict_cache = None
+_verdict_cache_lock = threading.Lock()
+
+def get_verdict_cache():
+    """설정 파일 옆의 verdict_cache.json에 저장되는 공용 채점 결과 캐시입니다."""
+    global _verdict_cache
+    with _verdict_cache_lock:
+        if _verdict_cache is None:
+            _verdict_cache = VerdictCache(resource_path("verdict_cache.json"))
+    return _verdict_cache
+
+def check_solution(problem, user_code, parallel=1, on_event=None, cancel_event=None, use_cache=True,
+                   language=languages.DEFAULT_LANGUAGE):
+    """제출 코드를 채점합니다. parallel이 2 이상이면 테스트 케이스를 동시에 실행합니다.
+
+    language는 languages.LANGUAGES의 id("python", "c", "cpp", "java")입니다.
+    컴파일에 실패하면 {"status": "compile_error", "stderr": ..., "compile_ms": ...}를 반환합니다.
+    출력 비교 방식은 problem["checker"]로 정합니다. (checkers.py 참고, 기본은 공백 단위 토큰 비교)
+    on_event가 주어지면 컴파일 후 compiled 이벤트를, 케이스마다 started/passed/failed 이벤트를,
+    끝나면 케이스 측정값을 합친 summary 이벤트를 보냅니다. (실패 결과 dict에는 "summary"로도 들어갑니다)
+    cancel_event가 set 되면 실행 중인 케이스를 멈추고 {"status": "cancelled"}를 반환합니다.
+    use_cache가 참이면 같은 코드를 다시 제출했을 때 캐시된 케이스 결과를 그대로 씁니다.
+    """
+    # generator가 있는 문제는 처음 채점할 때 숨은 테스트를 만들어 공개 테스트 뒤에 붙입니다. (이후엔 디스크 캐시 사용)
+    problem = testgen.with_hidden_cases(problem)
+    time_limit = problem.get("time_limit", 5)
+    memory_limit_mb = problem.get("memory_limit", 128)
+    output_limit_mb = problem.get("output_limit", judge_limits.OUTPUT_LIMIT_MB)
+    parallel = min(parallel, default_parallelism(), len(problem["testcases"]))
+    cache = get_verdict_cache() if use_cache else None
+    submission_cache = cache.for_submission(problem, user_code, language) if cache else None
+    # 소스 저장과 컴파일은 제출당 한 번만 하고, 모든 케이스가 같은 작업 공간을 씁니다.
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        # ▼▼▼ 기본 설정에 incorrect_history 추가 ▼▼▼
-        return {"unlock_condition": {"mode": "count", "value": 1}, "blocked_apps": [], "user_points": 0, 
-                "daily_unlock_enabled": True, "last_completion_date": "", "solve_history": [], "incorrect_history": []}
+        with JudgeWorkspace(user_code, language) as workspace, OutputChecker(problem, run_testcase) as checker:
+            if on_event is not None:
+                on_event({"type": "compiled", "language": language, "compile_ms": workspace.compile_ms,
+                          "cached": workspace.compile_cached, "ok": workspace.compile_error is None})
+            if workspace.compile_error:
+                return {"status": "compile_error", "stderr": workspace.compile_error, "compile_ms": workspace.compile_ms}
+            if parallel > 1:
+                outcome, results = _check_parallel(problem, workspace, checker, time_limit, memory_limit_mb, parallel,
+                                                   on_event, cancel_event, output_limit_mb, submission_cache)
+            else:
+                outcome, results = _check_sequential(problem, workspace, checker, time_limit, memory_limit_mb,
+                                                     on_event, cancel_event, output_limit_mb, submission_cache)
+            if isinstance(outcome, dict) and outcome["status"] == "cancelled":
+                return outcome
+            summary = summarize_results(results, workspace)
+            if on_event is not None:
+                on_event({"type": "summary", **summary})
+            if isinstance(outcome, dict):
+                outcome["summary"] = summary
+            return outcome
+    finally:
+        if cache is not None:
+            cache.save()
@@ -0,0 +1,207 @@
+# verdict_cache.py (제출/테스트 케이스 해시 기반 채점 결과 캐시)
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+import judge_io
+
+MAX_ENTRIES = 5000
+MAX_BYTES = 4 * 1024 * 1024
+# 다시 실행해도 같은 결과가 나오는 판정만 캐시합니다. (벽시계 시간 초과, 취소 등은 제외)
+# 실행을 끝까지 측정한 결과(time_ms가 있는 결과)만 해당하며, 워커/실행기 예외로 생긴 error는 캐시하지 않습니다.
+CACHEABLE_STATUSES = {"success", "error", "memory_limit_exceeded", "output_limit_exceeded", "timeout"}
+# 캐시에 남길 실행 결과 항목 (출력 경로 같은 일회성 값은 버립니다)
+RESULT_KEYS = ("status", "time_ms", "wall_ms", "memory_kb", "limit", "exit_code", "input_bytes", "output_bytes")
+# 캐시할 결과의 기준이 바뀌면 올립니다. 키에 들어가므로 예전 항목은 더 이상 맞지 않고 LRU로 밀려납니다.
+# (2: 채점 워커 오류와, GUI 부모의 RSS가 섞여 잘못 나온 메모리 초과가 캐시되어 있던 항목을 버림)
+CACHE_VERSION = 2
+
+
+def _sha256(*parts):
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8") if isinstance(part, str) else part)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def normalize_source(user_code):
+    """줄바꿈 문자(CRLF / LF) 차이만 같은 코드로 봅니다.
+
+    줄 끝 공백이나 빈 줄도 여러 줄 문자열 안에서는 프로그램의 동작을 바꾸므로 그대로 둡니다.
+    """
+    return user_code.replace("\r\n", "\n")
+
+
+def _file_signature(path):
+    """큰 파일은 내용 대신 (경로, 크기, 수정 시각)으로 식별합니다."""
+    try:
+        st = os.stat(path)
+        return f"{path}:{st.st_size}:{st.st_mtime_ns}"
+    except OSError:
+        return f"{path}:missing"
+
+
+def case_hash(case):
+    parts = []
+    for key in ("input", "output"):
+        if f"{key}_file" in case:
+            parts.append(_file_signature(judge_io.testcase_path(case[f"{key}_file"])))
+        else:
+            parts.append(case.get(key, ""))
+    return _sha256(*parts)
+
+
+def problem_fingerprint(problem):
+    """테스트 케이스, 제한, 채점 방식이 바뀌면 달라지는 문제 지문입니다."""
+    checker = problem.get("checker", "")
+    parts = [json.dumps(checker, sort_keys=True, ensure_ascii=False),
+             str(problem.get("time_limit", 5)), str(problem.get("memory_limit", 128)), str(problem.get("output_limit", ""))]
+    if isinstance(checker, dict) and checker.get("script"):
+        parts.append(_file_signature(judge_io.testcase_path(checker["script"])))
+    parts.extend(case_hash(case) for case in problem["testcases"])
+    return _sha256(*parts)
+
+
+class SubmissionCache:
+    """제출 하나(언어 + 정규화된 소스 + 문제)에 대한 케이스별 캐시 조회/저장 창구입니다."""
+
+    def __init__(self, cache, problem, user_code, language="python"):
+        self.cache = cache
+        self.problem_id = str(problem.get("id", ""))
+        self.fingerprint = problem_fingerprint(problem)
+        self.source_hash = _sha256(str(CACHE_VERSION), language, normalize_source(user_code))
+        cache.sync_problem(self.problem_id, self.fingerprint)
+
+    def key(self, case):
+        return _sha256(self.source_hash, self.problem_id, self.fingerprint, case_hash(case))
+
+    def get(self, case):
+        """캐시된 (실행 결과, 판정)을 돌려줍니다. 없으면 None."""
+        value = self.cache.get(self.key(case))
+        if value is None:
+            return None
+        return dict(value["result"]), value["verdict"]
+
+    def put(self, case, result, verdict):
+        if result["status"] not in CACHEABLE_STATUSES or result.get("limit") == "wall":
+            return
+        if "time_ms" not in result:
+            # 프로그램을 실제로 실행해 측정한 결과가 아닙니다. (채점 워커 오류, 실행기 예외 등)
+            return
+        stored_result = {k: result[k] for k in RESULT_KEYS if k in result}
+        if isinstance(verdict, dict):
+            verdict = {k: v for k, v in verdict.items() if k not in ("output", "output_path")}
+        self.cache.put(self.key(case), self.problem_id, {"result": stored_result, "verdict": verdict})
+
+
+class VerdictCache:
+    """케이스별 채점 결과를 LRU로 보관하는 영구 캐시입니다.
+
+    키는 언어와 정규화된 소스, 문제 id, 문제 지문(테스트 케이스/제한/채점 방식), 케이스 내용의 해시이며,
+    문제 지문이 바뀌면 그 문제의 항목은 모두 버립니다. 항목 수/크기가 넘치면 오래 안 쓴 것부터 지웁니다.
+    """
+
+    def __init__(self, path=None, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._total_bytes = 0
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+        if path:
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        with self._lock:
+            self._fingerprints = data.get("problems", {})
+            for key, value in data.get("entries", []):
+                self._store(key, value)
+
+    def save(self):
+        """변경된 내용이 있으면 임시 파일에 쓴 뒤 교체해서 저장합니다."""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            data = {"problems": self._fingerprints, "entries": list(self._entries.items())}
+            self._dirty = False
+        # 여러 프로세스가 같은 캐시 파일을 저장해도 임시 파일이 겹치지 않도록 pid를 붙입니다.
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"채점 캐시 저장 중 오류 발생: {e}")
+
+    def _store(self, key, value):
+        size = len(json.dumps(value, ensure_ascii=False))
+        if key in self._entries:
+            self._total_bytes -= self._sizes[key]
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self._total_bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            old_key, _ = self._entries.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._dirty = True
+            self.hits += 1
+            return value
+
+    def put(self, key, problem_id, value):
+        with self._lock:
+            self._store(key, {"problem_id": problem_id, **value})
+            self._dirty = True
+
+    def sync_problem(self, problem_id, fingerprint):
+        """문제의 테스트 케이스가 바뀌었으면 그 문제의 캐시 항목을 모두 지웁니다."""
+        with self._lock:
+            if self._fingerprints.get(problem_id) == fingerprint:
+                return
+            if problem_id in self._fingerprints:
+                self._invalidate(problem_id)
+            self._fingerprints[problem_id] = fingerprint
+            self._dirty = True
+
+    def _invalidate(self, problem_id):
+        for key in [k for k, v in self._entries.items() if v["problem_id"] == problem_id]:
+            del self._entries[key]
+            self._total_bytes -= self._sizes.pop(key)
+            self.invalidations += 1
+
+    def invalidate_problem(self, problem_id):
+        with self._lock:
+            self._invalidate(str(problem_id))
+            self._fingerprints.pop(str(problem_id), None)
+            self._dirty = True
+
+    def for_submission(self, problem, user_code, language="python"):
+        return SubmissionCache(self, problem, user_code, language)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                    "entries": len(self._entries), "bytes": self._total_bytes,
+                    "evictions": self.evictions, "invalidations": self.invalidations}